@@ -0,0 +1,112 @@
+"""Deterministic data generator for the benchmarks.
+
+Fills the data file pointed to by ``KBOARD_HOME`` with boards and tasks. The
+same arguments always produce the same data, except for due dates, which are
+spread around the current day so that some tasks are overdue.
+
+Usage::
+
+    KBOARD_HOME=/tmp/kb python benchmarks/generate.py --tasks 10000
+"""
+
+import argparse
+import random
+from collections.abc import Iterator, Sequence
+from datetime import date, timedelta
+from itertools import batched
+from typing import Any
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from kboard.db.engine import get_engine
+from kboard.db.init import init_db
+from kboard.enums import Priority, Status
+from kboard.models import Board
+from kboard.task.repository import TaskRepository
+
+
+WORDS = ('deploy', 'login', 'api', 'docs', 'fix', 'refactor', 'cache',
+         'database', 'release', 'review', 'tests', 'billing', 'search',
+         'report', 'migration', 'dashboard')
+"""Vocabulary used to build task titles and tags."""
+
+
+def _tasks(rng: random.Random, tasks: int, boards: int,
+           status_mix: Sequence[float], due_ratio: float,
+           backlog_ratio: float) -> Iterator[dict[str, Any]]:
+    """Generate task column values.
+
+    :param rng: seeded random generator
+    :param tasks: number of tasks
+    :param boards: number of boards, with IDs from 1
+    :param status_mix: relative weight of every status, in order
+    :param due_ratio: fraction of tasks with a due date
+    :param backlog_ratio: fraction of tasks without a board
+    :return: iterator of task values
+    """
+    today = date.today()
+    statuses = list(Status)
+    priorities = list(Priority)
+
+    for _ in range(tasks):
+        yield {
+            'title': ' '.join(rng.choices(WORDS, k=rng.randint(2, 6))),
+            'priority': rng.choice(priorities),
+            'tag': rng.choice(WORDS),
+            'status': rng.choices(statuses, status_mix)[0],
+            'due_date': (today + timedelta(days=rng.randint(-30, 60))
+                         if rng.random() < due_ratio else None),
+            'board_id': (None if rng.random() < backlog_ratio
+                         else rng.randint(1, boards)),
+        }
+
+
+def generate(boards: int = 20, tasks: int = 1000,
+             status_mix: Sequence[float] = (4, 2, 1, 3),
+             due_ratio: float = 0.5, backlog_ratio: float = 0.1,
+             seed: int = 0) -> None:
+    """Create the schema and fill it with generated boards and tasks.
+
+    :param boards: number of boards
+    :param tasks: number of tasks
+    :param status_mix: relative weight of every status, in order
+    :param due_ratio: fraction of tasks with a due date
+    :param backlog_ratio: fraction of tasks without a board
+    :param seed: random seed
+    """
+    init_db()
+    rng = random.Random(seed)
+
+    with Session(get_engine()) as session:
+        session.execute(insert(Board),
+                        [{'name': f'Board {i}'} for i in range(1, boards + 1)])
+
+        task_repo = TaskRepository(session)
+        values = _tasks(rng, tasks, boards, status_mix, due_ratio,
+                        backlog_ratio)
+
+        for batch in batched(values, 5000):
+            task_repo.add_many(batch)
+
+        session.commit()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--boards', type=int, default=20)
+    parser.add_argument('--tasks', type=int, default=1000)
+    parser.add_argument('--status-mix', default='4,2,1,3',
+                        help='relative weight of every status, in order')
+    parser.add_argument('--due-ratio', type=float, default=0.5)
+    parser.add_argument('--backlog-ratio', type=float, default=0.1)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    generate(args.boards, args.tasks,
+             [float(w) for w in args.status_mix.split(',')],
+             args.due_ratio, args.backlog_ratio, args.seed)
+
+
+if __name__ == '__main__':
+    main()
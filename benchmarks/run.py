@@ -0,0 +1,269 @@
+"""Benchmark the hot paths of kboard at increasing data sizes.
+
+Every size runs in its own process with a fresh data file filled by
+``generate.py``, so results never depend on the order sizes are run in. The
+report is a JSON file that can be compared against an earlier one to catch
+scaling regressions.
+
+Usage::
+
+    python benchmarks/run.py --sizes 1000,10000,100000 --output new.json
+    python benchmarks/run.py --compare old.json --output new.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+from collections.abc import Callable
+from io import StringIO
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+
+ROOT = Path(__file__).resolve().parent.parent
+"""Repository root directory."""
+
+
+def _measure(func: Callable[[], Any], repeat: int,
+             reset: Callable[[], Any] | None = None) -> dict[str, float]:
+    """Time a function several times.
+
+    :param func: function to time
+    :param repeat: number of runs
+    :param reset: function run untimed after every run
+    :return: median and minimum run time in milliseconds
+    """
+    times = []
+
+    for _ in range(repeat):
+        start = perf_counter()
+        func()
+        times.append((perf_counter() - start) * 1000)
+
+        if reset:
+            reset()
+
+    return {'median_ms': round(statistics.median(times), 3),
+            'min_ms': round(min(times), 3)}
+
+
+def _first_output(args: list[str]) -> float:
+    """Run a kb command in a new process and wait for its first byte of
+    output, including interpreter start-up and imports.
+
+    :param args: command line arguments
+    :return: elapsed seconds
+    """
+    env = {**os.environ, 'KBOARD_NO_DAEMON': '1', 'COLUMNS': '160'}
+    start = perf_counter()
+
+    with subprocess.Popen([sys.executable, '-m', 'kboard.app', *args],
+                          stdout=subprocess.PIPE, env=env) as process:
+        process.stdout.read(1)
+        elapsed = perf_counter() - start
+        process.stdout.read()
+
+    return elapsed
+
+
+def run_size(size: int, boards: int, repeat: int) -> dict[str, Any]:
+    """Generate a data file and time every benchmark against it.
+
+    Must run in a process whose ``KBOARD_HOME`` points to an empty directory.
+
+    :param size: number of tasks
+    :param boards: number of boards
+    :param repeat: number of runs per benchmark
+    :return: mapping of benchmark names and timings
+    """
+    from rich.console import Console
+    from sqlalchemy import select
+    from sqlalchemy.orm import Session
+
+    from generate import generate
+    from kboard.container import Container
+    from kboard.db.engine import get_engine
+    from kboard.enums import Status
+    from kboard.models import Task
+    from kboard.task.renderer import TaskRenderer
+
+    start = perf_counter()
+    generate(boards=boards, tasks=size)
+    results = {'generate': {'median_ms': round((perf_counter() - start)
+                                               * 1000, 3)}}
+
+    output = Console(file=StringIO(), width=160)
+
+    def container() -> Container:
+        return Container(Session(get_engine()))
+
+    def board_all():
+        c = container()
+        output.print(c.renderer.to_kanban_swimlanes(c.board_repo.list_all()))
+        c.session.close()
+
+    def backlog():
+        c = container()
+        output.print(c.renderer.kanban_from_tasks(
+            'Backlog', c.task_service.get_backlog()))
+        c.session.close()
+
+    c = container()
+    task_id = c.session.execute(
+        select(Task.id).where(Task.status == Status.TO_DO,
+                              Task.board_id.is_not(None)).limit(1)
+    ).scalar_one()
+
+    def move_task():
+        c.task_service.move_tasks([(task_id, task_id)], 1)
+        c.session.commit()
+
+    def move_back():
+        c.task_service.move_tasks([(task_id, task_id)], -1)
+        c.session.commit()
+
+    def clean_completed():
+        c.board_service.clean_completed_tasks(1)
+        c.session.flush()
+
+    # Every run starts with an empty panel cache, like a new process.
+    results['board_all'] = _measure(board_all, repeat,
+                                    TaskRenderer._build_panel.cache_clear)
+    results['backlog'] = _measure(backlog, repeat,
+                                  TaskRenderer._build_panel.cache_clear)
+    results['move_task'] = _measure(move_task, repeat, move_back)
+    results['clean_completed'] = _measure(clean_completed, repeat,
+                                          c.session.rollback)
+    results['board_ls'] = _measure(
+        lambda: c.board_service.list_summaries(), repeat)
+    c.session.close()
+
+    for name, args in (('cli_board_all', ['board', 'all', '--limit', '20']),
+                       ('cli_board_ls', ['board', 'ls'])):
+        results[name] = _measure(lambda: _first_output(args), repeat)
+
+    return results
+
+
+def _worker(size: int, boards: int, repeat: int) -> dict[str, Any]:
+    """Run the benchmarks of one size in a new process with its own data
+    file.
+
+    :param size: number of tasks
+    :param boards: number of boards
+    :param repeat: number of runs per benchmark
+    :return: mapping of benchmark names and timings
+    """
+    with tempfile.TemporaryDirectory() as home:
+        env = {**os.environ, 'KBOARD_HOME': home}
+        result = subprocess.run(
+            [sys.executable, __file__, '--worker', str(size),
+             '--boards', str(boards), '--repeat', str(repeat)],
+            env=env, check=True, capture_output=True, text=True
+        )
+
+    return json.loads(result.stdout)
+
+
+def _git_commit() -> str | None:
+    """Return the current commit hash, if available.
+    """
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'],
+                              cwd=ROOT, capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(old: dict[str, Any], new: dict[str, Any],
+            threshold: float) -> list[str]:
+    """Print the ratio between two reports and list the regressions.
+
+    :param old: baseline report
+    :param new: current report
+    :param threshold: ratio above which a benchmark is a regression
+    :return: list of regressed benchmarks
+    """
+    regressions = []
+    print(f'{"size":>8}  {"benchmark":<16}{"old ms":>12}{"new ms":>12}'
+          f'{"ratio":>8}')
+
+    for size, benchmarks in new['results'].items():
+        for name, timing in benchmarks.items():
+            before = old['results'].get(size, {}).get(name)
+
+            if not before:
+                continue
+
+            ratio = timing['median_ms'] / max(before['median_ms'], 1e-6)
+            flag = ''
+
+            if ratio > threshold:
+                flag = '  REGRESSION'
+                regressions.append(f'{name}@{size}')
+
+            print(f'{size:>8}  {name:<16}{before["median_ms"]:>12.2f}'
+                  f'{timing["median_ms"]:>12.2f}{ratio:>8.2f}{flag}')
+
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', default='1000,10000,100000',
+                        help='comma separated numbers of tasks')
+    parser.add_argument('--boards', type=int, default=20)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--output', type=Path,
+                        help='file to write the JSON report to')
+    parser.add_argument('--compare', type=Path,
+                        help='earlier report to compare the results with')
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help='slowdown ratio reported as a regression')
+    parser.add_argument('--worker', type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker is not None:
+        json.dump(run_size(args.worker, args.boards, args.repeat), sys.stdout)
+        return
+
+    report = {
+        'meta': {
+            'commit': _git_commit(),
+            'python': platform.python_version(),
+            'sqlite': sqlite3.sqlite_version,
+            'platform': platform.platform(),
+            'boards': args.boards,
+            'repeat': args.repeat,
+        },
+        'results': {},
+    }
+
+    for size in (int(s) for s in args.sizes.split(',')):
+        print(f'Running {size:,} tasks...', file=sys.stderr)
+        report['results'][str(size)] = _worker(size, args.boards,
+                                               args.repeat)
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + '\n')
+    else:
+        print(json.dumps(report, indent=2))
+
+    if args.compare:
+        old = json.loads(args.compare.read_text())
+        regressions = compare(old, report, args.threshold)
+
+        if regressions:
+            sys.exit(f'Regressions: {", ".join(regressions)}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,222 @@
+"""Hammer a data file with concurrent writers and check that no update is
+lost.
+
+Worker processes repeatedly change a few shared tasks through the retrying
+transactions used by the commands, either by appending a character to the
+title of a loaded task, which is a read-modify-write protected by the task
+version, or by moving a task one step with a set-based update. Once they are
+done, the titles, statuses and versions of the tasks must account for every
+committed change, otherwise the script reports the lost updates and fails.
+
+Usage::
+
+    python benchmarks/stress.py --workers 8 --operations 500 --tasks 4
+"""
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from time import perf_counter
+from typing import Any
+
+
+TITLE = 'hot'
+"""Initial title of the shared tasks."""
+
+
+def setup(tasks: int) -> None:
+    """Create the data file and the shared tasks.
+
+    :param tasks: number of shared tasks
+    """
+    from sqlalchemy.orm import Session
+
+    from kboard.container import Container
+    from kboard.db.engine import get_engine
+    from kboard.db.init import init_db
+    from kboard.enums import Priority
+
+    init_db()
+
+    with Session(get_engine()) as session:
+        container = Container(session)
+        board = container.board_service.create_board('Stress')
+        session.flush()
+
+        for _ in range(tasks):
+            container.task_service.add_task(TITLE, Priority.NORMAL, None,
+                                            None, board.id)
+
+        session.commit()
+
+
+def work(operations: int, tasks: int, seed: int,
+         start_at: float) -> dict[str, Any]:
+    """Change random shared tasks, each change in its own transaction.
+
+    :param operations: number of changes
+    :param tasks: number of shared tasks, with IDs from 1
+    :param seed: seed of the random generator
+    :param start_at: time to start at, so that all workers run together
+    :return: counts of committed changes and attempts, net steps moved per
+        task and elapsed seconds
+    """
+    from sqlalchemy.exc import OperationalError
+    from sqlalchemy.orm import Session
+    from sqlalchemy.orm.exc import StaleDataError
+
+    from kboard.container import Container
+    from kboard.db.engine import get_engine
+    from kboard.db.retry import run_transaction
+
+    rng = random.Random(seed)
+    session = Session(get_engine())
+    container = Container(session)
+    counts = Counter()
+    steps = Counter()
+
+    def append(task_id: int) -> None:
+        counts['attempts'] += 1
+        task = container.task_service.get_task(task_id)
+        task.update(title=task.title + '+')
+
+    def move(task_id: int, step: int) -> None:
+        counts['attempts'] += 1
+        container.task_service.move_tasks([(task_id, task_id)], step)
+
+    time.sleep(max(start_at - time.time(), 0))
+    start = perf_counter()
+
+    for _ in range(operations):
+        task_id = rng.randint(1, tasks)
+        step = rng.choice((-1, 1))
+
+        try:
+            if rng.random() < 0.5:
+                run_transaction(session, lambda: append(task_id))
+                counts['appends'] += 1
+            else:
+                run_transaction(session, lambda: move(task_id, step))
+                counts['moves'] += 1
+                steps[task_id] += step
+        except ValueError:
+            session.rollback()
+            counts['out_of_bounds'] += 1
+        except (OperationalError, StaleDataError):
+            session.rollback()
+            counts['gave_up'] += 1
+
+    elapsed = perf_counter() - start
+    session.close()
+
+    return {'counts': counts, 'steps': steps, 'seconds': elapsed}
+
+
+def check(results: list[dict[str, Any]]) -> list[str]:
+    """Compare the shared tasks with the changes committed by the workers.
+
+    :param results: results of every worker
+    :return: list of inconsistencies, empty when no update was lost
+    """
+    from sqlalchemy import select
+    from sqlalchemy.orm import Session
+
+    from kboard.db.engine import get_engine
+    from kboard.enums import Status
+    from kboard.models import Task
+
+    appends = sum(r['counts'].get('appends', 0) for r in results)
+    moves = sum(r['counts'].get('moves', 0) for r in results)
+    steps = Counter()
+    for result in results:
+        steps.update({int(k): v for k, v in result['steps'].items()})
+
+    with Session(get_engine()) as session:
+        rows = session.execute(
+            select(Task.id, Task.title, Task.status, Task.version)
+        ).all()
+
+    errors = []
+    titles = sum(len(title) - len(TITLE) for _, title, _, _ in rows)
+    versions = sum(version - 1 for _, _, _, version in rows)
+
+    if titles != appends:
+        errors.append(f'{appends} appends committed, {titles} in the titles')
+    if versions != appends + moves:
+        errors.append(f'{appends + moves} changes committed, {versions} in '
+                      'the versions')
+
+    for task_id, _, status, _ in rows:
+        if status != Status(Status.TO_DO + steps[task_id]):
+            errors.append(f'task {task_id} is {status.name}, expected '
+                          f'{Status(Status.TO_DO + steps[task_id]).name}')
+
+    return errors
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--workers', type=int, default=8)
+    parser.add_argument('--operations', type=int, default=500,
+                        help='number of changes per worker')
+    parser.add_argument('--tasks', type=int, default=4,
+                        help='number of tasks shared by the workers')
+    parser.add_argument('--worker', type=int, help=argparse.SUPPRESS)
+    parser.add_argument('--start-at', type=float, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker is not None:
+        json.dump(work(args.operations, args.tasks, args.worker,
+                       args.start_at), sys.stdout)
+        return
+
+    with tempfile.TemporaryDirectory() as home:
+        os.environ['KBOARD_HOME'] = home
+        setup(args.tasks)
+
+        start_at = time.time() + 1
+        processes = [
+            subprocess.Popen(
+                [sys.executable, __file__, '--worker', str(seed),
+                 '--operations', str(args.operations),
+                 '--tasks', str(args.tasks), '--start-at', str(start_at)],
+                stdout=subprocess.PIPE, text=True
+            )
+            for seed in range(args.workers)
+        ]
+        results = [json.loads(p.communicate()[0]) for p in processes]
+
+        if any(p.returncode for p in processes):
+            sys.exit('A worker failed.')
+
+        errors = check(results)
+
+    totals = Counter()
+    for result in results:
+        totals.update(result['counts'])
+
+    committed = totals['appends'] + totals['moves']
+    elapsed = max(r['seconds'] for r in results)
+
+    print(f'{args.workers} workers, {args.tasks} shared task(s), '
+          f'{args.workers * args.operations:,} operations')
+    print(f'Committed {committed:,} change(s) in {elapsed:.2f}s '
+          f'({committed / elapsed:,.0f} changes/s)')
+    print(f'Attempts: {totals["attempts"]:,}, rejected moves: '
+          f'{totals["out_of_bounds"]:,}, '
+          f'given up after retries: {totals["gave_up"]:,}')
+
+    if errors:
+        sys.exit('Lost updates:\n' + '\n'.join(errors))
+
+    print('No lost updates.')
+
+
+if __name__ == '__main__':
+    main()
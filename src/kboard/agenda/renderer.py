@@ -0,0 +1,87 @@
+"""This module exports the renderer class for the agenda.
+"""
+
+from collections.abc import Mapping, Sequence
+
+from rich import box
+from rich.console import Group
+from rich.table import Table
+from rich.text import Text
+from sqlalchemy import Row
+
+from ..enums import DueBucket, Priority
+from ..settings import STATUS_COLOURS, STATUS_NAMES
+
+
+class AgendaRenderer:
+    """Class responsible for defining how the agenda should be displayed.
+    """
+
+    BUCKETS: dict[DueBucket, tuple[str, str]] = {
+        DueBucket.OVERDUE: ('Overdue', 'red'),
+        DueBucket.TODAY: ('Due today', 'yellow'),
+        DueBucket.THIS_WEEK: ('Due this week', 'default'),
+    }
+    """Title and colour of every bucket, matching the due dates of panels."""
+
+    @staticmethod
+    def _build_title(task: Row) -> Text:
+        """Format a task title like in task panels.
+
+        :param task: task row
+        :return: rich text
+        """
+        text = Text(task.title)
+
+        if task.priority == Priority.LOW:
+            text.stylize('bright_black')
+        elif task.priority == Priority.HIGH:
+            text = Text.assemble(('[!] ', 'yellow'), text)
+
+        return text
+
+    @classmethod
+    def to_table(cls, bucket: DueBucket, tasks: Sequence[Row],
+                 total: int) -> Table:
+        """Return a rich table listing the tasks of an agenda bucket.
+
+        :param bucket: agenda bucket
+        :param tasks: task rows with their board name
+        :param total: number of tasks in the bucket
+        :return: rich table
+        """
+        name, colour = cls.BUCKETS[bucket]
+        hidden = total - len(tasks)
+        table = Table(title=f'[{colour}]{name}[/] ({total})', box=box.DOUBLE,
+                      expand=True,
+                      caption=f'{hidden} more task(s).' if hidden else None)
+        table.add_column('Due')
+        table.add_column('ID', justify='right')
+        table.add_column('Title', ratio=1)
+        table.add_column('Tag', style='cyan')
+        table.add_column('Status')
+        table.add_column('Board')
+
+        for task in tasks:
+            board = (f'[{task.board_id}] {task.board_name}'
+                     if task.board_id is not None else 'Backlog')
+            table.add_row(
+                f'[{colour}]{task.due_date}[/]', str(task.id),
+                cls._build_title(task), Text(task.tag),
+                f'[{STATUS_COLOURS[task.status]}]'
+                f'{STATUS_NAMES[task.status]}[/]',
+                Text(board)
+            )
+
+        return table
+
+    @classmethod
+    def to_group(cls, agenda: Mapping[DueBucket, tuple[Sequence[Row], int]]
+                 ) -> Group:
+        """Return the tables of every agenda bucket, one below the other.
+
+        :param agenda: mapping of buckets, their task rows and task count
+        :return: rich group
+        """
+        return Group(*(cls.to_table(bucket, tasks, total)
+                       for bucket, (tasks, total) in agenda.items()))
@@ -0,0 +1,77 @@
+"""This module defines the repository class to read open tasks by due date.
+"""
+
+from collections.abc import Sequence
+from datetime import date
+
+from sqlalchemy import ColumnElement, Row, func, select
+from sqlalchemy.orm import Session
+
+from ..enums import Status
+from ..models import Board, Task
+from ..task.repository import TaskRepository
+
+
+class AgendaRepository:
+    """Repository responsible for reading open tasks in ranges of due dates,
+    across all boards and the backlog.
+
+    Every query repeats the conditions of the partial index on the due date
+    and status of open tasks, so SQLite only reads that index and never
+    visits completed or undated tasks.
+    """
+
+    def __init__(self, session: Session):
+        """Initialise the repository with a database session.
+
+        :param session: SQLAlchemy session
+        """
+        self.session = session
+
+    @staticmethod
+    def _due_between(first: date | None,
+                     last: date) -> list[ColumnElement[bool]]:
+        """Build the conditions to select the open tasks due in a range.
+
+        :param first: first due date, None for no lower bound
+        :param last: last due date
+        :return: list of SQL conditions
+        """
+        conditions = [Task.due_date.is_not(None),
+                      Task.status != Status.COMPLETED,
+                      Task.due_date <= last]
+
+        if first is not None:
+            conditions.append(Task.due_date >= first)
+
+        return conditions
+
+    def list_due(self, first: date | None, last: date,
+                 limit: int | None = None) -> Sequence[Row]:
+        """Return the open tasks due in a range, with their board name.
+
+        :param first: first due date, None for no lower bound
+        :param last: last due date
+        :param limit: maximum number of tasks, None for no limit
+        :return: task rows with a board_name column, by due date and ID
+        """
+        return self.session.execute(
+            select(*TaskRepository._columns(),
+                   Board.name.label('board_name'))
+            .outerjoin(Board, Task.board_id == Board.id)
+            .where(*self._due_between(first, last))
+            .order_by(Task.due_date, Task.id)
+            .limit(limit)
+        ).all()
+
+    def count_due(self, first: date | None, last: date) -> int:
+        """Count the open tasks due in a range.
+
+        :param first: first due date, None for no lower bound
+        :param last: last due date
+        :return: number of tasks
+        """
+        return self.session.execute(
+            select(func.count()).select_from(Task)
+            .where(*self._due_between(first, last))
+        ).scalar_one()
@@ -0,0 +1,67 @@
+"""This module exports the service class for the agenda.
+"""
+
+from collections.abc import Sequence
+from datetime import date, timedelta
+
+from sqlalchemy import Row
+
+from .repository import AgendaRepository
+from ..enums import DueBucket
+
+
+class AgendaService:
+    """Application service responsible for listing open tasks by how soon
+    they are due.
+    """
+
+    def __init__(self, agenda_repo: AgendaRepository):
+        """Initialise the service with repositories.
+
+        :param agenda_repo: agenda repository
+        """
+        self.agenda_repo = agenda_repo
+
+    @staticmethod
+    def _ranges(today: date) -> dict[DueBucket, tuple[date | None, date]]:
+        """Return the due dates of every bucket.
+
+        Weeks end on Sunday, so on Sundays the current week has no day left
+        after today.
+
+        :param today: current day
+        :return: mapping of buckets and first and last due dates, None for
+            no lower bound
+        """
+        week_end = today + timedelta(days=6 - today.weekday())
+
+        return {
+            DueBucket.OVERDUE: (None, today - timedelta(days=1)),
+            DueBucket.TODAY: (today, today),
+            DueBucket.THIS_WEEK: (today + timedelta(days=1), week_end),
+        }
+
+    def get_agenda(self, limit: int | None = None,
+                   today: date | None = None
+                   ) -> dict[DueBucket, tuple[Sequence[Row], int]]:
+        """Return the open tasks that are overdue, due today and due later
+        this week, across all boards and the backlog.
+
+        :param limit: maximum number of tasks per bucket, None for no limit
+        :param today: current day, the system date by default
+        :return: mapping of buckets and their task rows, by due date, along
+            with the number of tasks in the bucket
+        """
+        agenda = {}
+
+        for bucket, (first, last) in self._ranges(
+                today or date.today()).items():
+            tasks = self.agenda_repo.list_due(first, last, limit)
+            total = len(tasks)
+
+            if limit is not None and total == limit:
+                total = self.agenda_repo.count_due(first, last)
+
+            agenda[bucket] = tasks, total
+
+        return agenda
@@ -0,0 +1,207 @@
+"""Asynchronous facade over the application services.
+
+SQLite has no asynchronous driver in the project dependencies, so the
+blocking services run on a dedicated thread pool instead of the event loop.
+Every operation gets its own session and transaction, and the number of
+operations running at once is bounded, so any number of concurrent callers
+only ever hold a fixed number of threads and database connections.
+
+Example::
+
+    async with AsyncKboard() as kb:
+        task = await kb.add_task('Deploy', board_id=1)
+        await kb.move_tasks([task.id])
+
+Returned objects are detached from their session: loaded attributes can be
+read, but relationships that were not loaded by the operation cannot.
+"""
+
+import asyncio
+from collections.abc import Callable, Collection, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Self, TypeVar
+
+from sqlalchemy import Engine
+from sqlalchemy.orm import Session
+
+from .container import Container
+from .db.engine import get_engine
+from .db.retry import retrying
+from .enums import Priority
+from .models import Board, Task
+from .task.filter import merge_ranges
+
+T = TypeVar('T')
+
+
+class AsyncKboard:
+    """Run board and task use cases without blocking the event loop.
+    """
+
+    def __init__(self, max_concurrency: int = 4, engine: Engine | None = None):
+        """Initialise the facade and its thread pool.
+
+        :param max_concurrency: maximum number of operations running at once,
+            each one using a thread and a database connection
+        :param engine: database engine, the application one by default
+        """
+        self.engine = engine or get_engine()
+        self._executor = ThreadPoolExecutor(max_concurrency,
+                                            thread_name_prefix='kboard')
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Wait for the running operations and release the thread pool.
+        """
+        self._executor.shutdown()
+
+    @retrying
+    def _call(self, operation: Callable[[Container], T], commit: bool) -> T:
+        """Run an operation in a new session, from a worker thread.
+
+        The operation runs again in a new session if it failed because of a
+        concurrent writer.
+
+        :param operation: function receiving the DI container
+        :param commit: whether to commit the transaction afterwards
+        :return: operation result
+        """
+        with Session(self.engine, expire_on_commit=False) as session:
+            result = operation(Container(session))
+
+            if commit:
+                session.commit()
+
+            return result
+
+    async def run(self, operation: Callable[[Container], T], *,
+                  commit: bool = False) -> T:
+        """Run an operation on the thread pool in its own session.
+
+        The transaction is rolled back if the operation raises an exception.
+
+        :param operation: function receiving the DI container
+        :param commit: whether to commit the transaction afterwards
+        :return: operation result
+        """
+        async with self._semaphore:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._executor, self._call, operation, commit)
+
+    async def list_boards(self) -> Sequence[Board]:
+        """Return all the boards with their tasks.
+
+        :return: list of boards
+        """
+        return await self.run(lambda c: c.board_service.list_boards())
+
+    async def create_board(self, name: str) -> Board:
+        """Create a new board.
+
+        :param name: board name
+        :return: board object
+        """
+        return await self.run(lambda c: c.board_service.create_board(name),
+                              commit=True)
+
+    async def rename_board(self, board_id: int, name: str) -> Board:
+        """Rename a board.
+
+        :param board_id: board ID to search
+        :param name: new name
+        :raises BoardNotFoundError: if the ID does not exist
+        :return: board object
+        """
+        return await self.run(
+            lambda c: c.board_service.rename_board(board_id, name),
+            commit=True)
+
+    async def delete_board(self, board_id: int) -> Board:
+        """Delete a board.
+
+        :param board_id: board ID to search
+        :raises BoardNotFoundError: if the ID does not exist
+        :return: board object
+        """
+        return await self.run(
+            lambda c: c.board_service.delete_board(board_id), commit=True)
+
+    async def get_task(self, task_id: int) -> Task:
+        """Get a task by ID.
+
+        :param task_id: task ID to search
+        :raises TaskNotFoundError: if the ID does not exist
+        :return: task object
+        """
+        return await self.run(lambda c: c.task_service.get_task(task_id))
+
+    async def add_task(self, title: str,
+                       priority: Priority = Priority.NORMAL,
+                       tag: str | None = None,
+                       due_date: datetime | None = None,
+                       board_id: int | None = None) -> Task:
+        """Create a new task.
+
+        :param title: task title
+        :param priority: task priority
+        :param tag: task tag
+        :param due_date: task due date
+        :param board_id: assigned board ID
+        :raises BoardNotFoundError: if the board ID does not exist
+        :return: task object
+        """
+        return await self.run(
+            lambda c: c.task_service.add_task(title, priority, tag, due_date,
+                                              board_id),
+            commit=True)
+
+    async def edit_tasks(self, task_ids: Collection[int],
+                         title: str | None = None,
+                         priority: Priority | None = None,
+                         tag: str | None = None,
+                         due_date: datetime | None = None,
+                         board_id: int | None = None) -> None:
+        """Edit the attributes of one or more tasks.
+
+        :param task_ids: task IDs to search
+        :param title: new title
+        :param priority: new priority
+        :param tag: new tag
+        :param due_date: new due date
+        :param board_id: new board ID, None to omit, -1 to unassign
+        :raises TaskNotFoundError: if any of the task IDs does not exist
+        :raises BoardNotFoundError: if the board ID does not exist
+        """
+        await self.run(
+            lambda c: c.task_service.edit_tasks(
+                merge_ranges((i, i) for i in task_ids), title, priority, tag,
+                due_date, board_id),
+            commit=True)
+
+    async def move_tasks(self, task_ids: Collection[int],
+                         steps: int = 1) -> None:
+        """Move one or more tasks by a number of status steps.
+
+        :param task_ids: task IDs to search
+        :param steps: number of steps, negative to move backwards
+        :raises TaskNotFoundError: if any of the task IDs does not exist
+        :raises ValueError: if the amount of steps result in an invalid status
+        """
+        await self.run(lambda c: c.task_service.move_tasks(
+            merge_ranges((i, i) for i in task_ids), steps), commit=True)
+
+    async def delete_tasks(self, task_ids: Collection[int]) -> None:
+        """Delete one or more tasks.
+
+        :param task_ids: task IDs to search
+        :raises TaskNotFoundError: if any of the task IDs does not exist
+        """
+        await self.run(lambda c: c.task_service.delete_tasks(
+            merge_ranges((i, i) for i in task_ids)), commit=True)
@@ -1,18 +1,100 @@
 """Application CLI entry point.
 """
 
+from importlib import import_module
+from pathlib import Path
+from typing import Annotated
+
+import click
 import typer
+from typer.core import TyperGroup
+
+from . import profiling
+from .commands import use_workspace
+from .settings import TRACE_PATH, WORKSPACE, workspace_path
+
+
+class LazyGroup(TyperGroup):
+    """Command group that imports the command modules on demand.
+
+    Only the module of the invoked command is imported, so running a single
+    command does not pay for loading the dependencies of every other one.
+    """
 
-from .commands import backlog, board, configure, task
+    COMMANDS: dict[str, str] = {
+        'configure': 'configure',
+        'backlog': 'backlog',
+        'board': 'board',
+        'task': 'task',
+        'archive': 'archive',
+        'report': 'report',
+        'agenda': 'agenda',
+        'shell': 'shell',
+        'daemon': 'daemon',
+    }
+    """Mapping of command names and their module inside ``kboard.commands``."""
 
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return list(self.COMMANDS)
 
-app = typer.Typer(no_args_is_help=True,
+    def get_command(self, ctx: click.Context,
+                    cmd_name: str) -> click.Command | None:
+        if cmd_name not in self.commands and cmd_name in self.COMMANDS:
+            module = import_module(f'.commands.{self.COMMANDS[cmd_name]}',
+                                   __package__)
+            self.add_command(typer.main.get_command(module.app), cmd_name)
+
+        return super().get_command(ctx, cmd_name)
+
+
+app = typer.Typer(cls=LazyGroup, no_args_is_help=True,
                   context_settings={'help_option_names': ['-h', '--help']})
 
-app.add_typer(configure.app)
-app.add_typer(backlog.app)
-app.add_typer(board.app)
-app.add_typer(task.app)
+
+def _select_workspace(name: str) -> str:
+    """Use the workspace given on the command line.
+
+    :param name: workspace name
+    :raises typer.BadParameter: if the name is invalid
+    :return: workspace name
+    """
+    try:
+        workspace_path(name)
+    except ValueError as e:
+        raise typer.BadParameter(str(e))
+
+    use_workspace(name)
+
+    return name
+
+
+@app.callback()
+def main(ctx: typer.Context,
+         profile: Annotated[bool, typer.Option(
+             '--profile',
+             help='Print where the command spent its time: "build" is '
+             'creating the tables, "layout" and "terminal" are printing '
+             'them.')
+         ] = False,
+         workspace: Annotated[str, typer.Option(
+             '--workspace', '-w', callback=_select_workspace,
+             help='Workspace to use, each one has its own data file.',
+             show_default='$KBOARD_WORKSPACE or "default"')] = WORKSPACE,
+         trace: Annotated[str, typer.Option(
+             '--trace', hidden=True,
+             help='File to write a JSON profile to, empty to disable it.')
+         ] = str(TRACE_PATH or '')):
+    """Console-based Kanban task manager.
+    """
+    trace_path = Path(trace) if trace else None
+
+    if not profile and trace_path is None:
+        return
+
+    from .console import console
+
+    profiling.start().watch_console(console)
+    ctx.call_on_close(lambda: profiling.finish(profile, trace_path))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,50 @@
+"""This module exports the renderer class for archived tasks.
+"""
+
+from collections.abc import Sequence
+
+from rich import box
+from rich.table import Table
+from rich.text import Text
+
+from ..settings import STATUS_COLOURS, STATUS_NAMES
+from ..models import ArchivedTask
+
+
+class ArchiveRenderer:
+    """Class responsible for defining how archived tasks should be displayed.
+    """
+
+    @staticmethod
+    def to_table(tasks: Sequence[ArchivedTask], total: int,
+                 offset: int = 0) -> Table:
+        """Return a rich table listing archived tasks.
+
+        :param tasks: archived tasks to display
+        :param total: number of archived tasks matching the query
+        :param offset: number of tasks skipped before the displayed ones
+        :return: rich table
+        """
+        shown = (f'{offset + 1}-{offset + len(tasks)} of {total}'
+                 if tasks else f'0 of {total}')
+        table = Table(title=f'Archive ({shown})', box=box.DOUBLE, expand=True)
+        table.add_column('ID', justify='right')
+        table.add_column('Title', ratio=1)
+        table.add_column('Tag', style='cyan')
+        table.add_column('Status')
+        table.add_column('Board')
+        table.add_column('Due')
+        table.add_column('Completed')
+        table.add_column('Archived')
+
+        for task in tasks:
+            colour = STATUS_COLOURS[task.status]
+            table.add_row(
+                str(task.task_id), Text(task.title), Text(task.tag),
+                f'[{colour}]{STATUS_NAMES[task.status]}[/]',
+                Text(f'[{task.board_id}] {task.board_name}'),
+                str(task.due_date or ''), str(task.completed_at or ''),
+                str(task.archived_at)
+            )
+
+        return table
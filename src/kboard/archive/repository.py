@@ -0,0 +1,110 @@
+"""This module defines the repository class for the ArchivedTask model.
+"""
+
+from collections.abc import Sequence
+from datetime import date
+
+from sqlalchemy import Select, delete, func, insert, literal, select
+from sqlalchemy.orm import Session
+
+from ..enums import Status
+from ..models import ArchivedTask, Board, Task
+
+
+class ArchiveRepository:
+    """Repository responsible for persistence operations related to archived
+    tasks.
+    """
+
+    def __init__(self, session: Session):
+        """Initialise the repository with a database session.
+
+        :param session: SQLAlchemy session
+        """
+        self.session = session
+
+    def archive_completed(self, board_id: int, completed_before: date | None,
+                          archived_at: date, limit: int) -> int:
+        """Move a batch of completed tasks of a board to the archive.
+
+        The batch is copied and deleted with one statement each, using the
+        board and status index to find it.
+
+        :param board_id: board ID to archive
+        :param completed_before: only archive tasks completed on or before
+            this date, None for all completed tasks
+        :param archived_at: archive date
+        :param limit: maximum number of tasks moved
+        :return: number of tasks moved
+        """
+        query = select(Task.id).where(Task.board_id == board_id,
+                                      Task.status == Status.COMPLETED)
+
+        if completed_before is not None:
+            query = query.where(Task.completed_at <= completed_before)
+
+        task_ids = self.session.execute(
+            query.order_by(Task.id).limit(limit)
+        ).scalars().all()
+
+        if not task_ids:
+            return 0
+
+        self.session.execute(insert(ArchivedTask).from_select(
+            ['task_id', 'title', 'priority', 'tag', 'status', 'due_date',
+             'board_id', 'board_name', 'completed_at', 'archived_at'],
+            select(Task.id, Task.title, Task.priority, Task.tag, Task.status,
+                   Task.due_date, Task.board_id, Board.name,
+                   Task.completed_at, literal(archived_at))
+            .join(Board, Board.id == Task.board_id)
+            .where(Task.id.in_(task_ids))
+            .order_by(Task.id)
+        ))
+        self.session.execute(delete(Task).where(Task.id.in_(task_ids)))
+
+        return len(task_ids)
+
+    @staticmethod
+    def _matching(query: Select, board_id: int | None,
+                  tag: str | None) -> Select:
+        """Restrict a query on archived tasks to some board and tag.
+
+        :param query: select statement
+        :param board_id: board ID, None for any
+        :param tag: exact task tag, None for any
+        :return: filtered select statement
+        """
+        if board_id is not None:
+            query = query.where(ArchivedTask.board_id == board_id)
+        if tag is not None:
+            query = query.where(ArchivedTask.tag == tag)
+
+        return query
+
+    def list_page(self, board_id: int | None, tag: str | None, limit: int,
+                  offset: int = 0) -> Sequence[ArchivedTask]:
+        """Return a page of archived tasks, most recently archived first.
+
+        :param board_id: only return the tasks of this board, None for all
+        :param tag: only return the tasks with this tag, None for all
+        :param limit: maximum number of tasks
+        :param offset: number of tasks to skip
+        :return: list of archived tasks
+        """
+        query = self._matching(select(ArchivedTask), board_id, tag)
+
+        return self.session.execute(
+            query.order_by(ArchivedTask.id.desc()).limit(limit).offset(offset)
+        ).scalars().all()
+
+    def count(self, board_id: int | None, tag: str | None) -> int:
+        """Count archived tasks.
+
+        :param board_id: only count the tasks of this board, None for all
+        :param tag: only count the tasks with this tag, None for all
+        :return: number of archived tasks
+        """
+        query = self._matching(select(func.count()).select_from(ArchivedTask),
+                               board_id, tag)
+
+        return self.session.execute(query).scalar_one()
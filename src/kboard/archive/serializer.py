@@ -0,0 +1,33 @@
+"""This module exports the serializer class to convert archived tasks into
+plain records.
+"""
+
+from typing import Any
+
+from ..models import ArchivedTask
+from ..task.serializer import TaskSerializer
+
+
+class ArchiveSerializer:
+    """Class responsible for converting archived tasks into plain records.
+    """
+
+    @staticmethod
+    def to_record(task: ArchivedTask) -> dict[str, Any]:
+        """Convert an archived task into a JSON-compatible record.
+
+        The record has the fields of a task record, with the ID the task had
+        before it was archived, followed by the archive fields.
+
+        :param task: archived task object
+        :return: mapping of field names and values
+        """
+        completed_at = task.completed_at
+
+        return {
+            **TaskSerializer.to_record(task),
+            'id': task.task_id,
+            'board_name': task.board_name,
+            'completed_at': completed_at.isoformat() if completed_at else None,
+            'archived_at': task.archived_at.isoformat(),
+        }
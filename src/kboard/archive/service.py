@@ -0,0 +1,73 @@
+"""This module exports the service class for archived tasks.
+"""
+
+from collections.abc import Sequence
+from datetime import date, timedelta
+
+from .repository import ArchiveRepository
+from ..board.repository import BoardRepository
+from ..exceptions import BoardNotFoundError
+from ..models import ArchivedTask
+
+
+class ArchiveService:
+    """Application service responsible for archive-related use cases.
+
+    Archived tasks leave the tasks table, so boards with a long history of
+    completed work stay fast to display, and can still be queried later.
+    """
+
+    def __init__(self, archive_repo: ArchiveRepository,
+                 board_repo: BoardRepository):
+        """Initialise the service with repositories.
+
+        :param archive_repo: archive repository
+        :param board_repo: board repository
+        """
+        self.archive_repo = archive_repo
+        self.board_repo = board_repo
+
+    def archive_batch(self, board_id: int, older_than: int | None = None,
+                      batch_size: int = 500) -> int:
+        """Move a batch of the completed tasks of a board to the archive.
+
+        A whole board is archived by calling this method until it returns 0,
+        committing after each call so that every batch runs in its own short
+        transaction, which can be retried on its own.
+
+        :param board_id: board ID to archive
+        :param older_than: only archive tasks completed at least this number
+            of days ago, None for all completed tasks
+        :param batch_size: maximum number of tasks moved
+        :raises BoardNotFoundError: if the ID does not exist
+        :return: number of tasks moved
+        """
+        if not self.board_repo.get(board_id):
+            raise BoardNotFoundError
+
+        today = date.today()
+        completed_before = (today - timedelta(days=older_than)
+                            if older_than is not None else None)
+        count = self.archive_repo.archive_completed(
+            board_id, completed_before, today, batch_size)
+
+        if count:
+            self.board_repo.expire_tasks([board_id])
+
+        return count
+
+    def list_archived(self, board_id: int | None = None,
+                      tag: str | None = None, limit: int = 50,
+                      offset: int = 0) -> tuple[Sequence[ArchivedTask], int]:
+        """Return a page of archived tasks along with the number of matching
+        ones.
+
+        :param board_id: only return the tasks of this board, None for all
+        :param tag: only return the tasks with this tag, None for all
+        :param limit: maximum number of tasks
+        :param offset: number of tasks to skip
+        :return: list of archived tasks, most recent first, and total count
+        """
+        tasks = self.archive_repo.list_page(board_id, tag, limit, offset)
+
+        return tasks, self.archive_repo.count(board_id, tag)
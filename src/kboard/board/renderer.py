@@ -2,19 +2,26 @@
 """
 
 from collections import defaultdict
-from collections.abc import Sequence
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from datetime import date
 
 from rich import box
 from rich.console import Group
 from rich.table import Table
 from rich.text import Text
+from sqlalchemy import Row
 
+from .. import profiling
 from ..settings import STATUS_COLOURS, STATUS_NAMES
 from ..task.renderer import TaskRenderer
 from ..enums import Status
 from ..models import Board, Task
 
 
+Remaining = Mapping[tuple[int | None, Status], int]
+"""Number of hidden tasks by board ID (None for the backlog) and status."""
+
+
 class BoardRenderer:
     """Class responsible for defining how a board should be displayed.
     """
@@ -56,61 +63,224 @@ class BoardRenderer:
         return groups
 
     @classmethod
-    def to_kanban(cls, board: Board) -> Table:
+    def _build_columns(cls, tasks: Sequence[Task],
+                       remaining: Mapping[Status, int],
+                       today: date) -> list[Group]:
+        """Generate the content of each status column.
+
+        :param tasks: tasks to display
+        :param remaining: number of hidden tasks after the displayed ones
+        :param today: current date
+        :return: one renderable group per status
+        """
+        statuses = cls._group_tasks_by_status(tasks)
+        columns = []
+
+        for s in Status:
+            panels = [TaskRenderer.to_panel(t, today) for t in statuses[s]]
+
+            if remaining.get(s):
+                panels.append(Text(f'+{remaining[s]} more', justify='center',
+                                   style='bright_black'))
+
+            columns.append(Group(*panels))
+
+        return columns
+
+    @staticmethod
+    def _remaining_for(board_id: int | None,
+                       remaining: Remaining | None) -> dict[Status, int]:
+        """Select the hidden task counts of a single board.
+
+        :param board_id: board ID, None for the backlog
+        :param remaining: hidden task counts by board and status
+        :return: hidden task counts by status
+        """
+        if not remaining:
+            return {}
+
+        return {s: remaining.get((board_id, s), 0) for s in Status}
+
+    @classmethod
+    def to_kanban(cls, board: Board, tasks: Sequence[Task] | None = None,
+                  remaining: Remaining | None = None) -> Table:
         """Return a rich table to display a Kanban board from a board object.
 
         :param board: board object
+        :param tasks: tasks to display instead of all the board tasks
+        :param remaining: hidden task counts by board and status
         :return: rich table
         """
-        statuses = cls._group_tasks_by_status(board.tasks)
-
         table = cls._create_base_table(f'\\[{board.id}] {board.name}')
 
-        table.add_row(*[
-            Group(*(TaskRenderer.to_panel(t) for t in statuses[s]))
-            for s in Status
-        ])
+        with profiling.phase('build', f'[{board.id}] {board.name}'):
+            table.add_row(*cls._build_columns(
+                board.tasks if tasks is None else tasks,
+                cls._remaining_for(board.id, remaining), date.today()
+            ))
 
         return table
 
     @classmethod
-    def to_kanban_swimlanes(cls, boards: Sequence[Board]) -> Table:
+    def to_kanban_swimlanes(cls, boards: Sequence[Board],
+                            tasks: Sequence[Task] | None = None,
+                            remaining: Remaining | None = None) -> Table:
         """Return a rich table to display a Kanban board from multiple board
         objects.
 
         :param boards: list of board objects
+        :param tasks: tasks to display instead of all the boards tasks
+        :param remaining: hidden task counts by board and status
         :return: rich table
         """
         table = cls._create_base_table('All active work', board_column=True)
+        today = date.today()
+
+        if tasks is not None:
+            by_board = defaultdict(list)
+            for task in tasks:
+                by_board[task.board_id].append(task)
 
         for board in boards:
-            statuses = cls._group_tasks_by_status(board.tasks)
+            with profiling.phase('build', f'[{board.id}] {board.name}'):
+                table.add_row(
+                    Text(f'\n[{board.id}] {board.name}', style='cyan',
+                         no_wrap=True),
+                    *cls._build_columns(
+                        board.tasks if tasks is None else by_board[board.id],
+                        cls._remaining_for(board.id, remaining), today
+                    )
+                )
 
-            table.add_row(
-                Text(f'\n[{board.id}] {board.name}', style='cyan',
-                     no_wrap=True),
-                *[
-                    Group(*(TaskRenderer.to_panel(t) for t in statuses[s]))
-                    for s in Status
-                ]
-            )
+        return table
+
+    @classmethod
+    def iter_kanban_swimlanes(cls, boards: Sequence[Board],
+                              tasks: Iterable[Task],
+                              remaining: Remaining | None = None
+                              ) -> Iterator[Table]:
+        """Yield the rows of the multiple boards table one board at a time, as
+        separate tables with the same column widths.
+
+        Tasks are consumed as each board is rendered, so only the tasks of a
+        single board are held in memory at once.
+
+        :param boards: list of board objects, ordered by ID
+        :param tasks: tasks to display, ordered by board ID
+        :param remaining: hidden task counts by board and status
+        :return: iterator of single row tables
+        """
+        today = date.today()
+        labels = [f'[{board.id}] {board.name}' for board in boards]
+        width = max(map(len, labels), default=0)
+
+        tasks = iter(tasks)
+        pending = next(tasks, None)
+
+        for index, (board, label) in enumerate(zip(boards, labels)):
+            lane = []
+
+            while pending is not None and pending.board_id <= board.id:
+                if pending.board_id == board.id:
+                    lane.append(pending)
+                pending = next(tasks, None)
+
+            table = cls._create_base_table('All active work',
+                                           board_column=True)
+            table.columns[0].width = width
+
+            if index:
+                table.title = None
+                table.show_header = False
+
+            with profiling.phase('build', label):
+                table.add_row(
+                    Text(f'\n{label}', style='cyan', no_wrap=True),
+                    *cls._build_columns(
+                        lane, cls._remaining_for(board.id, remaining), today
+                    )
+                )
+
+            yield table
+
+    @classmethod
+    def to_workspace_swimlanes(
+        cls, boards: Sequence[Row], tasks: Iterable[Row],
+        remaining: Mapping[tuple[str, int, Status], int] | None = None
+    ) -> Table:
+        """Return a rich table to display the boards of several workspaces.
+
+        :param boards: rows of workspace name, board ID and board name
+        :param tasks: task rows with their workspace name
+        :param remaining: hidden task counts by workspace, board and status
+        :return: rich table
+        """
+        table = cls._create_base_table('All active work', board_column=True)
+        today = date.today()
+        remaining = remaining or {}
+
+        lanes = defaultdict(list)
+        for task in tasks:
+            lanes[task.workspace, task.board_id].append(task)
+
+        for workspace, board_id, name in boards:
+            label = f'[{board_id}] {name}'
+
+            with profiling.phase('build', f'{workspace}: {label}'):
+                table.add_row(
+                    Text.assemble('\n', (workspace, 'bright_black'),
+                                  (f'\n{label}', 'cyan'),
+                                  no_wrap=True),
+                    *cls._build_columns(
+                        lanes[workspace, board_id],
+                        {s: remaining.get((workspace, board_id, s), 0)
+                         for s in Status}, today
+                    )
+                )
 
         return table
 
     @classmethod
-    def kanban_from_tasks(cls, title: str, tasks: Sequence['Task']) -> Table:
+    def kanban_from_tasks(cls, title: str, tasks: Sequence['Task'],
+                          remaining: Remaining | None = None) -> Table:
         """Generate a rich table to display a Kanban board from a list of tasks.
 
         :param title: table title
         :param tasks: list of tasks to include
+        :param remaining: hidden task counts by board and status
         :return: rich table
         """
         table = cls._create_base_table(title)
-        statuses = cls._group_tasks_by_status(tasks)
 
-        table.add_row(*[
-            Group(*(TaskRenderer.to_panel(t) for t in statuses[s]))
-            for s in Status
-        ])
+        with profiling.phase('build', title):
+            table.add_row(*cls._build_columns(
+                tasks, cls._remaining_for(None, remaining), date.today()
+            ))
+
+        return table
+
+    @staticmethod
+    def to_summary_table(rows: Sequence[Row]) -> Table:
+        """Return a rich table listing boards with their task counts.
+
+        :param rows: board ID, name, task count of every status and overdue
+            task count
+        :return: rich table
+        """
+        table = Table(title='Boards', box=box.DOUBLE, expand=True)
+        table.add_column('ID', justify='right')
+        table.add_column('Name', style='cyan')
+
+        for s in Status:
+            table.add_column(f'[{STATUS_COLOURS[s]}]{STATUS_NAMES[s]}[/]',
+                             justify='right')
+
+        table.add_column('[red]Overdue[/]', justify='right')
+
+        for board_id, name, *counts, overdue in rows:
+            table.add_row(
+                str(board_id), Text(name), *(str(c) for c in counts),
+                f'[red]{overdue}[/]' if overdue else '0'
+            )
 
         return table
@@ -1,12 +1,15 @@
 """This module defines the repository class for the Board model.
 """
 
-from collections.abc import Sequence
+from collections.abc import Collection, Sequence
+from datetime import date
 
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy import Row, case, delete, func, insert, select
+from sqlalchemy.orm import Session, selectinload
 
-from ..models import Board
+from ..enums import Status
+from ..models import Board, BoardDueCount, BoardTaskCount, Task
+from ..task.filter import IdRanges
 
 
 class BoardRepository:
@@ -21,12 +24,39 @@ class BoardRepository:
         """
         self.session = session
 
-    def list_all(self) -> Sequence[Board]:
+    def list_all(self, board_ids: Collection[int] | None = None, *,
+                 with_tasks: bool = True) -> Sequence[Board]:
         """Return a list of all the boards in the database.
 
+        :param board_ids: only return the boards with these IDs, None for all
+        :param with_tasks: whether to eagerly load the tasks of every board in
+            a single extra query
         :return: list of boards
         """
-        return self.session.execute(select(Board)).scalars().all()
+        query = select(Board)
+
+        if board_ids is not None:
+            query = query.where(Board.id.in_(board_ids))
+
+        if with_tasks:
+            query = query.options(selectinload(Board.tasks))
+
+        return self.session.execute(query).scalars().all()
+
+    def list_rows(self, board_ids: Collection[int] | None = None
+                  ) -> Sequence[Row]:
+        """Return the ID and name of the boards, without loading board
+        objects.
+
+        :param board_ids: only return the boards with these IDs, None for all
+        :return: list of board rows ordered by ID
+        """
+        query = select(Board.id, Board.name)
+
+        if board_ids is not None:
+            query = query.where(Board.id.in_(board_ids))
+
+        return self.session.execute(query.order_by(Board.id)).all()
 
     def get(self, board_id: int) -> Board | None:
         """Retrieve a board object by its ID if it exists.
@@ -36,6 +66,98 @@ class BoardRepository:
         """
         return self.session.get(Board, board_id)
 
+    def get_with_tasks(self, board_id: int) -> Board | None:
+        """Retrieve a board object by its ID with its tasks eagerly loaded.
+
+        :param board_id: id to search
+        :return: board object or None
+        """
+        return self.session.get(Board, board_id,
+                                options=[selectinload(Board.tasks)])
+
+    def existing_ids(self, board_ids: Collection[int]) -> set[int]:
+        """Return which of the given board IDs exist, in a single query.
+
+        :param board_ids: ids to search
+        :return: set of existing ids
+        """
+        if not board_ids:
+            return set()
+
+        return set(self.session.execute(
+            select(Board.id).where(Board.id.in_(board_ids))
+        ).scalars())
+
+    def list_summaries(self, today: date) -> Sequence[Row]:
+        """Return every board with its task counts, read from the summary
+        tables only.
+
+        :param today: current date, tasks due before it are overdue
+        :return: rows with the board ID and name, the number of tasks of
+            every status in order, and the number of overdue tasks
+        """
+        counts = [
+            func.coalesce(func.sum(case(
+                (BoardTaskCount.status == status, BoardTaskCount.count),
+                else_=0
+            )), 0).label(status.name.lower())
+            for status in Status
+        ]
+        overdue = (
+            select(func.coalesce(func.sum(BoardDueCount.count), 0))
+            .where(BoardDueCount.board_id == Board.id,
+                   BoardDueCount.due_date < today)
+            .scalar_subquery()
+            .label('overdue')
+        )
+
+        return self.session.execute(
+            select(Board.id, Board.name, *counts, overdue)
+            .outerjoin(BoardTaskCount, BoardTaskCount.board_id == Board.id)
+            .group_by(Board.id)
+            .order_by(Board.id)
+        ).all()
+
+    def rebuild_summaries(self) -> None:
+        """Recompute the summary tables from the tasks of existing boards.
+        """
+        on_board = Task.board_id.in_(select(Board.id))
+
+        self.session.execute(delete(BoardTaskCount))
+        self.session.execute(delete(BoardDueCount))
+
+        self.session.execute(insert(BoardTaskCount).from_select(
+            ['board_id', 'status', 'count'],
+            select(Task.board_id, Task.status, func.count())
+            .where(on_board)
+            .group_by(Task.board_id, Task.status)
+        ))
+        self.session.execute(insert(BoardDueCount).from_select(
+            ['board_id', 'due_date', 'count'],
+            select(Task.board_id, Task.due_date, func.count())
+            .where(on_board, Task.due_date.is_not(None),
+                   Task.status != Status.COMPLETED)
+            .group_by(Task.board_id, Task.due_date)
+        ))
+
+    def expire_tasks(self, board_ids: Collection[int | None],
+                     task_ranges: IdRanges = ()) -> None:
+        """Mark the loaded task lists of some boards as outdated after a
+        set-based change, so only those are reloaded on next access.
+
+        :param board_ids: boards whose tasks changed
+        :param task_ranges: inclusive ID ranges of the tasks that changed, the
+            boards they were on are affected as well
+        """
+        for obj in list(self.session.identity_map.values()):
+            if not isinstance(obj, Board) or 'tasks' not in obj.__dict__:
+                continue
+
+            if obj.id in board_ids or any(first <= t.id <= last
+                                          for t in obj.tasks
+                                          for first, last in task_ranges):
+                self.session.expire(obj, ['tasks'])
+
     def add(self, board: Board) -> None:
         """Add a new board to the session.
 
@@ -0,0 +1,53 @@
+"""This module exports the serializer class to convert boards into plain
+records.
+"""
+
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any
+
+from ..task.serializer import TaskSerializer
+
+
+class BoardSerializer:
+    """Class responsible for converting boards and their tasks into plain
+    records used by machine-readable output.
+    """
+
+    @staticmethod
+    def to_record(board: Any, tasks: Iterable[Any]) -> dict[str, Any]:
+        """Convert a board and its tasks into a JSON-compatible record.
+
+        :param board: board object or row with the board columns
+        :param tasks: task objects or rows of the board
+        :return: mapping of field names and values
+        """
+        return {
+            'id': board.id,
+            'name': board.name,
+            'tasks': [TaskSerializer.to_record(t) for t in tasks],
+        }
+
+    @classmethod
+    def iter_records(cls, boards: Sequence[Any],
+                     tasks: Iterable[Any]) -> Iterator[dict[str, Any]]:
+        """Convert multiple boards into records, one board at a time.
+
+        Tasks are consumed as each board is converted, so only the tasks of a
+        single board are held in memory at once.
+
+        :param boards: board objects or rows, ordered by ID
+        :param tasks: task objects or rows, ordered by board ID
+        :return: iterator of board records
+        """
+        tasks = iter(tasks)
+        pending = next(tasks, None)
+
+        for board in boards:
+            board_tasks = []
+
+            while pending is not None and pending.board_id <= board.id:
+                if pending.board_id == board.id:
+                    board_tasks.append(pending)
+                pending = next(tasks, None)
+
+            yield cls.to_record(board, board_tasks)
@@ -1,7 +1,10 @@
 """This module exports the service class for the Board model.
 """
 
-from collections.abc import Sequence
+from collections.abc import Collection, Sequence
+from datetime import date
+
+from sqlalchemy import Row
 
 from .repository import BoardRepository
 from ..exceptions import BoardNotFoundError
@@ -24,21 +27,50 @@ class BoardService:
         self.board_repo = board_repo
         self.task_repo = task_repo
 
-    def list_boards(self) -> Sequence[Board]:
+    def list_boards(self, board_ids: Collection[int] | None = None, *,
+                    with_tasks: bool = True) -> Sequence[Board]:
         """Return a list of existing boards.
 
+        :param board_ids: only return the boards with these IDs, None for all
+        :param with_tasks: whether to eagerly load the board tasks
         :return: list of boards.
         """
-        return self.board_repo.list_all()
+        return self.board_repo.list_all(board_ids, with_tasks=with_tasks)
+
+    def list_board_rows(self, board_ids: Collection[int] | None = None
+                        ) -> Sequence[Row]:
+        """Return the ID and name of existing boards.
+
+        :param board_ids: only return the boards with these IDs, None for all
+        :return: list of board rows ordered by ID
+        """
+        return self.board_repo.list_rows(board_ids)
+
+    def list_summaries(self) -> Sequence[Row]:
+        """Return every board with its task counts per status and its number
+        of overdue tasks.
+
+        :return: list of rows
+        """
+        return self.board_repo.list_summaries(date.today())
+
+    def rebuild_summaries(self) -> None:
+        """Recompute the board task counts from scratch.
+        """
+        self.board_repo.rebuild_summaries()
 
-    def get_board(self, board_id: int) -> Board:
+    def get_board(self, board_id: int, *, with_tasks: bool = False) -> Board:
         """Get a Board object by ID or fail if it does not exist.
 
         :param board_id: board ID to search
+        :param with_tasks: whether to eagerly load the board tasks
         :raises BoardNotFoundError: if the ID does not exist
         :return: board object
         """
-        board = self.board_repo.get(board_id)
+        if with_tasks:
+            board = self.board_repo.get_with_tasks(board_id)
+        else:
+            board = self.board_repo.get(board_id)
 
         if not board:
             raise BoardNotFoundError
@@ -87,5 +119,6 @@ class BoardService:
         """
         board = self.get_board(board_id)
         self.task_repo.delete_completed_from_board(board_id)
+        self.board_repo.expire_tasks([board_id])
 
         return board
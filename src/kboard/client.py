@@ -0,0 +1,90 @@
+"""Thin command line client that forwards commands to the kboard daemon.
+
+This module is the ``kb`` entry point. It only depends on the standard library
+so that forwarding a command to a running daemon does not pay for importing
+the CLI framework, SQLAlchemy or rich. When the daemon is not running the
+command is executed directly in this process.
+"""
+
+import json
+import os
+import shutil
+import socket
+import sys
+from typing import Any
+
+from .settings import DAEMON_ENABLED, SOCKET_PATH, TRACE_PATH, WORKSPACE
+
+
+LOCAL_COMMANDS = {'daemon', 'shell'}
+"""Commands that always run in the client process."""
+
+
+def request(payload: dict[str, Any],
+            timeout: float | None = None) -> dict[str, Any] | None:
+    """Send a request to the daemon and wait for its response.
+
+    :param payload: JSON-serialisable request
+    :param timeout: seconds to wait for the response, None to wait forever
+    :return: daemon response, or None if the daemon is not reachable
+    """
+    if not hasattr(socket, 'AF_UNIX') or not SOCKET_PATH.exists():
+        return None
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(str(SOCKET_PATH))
+            sock.sendall(json.dumps(payload).encode() + b'\n')
+
+            with sock.makefile('rb') as stream:
+                line = stream.readline()
+    except OSError:
+        return None
+
+    return json.loads(line) if line else None
+
+
+def forward(args: list[str]) -> int | None:
+    """Run a command in the daemon and write its output to this terminal.
+
+    Commands that read from stdin, open a pager, prompt for confirmation or
+    manage the daemon itself are not forwarded. The workspace and the trace
+    file selected by the environment of this process are passed on
+    explicitly, since the daemon may have been started with other ones.
+
+    :param args: command line arguments
+    :return: exit code, or None if the command must run locally
+    """
+    if (not DAEMON_ENABLED or not args or LOCAL_COMMANDS.intersection(args)
+            or '-' in args or '--pager' in args):
+        return None
+
+    response = request({
+        'args': ['--workspace', WORKSPACE, '--trace', str(TRACE_PATH or ''),
+                 *args],
+        'cwd': os.getcwd(),
+        'width': shutil.get_terminal_size().columns,
+        'colour': sys.stdout.isatty() and 'NO_COLOR' not in os.environ,
+    })
+
+    if response is None or response.get('fallback'):
+        return None
+
+    sys.stdout.write(response['output'])
+    sys.stdout.flush()
+
+    return response['code']
+
+
+def main() -> None:
+    """Application entry point.
+    """
+    code = forward(sys.argv[1:])
+
+    if code is None:
+        from .app import app
+
+        app()
+    else:
+        sys.exit(code)
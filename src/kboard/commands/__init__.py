@@ -0,0 +1,331 @@
+"""CLI command modules.
+
+Command modules are imported on demand by the application entry point, so
+their top-level imports are kept light. Database and rendering dependencies
+are only loaded once a command actually runs, through :func:`open_container`.
+"""
+
+import json
+import os
+import sys
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Annotated, Any, TypeVar
+
+import typer
+
+from .. import profiling
+from ..enums import OutputFormat, Priority, Status
+from ..settings import WORKSPACE, workspace_path
+
+if TYPE_CHECKING:
+    from rich.console import RenderableType
+    from sqlalchemy import Engine
+    from sqlalchemy.orm import Session
+
+    from ..container import Container
+
+
+T = TypeVar('T')
+
+LimitOption = Annotated[int | None, typer.Option(
+    '--limit', '-l', min=1, help='Maximum number of tasks per column.')]
+"""Option to limit the tasks displayed in each Kanban column."""
+
+OffsetOption = Annotated[int, typer.Option(
+    '--offset', '-o', min=0, help='Number of tasks to skip per column.')]
+"""Option to page through the tasks displayed in each Kanban column."""
+
+TagFilterOption = Annotated[str | None, typer.Option(
+    '--tag', '-t', help='Only show tasks with this tag.')]
+"""Option to filter the displayed tasks by tag."""
+
+PriorityFilterOption = Annotated[list[Priority] | None, typer.Option(
+    '--priority', '-p',
+    help='Only show tasks with this priority, can be repeated.')]
+"""Option to filter the displayed tasks by priority."""
+
+StatusFilterOption = Annotated[list[Status] | None, typer.Option(
+    '--status', '-s',
+    help='Only show tasks with this status, can be repeated.')]
+"""Option to filter the displayed tasks by status."""
+
+DueBeforeOption = Annotated[datetime | None, typer.Option(
+    '--due-before', formats=['%Y-%m-%d'],
+    help='Only show tasks due on or before this date.')]
+"""Option to filter the displayed tasks by latest due date."""
+
+DueAfterOption = Annotated[datetime | None, typer.Option(
+    '--due-after', formats=['%Y-%m-%d'],
+    help='Only show tasks due on or after this date.')]
+"""Option to filter the displayed tasks by earliest due date."""
+
+PagerOption = Annotated[bool, typer.Option(
+    '--pager', help='Display the output through a pager.')]
+"""Option to page through a view instead of clearing the screen."""
+
+FormatOption = Annotated[OutputFormat, typer.Option(
+    '--format', help='Output format, json and ndjson are meant for scripts.')]
+"""Option to print plain records instead of rich renderables."""
+
+
+_workspace = WORKSPACE
+"""Workspace used by the running command."""
+
+_shared_containers: 'dict[Path, Container] | None' = None
+"""Containers reused by every command, one per data file, while
+:func:`share_container` is open."""
+
+_data_stamps: dict[Path, tuple[int, ...]] = {}
+"""Stamp of every data file when the last shared command using it ended."""
+
+_checked_paths: set[Path] = set()
+"""Data files found at the latest schema version by this process."""
+
+
+def use_workspace(name: str) -> None:
+    """Select the workspace used by the following commands.
+
+    :param name: workspace name
+    """
+    global _workspace
+
+    _workspace = name
+
+
+def current_workspace() -> str:
+    """Return the workspace used by the running command.
+
+    :return: workspace name
+    """
+    return _workspace
+
+
+def _stamp(path: Path) -> tuple[int, ...]:
+    """Return a stamp of a data file and its write-ahead log that changes
+    whenever another process writes to them.
+
+    :param path: data file
+    :return: modification times and sizes of the files
+    """
+    stamp = []
+
+    for name in (path, f'{path}-wal'):
+        try:
+            stat = os.stat(name)
+        except OSError:
+            stamp += [0, 0]
+        else:
+            stamp += [stat.st_mtime_ns, stat.st_size]
+
+    return tuple(stamp)
+
+
+def _end_shared_command(session: 'Session', path: Path) -> None:
+    """End the transaction of a command run in a shared container.
+
+    The objects loaded by the command are kept for the following ones, which
+    only reload what they change. A command that left uncommitted writes
+    behind, usually because it failed, is rolled back instead, which discards
+    every loaded object.
+
+    :param session: shared database session
+    :param path: data file of the session
+    """
+    pending = session.new or session.dirty or session.deleted
+
+    if not pending and session.in_transaction():
+        dbapi_connection = session.connection().connection.dbapi_connection
+        pending = dbapi_connection.in_transaction
+
+    if pending:
+        session.rollback()
+    else:
+        session.commit()
+
+    _data_stamps[path] = _stamp(path)
+
+
+def _check_schema(engine: 'Engine', path: Path) -> None:
+    """Make sure that a data file is at the schema version expected by the
+    models, the first time the process uses it.
+
+    :param engine: database engine of the data file
+    :param path: data file
+    :raises typer.Exit: if the data file needs to be created or upgraded
+    """
+    if path in _checked_paths:
+        return
+
+    from ..common.message_renderer import MessageRenderer
+    from ..console import console
+    from ..db.migrations import LATEST_VERSION, get_version
+
+    # Connecting would create a missing data file.
+    if not path.exists():
+        version = 0
+    else:
+        with engine.connect() as conn:
+            version = get_version(conn)
+
+    if version < LATEST_VERSION:
+        console.print(MessageRenderer.error(
+            'The data file is missing or outdated, run "kb configure" to '
+            'create or upgrade it.'))
+        raise typer.Exit(1)
+
+    _checked_paths.add(path)
+
+
+@contextmanager
+def open_container() -> Iterator['Container']:
+    """Open a database session on the data file of the current workspace and
+    wire the app dependencies around it.
+
+    Sessions do not expire their objects on commit, so the view displayed
+    after a change reuses the boards and tasks already loaded and only
+    reloads the ones the change affected. Inside :func:`share_container` the
+    shared container of the data file is returned instead, and it is
+    refreshed entirely only when another process wrote to the file since the
+    previous command.
+
+    :raises typer.Exit: if the data file is not at the latest schema version
+    :return: DI container bound to a new session
+    """
+    path = workspace_path(_workspace)
+
+    with profiling.phase('imports'):
+        from sqlalchemy.orm import Session
+
+        from ..container import Container
+        from ..db.engine import get_engine
+
+        engine = get_engine(path)
+
+    profiling.watch_engine(engine)
+    _check_schema(engine, path)
+
+    if _shared_containers is None:
+        with Session(engine, expire_on_commit=False) as session:
+            yield Container(session)
+        return
+
+    if path not in _shared_containers:
+        _shared_containers[path] = Container(
+            Session(engine, expire_on_commit=False))
+
+    container = _shared_containers[path]
+
+    if _data_stamps.get(path) != _stamp(path):
+        container.session.expire_all()
+
+    try:
+        yield container
+    finally:
+        _end_shared_command(container.session, path)
+
+
+def commit_with_retry(container: 'Container',
+                      operation: Callable[['Container'], T]) -> T:
+    """Run the changes of a command and commit them.
+
+    When the data file stays locked by other writers, or when another process
+    updated a board or task the operation loaded before it was saved, the
+    transaction is rolled back and the operation runs again after a short
+    random delay. The operation must therefore load everything it changes
+    through the container it receives.
+
+    :param container: DI container of the command
+    :param operation: function making the changes
+    :raises typer.Exit: if the changes still conflict after the last attempt
+    :return: operation result
+    """
+    from sqlalchemy.exc import OperationalError
+    from sqlalchemy.orm.exc import StaleDataError
+
+    from ..common.message_renderer import MessageRenderer
+    from ..console import console
+    from ..db.retry import is_transient, run_transaction
+
+    try:
+        return run_transaction(container.session,
+                               lambda: operation(container))
+    except (OperationalError, StaleDataError) as e:
+        if not is_transient(e):
+            raise
+
+        console.print(MessageRenderer.error(
+            'Other processes kept changing the data file, nothing was '
+            'saved. Please try again.'))
+        raise typer.Exit(1)
+
+
+def print_view(renderables: Iterable['RenderableType'],
+               pager: bool = False) -> None:
+    """Display a view, either full screen or through a pager.
+
+    Renderables are printed as soon as they are produced, so views rendered
+    one part at a time start appearing immediately.
+
+    :param renderables: renderables making up the view
+    :param pager: whether to display the view through a pager
+    """
+    from ..console import console
+
+    if not pager:
+        console.clear()
+
+        for renderable in renderables:
+            console.print(renderable)
+        return
+
+    with console.pager(styles=True):
+        for renderable in renderables:
+            console.print(renderable)
+
+
+def print_records(records: Mapping[str, Any] | Iterable[Mapping[str, Any]],
+                  fmt: OutputFormat) -> None:
+    """Write plain records to stdout as JSON.
+
+    A single record is written as a JSON object. Multiple records are written
+    as a JSON array, or as one JSON object per line with the ndjson format,
+    one record at a time in both cases.
+
+    :param records: record or records to write
+    :param fmt: json or ndjson
+    """
+    out = sys.stdout
+
+    if isinstance(records, Mapping):
+        out.write(json.dumps(records) + '\n')
+    elif fmt == OutputFormat.NDJSON:
+        for record in records:
+            out.write(json.dumps(record) + '\n')
+    else:
+        out.write('[')
+        for index, record in enumerate(records):
+            out.write((', ' if index else '') + json.dumps(record))
+        out.write(']\n')
+
+
+@contextmanager
+def share_container() -> Iterator[None]:
+    """Keep the containers of the commands run inside this context open and
+    reuse them, such as the ones of an interactive shell. Each workspace gets
+    its own container on first use.
+    """
+    global _shared_containers
+
+    _shared_containers = {}
+
+    try:
+        yield
+    finally:
+        for container in _shared_containers.values():
+            container.session.close()
+
+        _shared_containers = None
+        _data_stamps.clear()
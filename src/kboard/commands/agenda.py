@@ -0,0 +1,39 @@
+"""Commands related to the agenda of due tasks.
+"""
+
+from typing import Annotated
+
+import typer
+
+from . import FormatOption, open_container, print_records
+from ..console import console
+from ..enums import OutputFormat
+
+
+app = typer.Typer()
+
+
+@app.command()
+def agenda(limit: Annotated[int, typer.Option(
+               '--limit', '-l', min=1,
+               help='Maximum number of tasks per group.')] = 20,
+           fmt: FormatOption = OutputFormat.TABLE):
+    """Display the open tasks that are overdue, due today and due later this
+    week, across all boards and the backlog.
+
+    Weeks end on Sunday. Completed tasks and tasks without a due date are
+    never shown.
+    """
+    with open_container() as container:
+        agenda = container.agenda_service.get_agenda(limit)
+
+        if fmt != OutputFormat.TABLE:
+            from ..task.serializer import TaskSerializer
+
+            return print_records(
+                ({'bucket': bucket.name, **TaskSerializer.to_record(task),
+                  'board_name': task.board_name}
+                 for bucket, (tasks, _) in agenda.items() for task in tasks),
+                fmt)
+
+        console.print(container.agenda_renderer.to_group(agenda))
@@ -0,0 +1,44 @@
+"""Commands related to archived tasks.
+"""
+
+from typing import Annotated
+
+import typer
+
+from . import FormatOption, open_container, print_records
+from ..console import console
+from ..enums import OutputFormat
+
+
+app = typer.Typer()
+
+
+@app.command()
+def archive(board_id: Annotated[int | None, typer.Option(
+                '--board', '-b', help='Only show tasks of this board.')
+            ] = None,
+            tag: Annotated[str | None, typer.Option(
+                '--tag', '-t', help='Only show tasks with this tag.')] = None,
+            limit: Annotated[int, typer.Option(
+                '--limit', '-l', min=1,
+                help='Maximum number of tasks to show.')] = 50,
+            offset: Annotated[int, typer.Option(
+                '--offset', '-o', min=0,
+                help='Number of tasks to skip.')] = 0,
+            fmt: FormatOption = OutputFormat.TABLE):
+    """Display archived tasks, most recently archived first.
+
+    Tasks are archived with "kb board archive".
+    """
+    with open_container() as container:
+        tasks, total = container.archive_service.list_archived(
+            board_id, tag, limit, offset)
+
+        if fmt != OutputFormat.TABLE:
+            from ..archive.serializer import ArchiveSerializer
+
+            return print_records(
+                (ArchiveSerializer.to_record(t) for t in tasks), fmt)
+
+        console.print(container.archive_renderer.to_table(tasks, total,
+                                                          offset))
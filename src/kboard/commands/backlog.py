@@ -1,28 +1,43 @@
 """Commands related to the Kanban tasks backlog.
 """
 
-from sqlalchemy.orm import Session
 import typer
 
-from ..board.renderer import BoardRenderer
-from ..console import console
-from ..container import Container
-from ..db.engine import engine
+from . import (DueAfterOption, DueBeforeOption, FormatOption, LimitOption,
+               OffsetOption, PagerOption, PriorityFilterOption,
+               StatusFilterOption, TagFilterOption, open_container,
+               print_records, print_view)
+from ..enums import OutputFormat
+from ..task.filter import TaskFilter
 
 
 app = typer.Typer()
 
 
 @app.command()
-def backlog():
+def backlog(limit: LimitOption = None, offset: OffsetOption = 0,
+            tag: TagFilterOption = None,
+            priority: PriorityFilterOption = None,
+            status: StatusFilterOption = None,
+            due_before: DueBeforeOption = None,
+            due_after: DueAfterOption = None,
+            pager: PagerOption = False,
+            fmt: FormatOption = OutputFormat.TABLE):
     """Display tasks from backlog.
 
-    The backlog is composed of tasks with no assigned board.
+    The backlog is composed of tasks with no assigned board. Use --limit and
+    --offset to page through long columns, and the filter options to only
+    show matching tasks.
     """
-    with Session(engine) as session:
-        container = Container(session)
+    criteria = TaskFilter(tag, priority or (), status or (), due_before,
+                          due_after)
 
-        tasks = container.task_service.get_backlog()
+    with open_container() as container:
+        if fmt != OutputFormat.TABLE:
+            return print_records(container.display_service.backlog_records(
+                limit, offset, criteria), fmt)
 
-        console.clear()
-        console.print(BoardRenderer.kanban_from_tasks('Backlog', list(tasks)))
+        renderable = container.display_service.backlog_view(limit, offset,
+                                                            criteria)
+
+        print_view([renderable], pager)
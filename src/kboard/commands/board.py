@@ -1,17 +1,21 @@
 """Commands responsible for managing boards.
 """
 
+from time import perf_counter
 from typing import Annotated
 
 import typer
-from sqlalchemy.orm import Session
 
-from ..board.renderer import BoardRenderer
+from . import (DueAfterOption, DueBeforeOption, FormatOption, LimitOption,
+               OffsetOption, PagerOption, PriorityFilterOption,
+               StatusFilterOption, TagFilterOption, commit_with_retry,
+               open_container, print_records, print_view)
 from ..common.message_renderer import MessageRenderer
 from ..console import console
-from ..container import Container
-from ..db.engine import engine
-from ..exceptions import BoardNotFoundError
+from ..enums import OutputFormat
+from ..exceptions import (BoardNotFoundError, WorkspaceNotFoundError,
+                          WorkspaceOutdatedError)
+from ..task.filter import TaskFilter
 
 
 app = typer.Typer(name='board', help='Manage boards.', no_args_is_help=True)
@@ -21,11 +25,9 @@ app = typer.Typer(name='board', help='Manage boards.', no_args_is_help=True)
 def add(name: Annotated[str, typer.Argument(help='Board name.')]):
     """Create a new board.
     """
-    with Session(engine) as session:
-        container = Container(session)
-
-        board = container.board_service.create_board(name)
-        session.commit()
+    with open_container() as container:
+        board = commit_with_retry(
+            container, lambda c: c.board_service.create_board(name))
 
         console.print(MessageRenderer.success(
             f'Created board "{board.name}".'))
@@ -36,12 +38,10 @@ def rename(id: Annotated[int, typer.Argument(help='Board ID.')],
            name: Annotated[str, typer.Argument(help='New name.')]):
     """Rename a board.
     """
-    with Session(engine) as session:
-        container = Container(session)
-
+    with open_container() as container:
         try:
-            board = container.board_service.rename_board(id, name)
-            session.commit()
+            board = commit_with_retry(
+                container, lambda c: c.board_service.rename_board(id, name))
         except BoardNotFoundError:
             return console.print(MessageRenderer.error('Board not found.'))
 
@@ -62,12 +62,10 @@ def rm(id: Annotated[int, typer.Argument(help='Board ID.')],
     if not force:
         return
 
-    with Session(engine) as session:
-        container = Container(session)
-
+    with open_container() as container:
         try:
-            board = container.board_service.delete_board(id)
-            session.commit()
+            board = commit_with_retry(
+                container, lambda c: c.board_service.delete_board(id))
         except BoardNotFoundError:
             return console.print(MessageRenderer.error('Board not found.'))
 
@@ -76,35 +74,162 @@ def rm(id: Annotated[int, typer.Argument(help='Board ID.')],
 
 
 @app.command()
-def all():
-    """Display all boards in a single table.
+def ls():
+    """List boards with their number of tasks per status and overdue tasks.
+
+    Counts are read from summary tables, run "kb board recount" if they ever
+    look wrong.
     """
-    with Session(engine) as session:
-        container = Container(session)
+    with open_container() as container:
+        rows = container.board_service.list_summaries()
 
-        container.config_service.set_last_view_all()
-        boards = container.board_service.list_boards()
+        console.print(container.renderer.to_summary_table(rows))
 
-        console.clear()
-        console.print(BoardRenderer.to_kanban_swimlanes(boards))
+
+@app.command()
+def recount():
+    """Rebuild the task counts displayed by "kb board ls".
+    """
+    with open_container() as container:
+        commit_with_retry(container,
+                          lambda c: c.board_service.rebuild_summaries())
+
+        console.print(MessageRenderer.success('Recounted board tasks.'))
+
+
+def _parse_workspaces(value: str | None) -> list[str] | None:
+    """Split a comma separated list of workspace names.
+
+    :param value: raw option value
+    :raises typer.BadParameter: if the list has no name
+    :return: workspace names, None if the option was not given
+    """
+    if value is None:
+        return None
+
+    names = [name.strip() for name in value.split(',') if name.strip()]
+
+    if not names:
+        raise typer.BadParameter('At least one workspace name is required.')
+
+    return names
+
+
+@app.command()
+def all(limit: LimitOption = None, offset: OffsetOption = 0,
+        tag: TagFilterOption = None, priority: PriorityFilterOption = None,
+        status: StatusFilterOption = None, due_before: DueBeforeOption = None,
+        due_after: DueAfterOption = None,
+        board_ids: Annotated[list[int] | None, typer.Option(
+            '--board', '-b',
+            help='Only show this board, can be repeated.')] = None,
+        stream: Annotated[bool, typer.Option(
+            '--stream', help='Print the boards one at a time.')] = False,
+        workspaces: Annotated[str | None, typer.Option(
+            '--workspaces', callback=_parse_workspaces,
+            help='Show the boards of these comma separated workspaces.')
+        ] = None,
+        pager: PagerOption = False,
+        fmt: FormatOption = OutputFormat.TABLE):
+    """Display all boards in a single table.
+
+    Use --limit and --offset to page through long columns, and the filter
+    options to only show matching tasks. With --stream every board is printed
+    as soon as its tasks are loaded, keeping memory low on large data files.
+    With --workspaces the boards of several workspaces are read at once and
+    shown together.
+    """
+    criteria = TaskFilter(tag, priority or (), status or (), due_before,
+                          due_after)
+
+    if workspaces is not None:
+        return _all_workspaces(workspaces, limit, offset, criteria, pager,
+                               fmt)
+
+    with open_container() as container:
+        if fmt != OutputFormat.TABLE:
+            return print_records(container.display_service.all_boards_records(
+                limit, offset, criteria, board_ids), fmt)
+
+        commit_with_retry(container,
+                          lambda c: c.config_service.set_last_view_all())
+
+        if stream:
+            renderables = container.display_service.iter_all_boards_view(
+                limit, offset, criteria, board_ids)
+        else:
+            renderables = [container.display_service.all_boards_view(
+                limit, offset, criteria, board_ids)]
+
+        print_view(renderables, pager)
+
+
+def _all_workspaces(workspaces: list[str], limit: int | None, offset: int,
+                    criteria: TaskFilter, pager: bool,
+                    fmt: OutputFormat) -> None:
+    """Display the boards of several workspaces in a single table.
+
+    :param workspaces: workspace names
+    :param limit: maximum number of tasks per column, None for no limit
+    :param offset: number of tasks to skip per column
+    :param criteria: filter the displayed tasks must match
+    :param pager: whether to display the view through a pager
+    :param fmt: output format
+    """
+    with open_container() as container:
+        try:
+            if fmt != OutputFormat.TABLE:
+                return print_records(
+                    container.display_service.workspaces_records(
+                        workspaces, limit, offset, criteria), fmt)
+
+            renderable = container.display_service.workspaces_view(
+                workspaces, limit, offset, criteria)
+        except WorkspaceNotFoundError as e:
+            return console.print(MessageRenderer.error(
+                f'Workspace "{e}" not found.'))
+        except WorkspaceOutdatedError as e:
+            return console.print(MessageRenderer.error(
+                f'The data file of workspace "{e}" is outdated, run '
+                f'"kb -w {e} configure" to upgrade it.'))
+        except ValueError as e:
+            return console.print(MessageRenderer.error(str(e)))
+
+        print_view([renderable], pager)
 
 
 @app.command()
-def show(id: Annotated[int, typer.Argument(help='Board ID.')]):
+def show(id: Annotated[int, typer.Argument(help='Board ID.')],
+         limit: LimitOption = None, offset: OffsetOption = 0,
+         tag: TagFilterOption = None, priority: PriorityFilterOption = None,
+         status: StatusFilterOption = None,
+         due_before: DueBeforeOption = None,
+         due_after: DueAfterOption = None,
+         pager: PagerOption = False,
+         fmt: FormatOption = OutputFormat.TABLE):
     """Display board and its tasks.
+
+    Use --limit and --offset to page through long columns, and the filter
+    options to only show matching tasks.
     """
-    with Session(engine) as session:
-        container = Container(session)
+    criteria = TaskFilter(tag, priority or (), status or (), due_before,
+                          due_after)
 
+    with open_container() as container:
         try:
-            board = container.board_service.get_board(id)
+            if fmt != OutputFormat.TABLE:
+                return print_records(container.display_service.board_record(
+                    id, limit, offset, criteria), fmt)
+
+            renderable = container.display_service.board_view(
+                id, limit, offset, criteria)
         except BoardNotFoundError:
             return console.print(MessageRenderer.error('Board not found.'))
 
-        container.config_service.set_last_view_board()
+        commit_with_retry(container,
+                          lambda c: c.config_service.set_last_view_board())
 
-        console.clear()
-        console.print(BoardRenderer.to_kanban(board))
+        print_view([renderable], pager)
 
 
 @app.command()
@@ -120,14 +245,45 @@ def clean(id: Annotated[int, typer.Argument(help='Board ID.')],
     if not force:
         return
 
-    with Session(engine) as session:
-        container = Container(session)
-
+    with open_container() as container:
         try:
-            board = container.board_service.clean_completed_tasks(id)
-            session.commit()
+            board = commit_with_retry(
+                container, lambda c: c.board_service.clean_completed_tasks(id))
         except BoardNotFoundError:
             return console.print(MessageRenderer.error('Board not found.'))
 
         console.clear()
         console.print(container.display_service.get_ui_renderable(board))
+
+
+@app.command()
+def archive(id: Annotated[int, typer.Argument(help='Board ID.')],
+            older_than: Annotated[int | None, typer.Option(
+                '--older-than', min=0,
+                help='Only archive tasks completed at least this number of '
+                'days ago.')] = None,
+            batch_size: Annotated[int, typer.Option(
+                '--batch-size', min=1,
+                help='Number of tasks moved per transaction.')] = 500):
+    """Move completed tasks from a board to the archive.
+
+    Tasks are moved in batches, each one in its own short transaction, and
+    can be listed afterwards with "kb archive".
+    """
+    archived = 0
+
+    with open_container() as container:
+        start = perf_counter()
+
+        try:
+            while count := commit_with_retry(
+                    container, lambda c: c.archive_service.archive_batch(
+                        id, older_than, batch_size)):
+                archived += count
+        except BoardNotFoundError:
+            return console.print(MessageRenderer.error('Board not found.'))
+
+        board = container.board_service.get_board(id)
+        console.print(MessageRenderer.success(
+            f'Archived {archived:,} task(s) from board "{board.name}" in '
+            f'{perf_counter() - start:.2f}s.'))
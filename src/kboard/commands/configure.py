@@ -3,9 +3,9 @@
 
 import typer
 
+from . import current_workspace
 from ..common.message_renderer import MessageRenderer
 from ..console import console
-from ..db.init import init_db
 
 
 app = typer.Typer()
@@ -14,7 +14,21 @@ app = typer.Typer()
 @app.command()
 def configure():
     """Create and initialise data file.
+
+    Existing data files are upgraded to the latest schema version. Every
+    workspace has its own data file, run "kb -w NAME configure" to create a
+    new workspace.
     """
-    init_db()
+    from ..db.init import init_db
+    from ..db.migrations import LATEST_VERSION
+    from ..settings import workspace_path
+
+    applied = init_db(workspace_path(current_workspace()))
+
+    if not applied:
+        return console.print(
+            MessageRenderer.success('Data file is already up to date.'))
 
-    console.print(MessageRenderer.success('Data file created successfully.'))
+    console.print(MessageRenderer.success(
+        f'Applied {applied} migration(s), data file is at schema version '
+        f'{LATEST_VERSION}.'))
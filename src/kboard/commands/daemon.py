@@ -0,0 +1,78 @@
+"""Commands to manage the background daemon.
+"""
+
+import subprocess
+import sys
+import time
+from typing import Annotated
+
+import typer
+
+from ..client import request
+from ..common.message_renderer import MessageRenderer
+from ..console import console
+from ..settings import SOCKET_PATH
+
+
+app = typer.Typer(name='daemon', no_args_is_help=True,
+                  help='Manage the background daemon.')
+
+
+STARTUP_TIMEOUT = 10
+"""Seconds to wait for the daemon to accept connections."""
+
+
+@app.command()
+def start(foreground: Annotated[bool, typer.Option(
+              '--foreground', help='Run in this process until stopped.'
+          )] = False):
+    """Start the daemon.
+
+    While it is running, kb commands are executed by the daemon, which keeps
+    the database connection and caches warm between commands.
+    """
+    if status := request({}, timeout=1):
+        return console.print(MessageRenderer.error(
+            f'Daemon already running (PID {status["pid"]}).'))
+
+    if foreground:
+        from ..daemon import serve
+
+        return serve()
+
+    subprocess.Popen([sys.executable, '-m', 'kboard.daemon'],
+                     stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                     stderr=subprocess.DEVNULL, start_new_session=True)
+
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+
+    while not (status := request({}, timeout=1)):
+        if time.monotonic() > deadline:
+            return console.print(
+                MessageRenderer.error('Daemon did not start in time.'))
+        time.sleep(0.05)
+
+    console.print(MessageRenderer.success(
+        f'Daemon started (PID {status["pid"]}).'))
+
+
+@app.command()
+def stop():
+    """Stop the daemon.
+    """
+    if not request({'stop': True}, timeout=5):
+        SOCKET_PATH.unlink(missing_ok=True)
+        return console.print(MessageRenderer.error('Daemon is not running.'))
+
+    console.print(MessageRenderer.success('Daemon stopped.'))
+
+
+@app.command()
+def status():
+    """Show whether the daemon is running.
+    """
+    if not (status := request({}, timeout=1)):
+        return console.print('Daemon is not running.')
+
+    console.print(f'Daemon running (PID {status["pid"]}), '
+                  f'listening on {SOCKET_PATH}.')
@@ -0,0 +1,35 @@
+"""Commands related to flow reports.
+"""
+
+from typing import Annotated
+
+import typer
+
+from . import FormatOption, open_container, print_records
+from ..console import console
+from ..enums import OutputFormat
+
+
+app = typer.Typer()
+
+
+@app.command()
+def report(days: Annotated[int, typer.Option(
+               '--days', '-d', min=1,
+               help='Number of days to report on, including today.')] = 90,
+           board_ids: Annotated[list[int] | None, typer.Option(
+               '--board', '-b',
+               help='Only report on this board, can be repeated.')] = None,
+           fmt: FormatOption = OutputFormat.TABLE):
+    """Display the throughput, cycle time and lead time of boards.
+
+    Cycle time counts the days from the moment a task left "To do" until it
+    was completed, and lead time the days since it was created.
+    """
+    with open_container() as container:
+        reports = container.report_service.flow_report(days, board_ids)
+
+        if fmt != OutputFormat.TABLE:
+            return print_records(reports, fmt)
+
+        console.print(container.report_renderer.to_table(reports, days))
@@ -0,0 +1,160 @@
+"""Interactive shell to run several commands in a single process.
+"""
+
+import shlex
+
+import click
+import typer
+
+from . import current_workspace, share_container
+from .. import profiling
+from ..common.message_renderer import MessageRenderer
+from ..console import console
+from ..settings import HISTORY_PATH
+
+try:
+    import readline
+except ImportError:
+    readline = None
+
+
+app = typer.Typer()
+
+EXIT_COMMANDS = {'exit', 'quit'}
+"""Input lines that close the shell."""
+
+
+class ShellCompleter:
+    """Readline completer for command names and options.
+    """
+
+    def __init__(self, ctx: click.Context):
+        """Initialise the completer with the root CLI context.
+
+        :param ctx: root click context
+        """
+        self.ctx = ctx
+        self.matches: list[str] = []
+
+    def _candidates(self, words: list[str]) -> list[str]:
+        """Return the possible completions after the given words.
+
+        :param words: words already typed
+        :return: list of candidates
+        """
+        command = self.ctx.command
+
+        for word in words:
+            if not isinstance(command, click.Group):
+                break
+            command = command.get_command(self.ctx, word) or command
+
+        if isinstance(command, click.Group):
+            return [c for c in command.list_commands(self.ctx)
+                    if c != 'shell'] + list(EXIT_COMMANDS)
+
+        return [opt for param in command.params
+                if isinstance(param, click.Option) for opt in param.opts]
+
+    def complete(self, text: str, state: int) -> str | None:
+        """Readline completion function.
+
+        :param text: word being completed
+        :param state: index of the match to return
+        :return: matching candidate or None
+        """
+        if state == 0:
+            line = readline.get_line_buffer()[:readline.get_begidx()]
+
+            try:
+                words = shlex.split(line)
+            except ValueError:
+                words = []
+
+            self.matches = [c for c in self._candidates(words)
+                            if c.startswith(text)]
+
+        return self.matches[state] if state < len(self.matches) else None
+
+
+def _setup_readline(ctx: click.Context) -> None:
+    """Load the shell history and enable tab completion.
+
+    :param ctx: root click context
+    """
+    try:
+        readline.read_history_file(HISTORY_PATH)
+    except OSError:
+        pass
+
+    readline.set_completer(ShellCompleter(ctx).complete)
+    readline.set_completer_delims(' \t\n')
+    readline.parse_and_bind('tab: complete')
+
+
+def _run(ctx: click.Context, args: list[str]) -> None:
+    """Invoke a CLI command inside the shell, reporting errors without
+    exiting.
+
+    :param ctx: root click context
+    :param args: command line arguments
+    """
+    try:
+        ctx.command.main(args, prog_name='kb', standalone_mode=False)
+    except click.ClickException as e:
+        e.show()
+    except click.Abort:
+        console.print()
+    except Exception as e:
+        console.print(MessageRenderer.error(f'{type(e).__name__}: {e}'))
+
+
+@app.command()
+def shell(ctx: typer.Context):
+    """Start an interactive shell to run commands without restarting kb.
+
+    Commands are typed without the "kb" prefix, e.g. "task mv 3". The
+    database connection is kept open between commands and each of them runs
+    in its own transaction. Commands use the workspace the shell was started
+    with unless they select another one. Type "exit" or press Ctrl+D to
+    leave.
+    """
+    root = ctx.find_root()
+    workspace = current_workspace()
+
+    if readline:
+        _setup_readline(root)
+
+    profiling.skip_startup()
+
+    with share_container():
+        while True:
+            try:
+                line = input('kb> ').strip()
+            except KeyboardInterrupt:
+                console.print()
+                continue
+            except EOFError:
+                console.print()
+                break
+
+            if line in EXIT_COMMANDS:
+                break
+
+            try:
+                args = shlex.split(line)
+            except ValueError as e:
+                console.print(MessageRenderer.error(str(e)))
+                continue
+
+            if not args:
+                continue
+
+            if args[0] == 'shell':
+                console.print(MessageRenderer.error('Already in a shell.'))
+                continue
+
+            _run(root, ['--workspace', workspace, *args])
+
+    if readline:
+        readline.write_history_file(HISTORY_PATH)
@@ -2,22 +2,75 @@
 """
 
 from datetime import datetime
+from itertools import batched
+from pathlib import Path
+from time import perf_counter
 from typing import Annotated
 
 import typer
-from sqlalchemy.orm import Session
 
+from . import (FormatOption, commit_with_retry, open_container,
+               print_records)
 from ..common.message_renderer import MessageRenderer
 from ..console import console
-from ..container import Container
-from ..db.engine import engine
 from ..exceptions import BoardNotFoundError, TaskNotFoundError
-from ..models import Priority
+from ..enums import FileFormat, OutputFormat, Priority
+from ..task.filter import merge_ranges
 
 
 app = typer.Typer(name='task', help='Manage tasks.', no_args_is_help=True)
 
 
+def _parse_ids(values: list[str]) -> list[tuple[int, int]]:
+    """Parse task IDs and inclusive ID ranges such as ``3-7``.
+
+    Ranges are kept as their bounds, so any range length costs the same, and
+    they may contain IDs of tasks that do not exist.
+
+    :param values: raw argument values
+    :raises typer.BadParameter: if a value is not an ID or range
+    :return: sorted ID ranges without overlaps, single IDs as ranges of one
+    """
+    ranges = []
+
+    for value in values:
+        start, sep, end = value.partition('-')
+
+        try:
+            first, last = int(start), int(end if sep else start)
+        except ValueError:
+            raise typer.BadParameter(f'"{value}" is not an ID or ID range.')
+
+        if first > last:
+            raise typer.BadParameter(f'"{value}" is an empty ID range.')
+
+        ranges.append((first, last))
+
+    return merge_ranges(ranges)
+
+
+IdsArgument = Annotated[list[str], typer.Argument(
+    help='Task IDs or ID ranges (e.g. 4 7-10).', callback=_parse_ids,
+    show_default=False)]
+"""Argument accepting multiple task IDs and ranges."""
+
+
+def _file_format(file: typer.FileText, fmt: FileFormat | None) -> FileFormat:
+    """Return the given file format or infer it from the file extension.
+
+    :param file: opened file
+    :param fmt: explicit file format
+    :return: file format, JSONL if it cannot be inferred
+    """
+    if fmt is not None:
+        return fmt
+
+    if Path(file.name).suffix.lower() == '.csv':
+        return FileFormat.CSV
+
+    return FileFormat.JSONL
+
+
 @app.command()
 def add(title: Annotated[str, typer.Argument(help='Task title.')],
         priority: Annotated[Priority, typer.Option(
@@ -27,29 +80,31 @@ def add(title: Annotated[str, typer.Argument(help='Task title.')],
         due_date: Annotated[datetime | None, typer.Option(
             '--due', '-d', help='Task due date.', formats=['%Y-%m-%d'])] = None,
         board_id: Annotated[int | None, typer.Option(
-            '--board', '-b', help='Board ID to assign to the task.')] = None):
+            '--board', '-b', help='Board ID to assign to the task.')] = None,
+        fmt: FormatOption = OutputFormat.TABLE):
     """Add a new task.
 
     The task can be preassigned to a board using the --board option.
     """
-    with Session(engine) as session:
-        container = Container(session)
-
+    with open_container() as container:
         try:
-            task = container.task_service.add_task(
-                title, priority, tag, due_date, board_id)
+            task = commit_with_retry(
+                container, lambda c: c.task_service.add_task(
+                    title, priority, tag, due_date, board_id))
         except BoardNotFoundError:
             return console.print(MessageRenderer.error('Board not found.'))
 
-        session.add(task)
-        session.commit()
+        if fmt != OutputFormat.TABLE:
+            return print_records(
+                container.display_service.task_records(
+                    [(task.id, task.id)])[0], fmt)
 
         console.clear()
         console.print(container.display_service.get_ui_renderable(task.board))
 
 
 @app.command()
-def edit(id: Annotated[int, typer.Argument(help='Task ID.')],
+def edit(ids: IdsArgument,
          title: Annotated[str | None, typer.Option(
              '--title', help='New task title.')] = None,
          priority: Annotated[Priority | None, typer.Option(
@@ -59,75 +114,187 @@ def edit(id: Annotated[int, typer.Argument(help='Task ID.')],
          due_date: Annotated[datetime | None, typer.Option(
              '--due', '-d', help='Task due date.', formats=['%Y-%m-%d'])] = None,
          board_id: Annotated[int | None, typer.Option(
-        '-b', '--board', help='New board ID (use -1 to unasign).')] = None):
+        '-b', '--board', help='New board ID (use -1 to unasign).')] = None,
+         fmt: FormatOption = OutputFormat.TABLE):
     """Edit existing task attributes.
 
-    All parameters and options from the `add` command are optional here.
+    All parameters and options from the `add` command are optional here. When
+    several tasks are given, all of them are updated in a single statement.
     """
-    with Session(engine) as session:
-        container = Container(session)
-
+    with open_container() as container:
         try:
-            task = container.task_service.edit_task(id, title, priority, tag,
-                                                    due_date, board_id)
-            session.commit()
+            board = commit_with_retry(
+                container, lambda c: c.task_service.edit_tasks(
+                    ids, title, priority, tag, due_date, board_id))
         except TaskNotFoundError:
             return console.print(MessageRenderer.error('Task not found.'))
         except BoardNotFoundError:
             return console.print(MessageRenderer.error('Board not found.'))
 
+        if fmt != OutputFormat.TABLE:
+            return print_records(
+                container.display_service.task_records(ids), fmt)
+
         console.clear()
-        console.print(container.display_service.get_ui_renderable(task.board))
+        console.print(container.display_service.get_ui_renderable(board))
 
 
 @app.command()
-def mv(id: Annotated[int, typer.Argument(help='Task ID.')],
+def mv(ids: IdsArgument,
        steps: Annotated[int, typer.Option(
-           '--steps', '-s', help='Number of steps to move.')] = 1):
-    """Move a task from its current status.
+           '--steps', '-s', help='Number of steps to move.')] = 1,
+       fmt: FormatOption = OutputFormat.TABLE):
+    """Move tasks from their current status.
 
     To customise the direction or number of steps, use the --steps option.
 
-    To move a task backwards the steps must be negative.
+    To move a task backwards the steps must be negative. If any of the tasks
+    cannot be moved, none of them is.
     """
-    with Session(engine) as session:
-        container = Container(session)
-
+    with open_container() as container:
         try:
-            task = container.task_service.move_task(id, steps)
-            session.commit()
+            board = commit_with_retry(
+                container, lambda c: c.task_service.move_tasks(ids, steps))
         except TaskNotFoundError:
             return console.print(MessageRenderer.error('Task not found.'))
         except ValueError:
             return console.print(
                 MessageRenderer.error(f'Unable to move {steps} step(s).'))
 
+        if fmt != OutputFormat.TABLE:
+            return print_records(
+                container.display_service.task_records(ids), fmt)
+
         console.clear()
-        console.print(container.display_service.get_ui_renderable(task.board))
+        console.print(container.display_service.get_ui_renderable(board))
 
 
 @app.command()
-def rm(id: Annotated[int, typer.Argument(help='Task ID.')],
+def rm(ids: IdsArgument,
        force: Annotated[bool, typer.Option(
            '--force', '-f',
-           prompt='Are you sure you want to delete the task?',
-           help='Force deletion without confirmation.')] = False):
-    """Delete existing task.
+           prompt='Are you sure you want to delete the task(s)?',
+           help='Force deletion without confirmation.')] = False,
+       fmt: FormatOption = OutputFormat.TABLE):
+    """Delete existing tasks.
 
-    If --force is not used, will ask for confirmation.
+    If --force is not used, will ask for confirmation. With the json and
+    ndjson formats the deleted tasks are printed.
     """
     if not force:
         return
 
-    with Session(engine) as session:
-        container = Container(session)
+    with open_container() as container:
+        if fmt != OutputFormat.TABLE:
+            records = container.display_service.task_records(ids)
 
         try:
-            task = container.task_service.delete_task(id)
-            board = task.board
-            session.commit()
+            board = commit_with_retry(
+                container, lambda c: c.task_service.delete_tasks(ids))
         except TaskNotFoundError:
             return console.print(MessageRenderer.error('Task not found.'))
 
+        if fmt != OutputFormat.TABLE:
+            return print_records(records, fmt)
+
         console.clear()
         console.print(container.display_service.get_ui_renderable(board))
+
+
+@app.command()
+def search(query: Annotated[list[str], typer.Argument(
+               help='Words to search in task titles and tags.')],
+           limit: Annotated[int, typer.Option(
+               '--limit', '-l', min=1,
+               help='Maximum number of tasks shown.')] = 50):
+    """Search tasks by title and tag.
+
+    Tasks containing all the words are shown, best matches first. Words also
+    match longer ones starting with them, e.g. "deploy" matches "deployment".
+    """
+    with open_container() as container:
+        renderable = container.display_service.search_view(' '.join(query),
+                                                           limit)
+
+        console.clear()
+        console.print(renderable)
+
+
+@app.command('import')
+def import_(file: Annotated[typer.FileText, typer.Argument(
+                help='File to read, use - for stdin.')],
+            fmt: Annotated[FileFormat | None, typer.Option(
+                '--format', help='File format, inferred from the extension '
+                'by default.')] = None,
+            batch_size: Annotated[int, typer.Option(
+                '--batch-size', min=1,
+                help='Number of tasks inserted per transaction.')] = 1000):
+    """Import tasks from a CSV or JSONL file.
+
+    Records are read and inserted in batches, each one in its own transaction.
+    Tasks assigned to a board that does not exist are skipped.
+    """
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    from ..task.serializer import TaskSerializer
+
+    values = TaskSerializer.read(file, _file_format(file, fmt))
+    imported = skipped = 0
+    start = perf_counter()
+
+    with (open_container() as container,
+          Progress(SpinnerColumn(), TextColumn('{task.description}'),
+                   console=console, transient=True) as progress):
+        bar = progress.add_task('Importing tasks...')
+
+        try:
+            for batch in batched(values, batch_size):
+                inserted, rejected = commit_with_retry(
+                    container,
+                    lambda c: c.task_service.import_batch(batch))
+                imported += inserted
+                skipped += rejected
+
+                rate = imported / (perf_counter() - start)
+                progress.update(bar, description=f'Imported {imported:,} '
+                                f'task(s) ({rate:,.0f} tasks/s)...')
+        except ValueError as e:
+            return console.print(MessageRenderer.error(
+                f'{e}. Imported {imported:,} task(s) before the error.'))
+
+    elapsed = perf_counter() - start
+    message = (f'Imported {imported:,} task(s) in {elapsed:.2f}s '
+               f'({imported / elapsed:,.0f} tasks/s).')
+
+    if skipped:
+        message += f' Skipped {skipped:,} task(s) with unknown board.'
+
+    console.print(MessageRenderer.success(message))
+
+
+@app.command()
+def export(file: Annotated[typer.FileTextWrite, typer.Argument(
+               help='File to write, use - for stdout.')],
+           fmt: Annotated[FileFormat | None, typer.Option(
+               '--format', help='File format, inferred from the extension '
+               'by default.')] = None,
+           batch_size: Annotated[int, typer.Option(
+               '--batch-size', min=1,
+               help='Number of tasks fetched at a time.')] = 1000):
+    """Export all tasks to a CSV or JSONL file.
+    """
+    from ..task.serializer import TaskSerializer
+
+    start = perf_counter()
+
+    with open_container() as container:
+        rows = container.task_service.export_tasks(batch_size)
+        count = TaskSerializer.write(file, _file_format(file, fmt), rows)
+
+    if file.name == '<stdout>':
+        return
+
+    elapsed = perf_counter() - start
+    console.print(MessageRenderer.success(
+        f'Exported {count:,} task(s) in {elapsed:.2f}s '
+        f'({count / elapsed:,.0f} tasks/s).'))
@@ -1,13 +1,21 @@
 """This module exports the service class to display the UI.
 """
 
+from collections import defaultdict
+from collections.abc import Collection, Iterator, Sequence
+from typing import Any
+
 from rich.console import RenderableType
 
 from ..board.renderer import BoardRenderer
+from ..board.serializer import BoardSerializer
 from ..board.service import BoardService
 from ..config.service import ConfigService
 from ..models import Board
+from ..task.filter import IdRanges, TaskFilter
+from ..task.serializer import TaskSerializer
 from ..task.service import TaskService
+from ..workspace.service import WorkspaceService
 
 
 class DisplayService:
@@ -17,14 +25,223 @@ class DisplayService:
 
     def __init__(self, config_service: ConfigService,
                  board_service: BoardService, task_service: TaskService,
+                 workspace_service: WorkspaceService,
                  renderer: BoardRenderer):
         """Initialise the service with its dependencies.
         """
         self.config_service = config_service
         self.board_service = board_service
         self.task_service = task_service
+        self.workspace_service = workspace_service
         self.renderer = renderer
 
+    def all_boards_view(self, limit: int | None = None, offset: int = 0,
+                        criteria: TaskFilter | None = None,
+                        board_ids: Collection[int] | None = None
+                        ) -> RenderableType:
+        """Render all the boards in a single table.
+
+        :param limit: maximum number of tasks per column, None for no limit
+        :param offset: number of tasks to skip per column
+        :param criteria: filter the displayed tasks must match
+        :param board_ids: only display the boards with these IDs, None for all
+        :return: rich renderable
+        """
+        if limit is None and not offset and not criteria:
+            return self.renderer.to_kanban_swimlanes(
+                self.board_service.list_boards(board_ids))
+
+        boards = self.board_service.list_boards(board_ids, with_tasks=False)
+        tasks, remaining = self.task_service.get_page(
+            [b.id for b in boards], limit, offset, criteria)
+
+        return self.renderer.to_kanban_swimlanes(boards, tasks, remaining)
+
+    def iter_all_boards_view(self, limit: int | None = None,
+                             offset: int = 0,
+                             criteria: TaskFilter | None = None,
+                             board_ids: Collection[int] | None = None
+                             ) -> Iterator[RenderableType]:
+        """Render all the boards one at a time, fetching their tasks as they
+        are rendered.
+
+        :param limit: maximum number of tasks per column, None for no limit
+        :param offset: number of tasks to skip per column
+        :param criteria: filter the displayed tasks must match
+        :param board_ids: only display the boards with these IDs, None for all
+        :return: iterator of rich renderables
+        """
+        boards = sorted(
+            self.board_service.list_boards(board_ids, with_tasks=False),
+            key=lambda b: b.id
+        )
+        tasks, remaining = self.task_service.stream_page(
+            [b.id for b in boards], limit, offset, criteria)
+
+        return self.renderer.iter_kanban_swimlanes(boards, tasks, remaining)
+
+    def workspaces_view(self, workspaces: Sequence[str],
+                        limit: int | None = None, offset: int = 0,
+                        criteria: TaskFilter | None = None
+                        ) -> RenderableType:
+        """Render the boards of several workspaces in a single table.
+
+        :param workspaces: workspace names, in display order
+        :param limit: maximum number of tasks per column, None for no limit
+        :param offset: number of tasks to skip per column
+        :param criteria: filter the displayed tasks must match
+        :raises ValueError: if a name is invalid or there are too many
+        :raises WorkspaceNotFoundError: if a workspace has no data file
+        :raises WorkspaceOutdatedError: if a data file is not at the latest
+            schema version
+        :return: rich renderable
+        """
+        boards, tasks, remaining = self.workspace_service.get_page(
+            workspaces, limit, offset, criteria)
+
+        return self.renderer.to_workspace_swimlanes(boards, tasks, remaining)
+
+    def board_view(self, board_id: int, limit: int | None = None,
+                   offset: int = 0,
+                   criteria: TaskFilter | None = None) -> RenderableType:
+        """Render a single board.
+
+        :param board_id: board ID to search
+        :param limit: maximum number of tasks per column, None for no limit
+        :param offset: number of tasks to skip per column
+        :param criteria: filter the displayed tasks must match
+        :raises BoardNotFoundError: if the ID does not exist
+        :return: rich renderable
+        """
+        if limit is None and not offset and not criteria:
+            return self.renderer.to_kanban(
+                self.board_service.get_board(board_id, with_tasks=True))
+
+        board = self.board_service.get_board(board_id)
+        tasks, remaining = self.task_service.get_page([board_id], limit,
+                                                      offset, criteria)
+
+        return self.renderer.to_kanban(board, tasks, remaining)
+
+    def backlog_view(self, limit: int | None = None, offset: int = 0,
+                     criteria: TaskFilter | None = None) -> RenderableType:
+        """Render the tasks with no assigned board.
+
+        :param limit: maximum number of tasks per column, None for no limit
+        :param offset: number of tasks to skip per column
+        :param criteria: filter the displayed tasks must match
+        :return: rich renderable
+        """
+        if limit is None and not offset and not criteria:
+            return self.renderer.kanban_from_tasks(
+                'Backlog', self.task_service.get_backlog())
+
+        tasks, remaining = self.task_service.get_page([None], limit, offset,
+                                                      criteria)
+
+        return self.renderer.kanban_from_tasks('Backlog', tasks, remaining)
+
+    def search_view(self, query: str, limit: int) -> RenderableType:
+        """Render the tasks matching a full-text search.
+
+        :param query: words to search in task titles and tags
+        :param limit: maximum number of tasks
+        :return: rich renderable
+        """
+        return self.renderer.kanban_from_tasks(
+            f'Search: {query}', self.task_service.search_tasks(query, limit))
+
+    def all_boards_records(self, limit: int | None = None, offset: int = 0,
+                           criteria: TaskFilter | None = None,
+                           board_ids: Collection[int] | None = None
+                           ) -> Iterator[dict[str, Any]]:
+        """Convert all the boards and their tasks into plain records, one
+        board at a time.
+
+        :param limit: maximum number of tasks per column, None for no limit
+        :param offset: number of tasks to skip per column
+        :param criteria: filter the tasks must match
+        :param board_ids: only include the boards with these IDs, None for all
+        :return: iterator of board records
+        """
+        boards = self.board_service.list_board_rows(board_ids)
+        tasks = self.task_service.stream_page_rows(
+            [b.id for b in boards], limit, offset, criteria)
+
+        return BoardSerializer.iter_records(boards, tasks)
+
+    def workspaces_records(self, workspaces: Sequence[str],
+                           limit: int | None = None, offset: int = 0,
+                           criteria: TaskFilter | None = None
+                           ) -> Iterator[dict[str, Any]]:
+        """Convert the boards of several workspaces and their tasks into
+        plain records.
+
+        :param workspaces: workspace names, in display order
+        :param limit: maximum number of tasks per column, None for no limit
+        :param offset: number of tasks to skip per column
+        :param criteria: filter the tasks must match
+        :raises ValueError: if a name is invalid or there are too many
+        :raises WorkspaceNotFoundError: if a workspace has no data file
+        :raises WorkspaceOutdatedError: if a data file is not at the latest
+            schema version
+        :return: iterator of board records with their workspace
+        """
+        boards, tasks, _ = self.workspace_service.get_page(
+            workspaces, limit, offset, criteria)
+
+        lanes = defaultdict(list)
+        for task in tasks:
+            lanes[task.workspace, task.board_id].append(task)
+
+        return ({'workspace': board.workspace,
+                 **BoardSerializer.to_record(
+                     board, lanes[board.workspace, board.id])}
+                for board in boards)
+
+    def board_record(self, board_id: int, limit: int | None = None,
+                     offset: int = 0,
+                     criteria: TaskFilter | None = None) -> dict[str, Any]:
+        """Convert a single board and its tasks into a plain record.
+
+        :param board_id: board ID to search
+        :param limit: maximum number of tasks per column, None for no limit
+        :param offset: number of tasks to skip per column
+        :param criteria: filter the tasks must match
+        :raises BoardNotFoundError: if the ID does not exist
+        :return: board record
+        """
+        board = self.board_service.get_board(board_id)
+        tasks = self.task_service.stream_page_rows([board_id], limit, offset,
+                                                   criteria)
+
+        return BoardSerializer.to_record(board, tasks)
+
+    def backlog_records(self, limit: int | None = None, offset: int = 0,
+                        criteria: TaskFilter | None = None
+                        ) -> Iterator[dict[str, Any]]:
+        """Convert the tasks with no assigned board into plain records, one
+        task at a time.
+
+        :param limit: maximum number of tasks per column, None for no limit
+        :param offset: number of tasks to skip per column
+        :param criteria: filter the tasks must match
+        :return: iterator of task records
+        """
+        rows = self.task_service.stream_page_rows([None], limit, offset,
+                                                  criteria)
+
+        return map(TaskSerializer.to_record, rows)
+
+    def task_records(self, ranges: IdRanges) -> list[dict[str, Any]]:
+        """Convert the tasks of some ID ranges into plain records.
+
+        :param ranges: inclusive ID ranges
+        :return: list of task records ordered by ID
+        """
+        return [TaskSerializer.to_record(row)
+                for row in self.task_service.get_rows(ranges)]
+
     def get_ui_renderable(self, board: Board | None) -> RenderableType:
         """Render the UI depending on the last displayed setting (all or single
         board).
@@ -32,13 +249,9 @@ class DisplayService:
         last_view = self.config_service.get_last_view()
 
         if last_view == 'all':
-            boards = self.board_service.list_boards()
-
-            return self.renderer.to_kanban_swimlanes(boards)
+            return self.all_boards_view()
 
         if board is not None:
             return self.renderer.to_kanban(board)
 
-        tasks = self.task_service.get_backlog()
-
-        return self.renderer.kanban_from_tasks('Backlog', tasks)
+        return self.backlog_view()
@@ -1,6 +1,8 @@
 """This module defines the repository class for the AppConfig model.
 """
 
+from sqlalchemy import event, select
+from sqlalchemy.dialects.sqlite import insert
 from sqlalchemy.orm import Session
 
 from ..models import AppConfig
@@ -9,8 +11,13 @@ from ..models import AppConfig
 class ConfigRepository:
     """Repository responsible for persistence operations related to AppConfig
     entities.
-    """
 
+    Config values are read at most once per transaction and kept until it
+    ends, so a rolled back or retried change is never mistaken for a stored
+    value, and a long-lived session sees the changes of other processes.
+    Values are only written when they change, so read-only commands never
+    write to the data file.
+    """
 
     def __init__(self, session: Session):
         """Initialise the repository with a database session.
@@ -18,6 +25,28 @@ class ConfigRepository:
         :param session: SQLAlchemy session
         """
         self.session = session
+        self._cache: dict[str, str | None] | None = None
+
+        event.listen(session, 'after_commit', self._clear_cache)
+        event.listen(session, 'after_soft_rollback', self._clear_cache)
+
+    def _clear_cache(self, *args) -> None:
+        """Forget the config values once the session transaction ends.
+        """
+        self._cache = None
+
+    def _values(self) -> dict[str, str | None]:
+        """Return the config values of the session data file, loading all
+        of them in a single query on first use in the transaction.
+
+        :return: mapping of config keys and values
+        """
+        if self._cache is None:
+            rows = self.session.execute(
+                select(AppConfig.key, AppConfig.value)).all()
+            self._cache = dict(rows)
+
+        return self._cache
 
     def get(self, key: str) -> str | None:
         """Retrieve a config value.
@@ -25,22 +54,25 @@ class ConfigRepository:
         :param key: config key
         :return: config value
         """
-        config = self.session.get(AppConfig, key)
-
-        return config.value if config else None
+        return self._values().get(key)
 
     def set(self, key: str, value: str) -> None:
-        """Set a new value to a config param.
+        """Set a new value to a config param, if it changed.
+
+        The change is part of the session transaction, the caller is expected
+        to commit it.
 
         :param key: config key
         :param value: config value
         """
-        config = self.session.get(AppConfig, key)
+        values = self._values()
 
-        if not config:
-            config = AppConfig(key=key, value=value)
-            self.session.add(config)
-        else:
-            config.value = value
+        if key in values and values[key] == value:
+            return
 
-        self.session.commit()
+        self.session.execute(
+            insert(AppConfig).values(key=key, value=value)
+            .on_conflict_do_update(index_elements=[AppConfig.key],
+                                   set_={'value': value})
+        )
+        values[key] = value
@@ -1,7 +1,34 @@
 """This module exports a console singleton.
 """
 
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import TextIO
+
 from rich.console import Console
 
 
 console = Console()
+
+
+@contextmanager
+def redirect_console(file: TextIO, width: int, colour: bool) -> Iterator[None]:
+    """Temporarily send the console output to another file, formatted for a
+    terminal other than the one of the current process.
+
+    The singleton is reconfigured in place because command modules hold a
+    reference to it.
+
+    :param file: file to write to
+    :param width: terminal width in characters
+    :param colour: whether to emit colour and terminal control codes
+    """
+    state = console.__dict__.copy()
+    console.__init__(file=file, width=width, force_terminal=colour,
+                     color_system='standard' if colour else None)
+
+    try:
+        yield
+    finally:
+        console.__dict__.clear()
+        console.__dict__.update(state)
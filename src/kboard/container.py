@@ -3,14 +3,25 @@
 
 from sqlalchemy.orm import Session
 
+from .agenda.renderer import AgendaRenderer
+from .agenda.repository import AgendaRepository
+from .agenda.service import AgendaService
+from .archive.renderer import ArchiveRenderer
+from .archive.repository import ArchiveRepository
+from .archive.service import ArchiveService
 from .board.renderer import BoardRenderer
 from .board.repository import BoardRepository
 from .board.service import BoardService
 from .common.display_service import DisplayService
 from .config.repository import ConfigRepository
 from .config.service import ConfigService
+from .report.renderer import ReportRenderer
+from .report.repository import ReportRepository
+from .report.service import ReportService
 from .task.repository import TaskRepository
 from .task.service import TaskService
+from .workspace.repository import WorkspaceRepository
+from .workspace.service import WorkspaceService
 
 
 class Container:
@@ -23,16 +34,32 @@ class Container:
 
         :param session: SQLAlchemy session
         """
+        self.session = session
+
         self.board_repo = BoardRepository(session)
         self.task_repo = TaskRepository(session)
         self.config_repo = ConfigRepository(session)
+        self.archive_repo = ArchiveRepository(session)
+        self.report_repo = ReportRepository(session)
+        self.workspace_repo = WorkspaceRepository(session)
+        self.agenda_repo = AgendaRepository(session)
 
         self.renderer = BoardRenderer()
+        self.archive_renderer = ArchiveRenderer()
+        self.report_renderer = ReportRenderer()
+        self.agenda_renderer = AgendaRenderer()
 
         self.board_service = BoardService(self.board_repo, self.task_repo)
         self.task_service = TaskService(self.task_repo, self.board_repo)
         self.config_service = ConfigService(self.config_repo)
+        self.archive_service = ArchiveService(self.archive_repo,
+                                              self.board_repo)
+        self.report_service = ReportService(self.report_repo,
+                                            self.board_repo)
+        self.workspace_service = WorkspaceService(self.workspace_repo)
+        self.agenda_service = AgendaService(self.agenda_repo)
         self.display_service = DisplayService(self.config_service,
                                               self.board_service,
                                               self.task_service,
+                                              self.workspace_service,
                                               self.renderer)
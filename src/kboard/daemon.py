@@ -0,0 +1,135 @@
+"""Background server that runs commands on behalf of the ``kb`` client.
+
+The daemon keeps the database engine, a shared session and the rendering
+caches warm between commands, and receives them through a Unix socket. Each
+request is a single JSON line with the command arguments and the client
+terminal details, and is answered with a JSON line holding the rendered
+output and the exit code. Requests are served one at a time, so commands never
+compete with each other for the database.
+"""
+
+import json
+import os
+import socketserver
+import sys
+import threading
+from collections.abc import Iterator
+from contextlib import (chdir, contextmanager, redirect_stderr,
+                        redirect_stdout)
+from io import StringIO
+from typing import Any
+
+import click
+import typer
+
+from . import profiling
+from .app import app
+from .commands import share_container
+from .common.message_renderer import MessageRenderer
+from .console import console, redirect_console
+from .settings import SOCKET_PATH
+
+
+@contextmanager
+def empty_stdin() -> Iterator[None]:
+    """Temporarily replace stdin with an empty stream, so that prompts
+    abort instead of waiting for input the client never sends.
+    """
+    stdin = sys.stdin
+    sys.stdin = StringIO()
+
+    try:
+        yield
+    finally:
+        sys.stdin = stdin
+
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    """Handler for a single client connection.
+    """
+
+    server: 'DaemonServer'
+
+    def handle(self) -> None:
+        payload = json.loads(self.rfile.readline())
+
+        if payload.get('stop'):
+            response = {'stopped': True}
+            threading.Thread(target=self.server.shutdown).start()
+        elif 'args' in payload:
+            response = self.server.execute(payload)
+        else:
+            response = {'pid': os.getpid()}
+
+        self.wfile.write(json.dumps(response).encode() + b'\n')
+
+
+class DaemonServer(socketserver.UnixStreamServer):
+    """Unix socket server that executes CLI commands in-process.
+    """
+
+    def __init__(self, command: click.Command,
+                 bind_and_activate: bool = True):
+        """Bind the socket, accessible only by the current user.
+
+        :param command: root CLI command
+        :param bind_and_activate: whether to bind the socket and listen on
+            it, False to only execute commands through :meth:`execute`
+        """
+        old_umask = os.umask(0o177)
+
+        try:
+            super().__init__(str(SOCKET_PATH), RequestHandler,
+                             bind_and_activate)
+        finally:
+            os.umask(old_umask)
+
+        self.command = command
+
+    def execute(self, payload: dict[str, Any]) -> dict[str, Any]:
+        """Run a CLI command, capturing everything it writes.
+
+        :param payload: request with the command arguments and the client
+            working directory and terminal details
+        :return: response with the output and exit code, or a fallback
+            response if the command needs to interact with the user
+        """
+        output = StringIO()
+        code = 0
+
+        with (chdir(payload['cwd']), empty_stdin(), redirect_stdout(output),
+              redirect_stderr(output),
+              redirect_console(output, payload['width'], payload['colour'])):
+            try:
+                result = self.command.main(payload['args'], prog_name='kb',
+                                           standalone_mode=False)
+                code = result if isinstance(result, int) else 0
+            except click.Abort:
+                return {'fallback': True}
+            except click.ClickException as e:
+                e.show()
+                code = e.exit_code
+            except Exception as e:
+                console.print(MessageRenderer.error(
+                    f'{type(e).__name__}: {e}'))
+                code = 1
+
+        return {'output': output.getvalue(), 'code': code}
+
+
+def serve() -> None:
+    """Serve commands until a stop request is received.
+    """
+    command = typer.main.get_command(app)
+    SOCKET_PATH.unlink(missing_ok=True)
+    profiling.skip_startup()
+
+    with share_container(), DaemonServer(command) as server:
+        try:
+            server.serve_forever()
+        finally:
+            SOCKET_PATH.unlink(missing_ok=True)
+
+
+if __name__ == '__main__':
+    serve()
@@ -1,10 +1,39 @@
-"""This module exports a single instance to the database engine.
+"""This module exports the accessor to the database engine.
 """
 
-from sqlalchemy import create_engine
+from functools import cache
+from pathlib import Path
+from sqlite3 import Connection as SQLiteConnection
 
-from ..settings import DB_PATH
+from sqlalchemy import Engine, create_engine, event
 
+from ..settings import DB_PATH, DB_PRAGMAS
 
-engine = create_engine(f'sqlite:///{DB_PATH}')
-"""Database engine."""
+
+def _apply_pragmas(dbapi_connection: SQLiteConnection, _) -> None:
+    """Configure a new SQLite connection with the settings pragmas.
+
+    :param dbapi_connection: raw SQLite connection
+    """
+    cursor = dbapi_connection.cursor()
+
+    for name, value in DB_PRAGMAS.items():
+        cursor.execute(f'PRAGMA {name} = {value}')
+
+    cursor.close()
+
+
+@cache
+def get_engine(path: Path = DB_PATH) -> Engine:
+    """Return the database engine of a data file, creating it on first use.
+
+    URI filenames are enabled on its connections, so that other data files
+    can be attached with URI parameters.
+
+    :param path: data file, the one of the default workspace by default
+    :return: database engine
+    """
+    engine = create_engine(f'sqlite:///{path}', connect_args={'uri': True})
+    event.listen(engine, 'connect', _apply_pragmas)
+
+    return engine
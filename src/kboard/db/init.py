@@ -1,11 +1,17 @@
 """Database-related utility functions.
 """
 
-from .engine import engine
-from ..models import Base
+from pathlib import Path
 
+from .engine import get_engine
+from .migrations import migrate
+from ..settings import DB_PATH
 
-def init_db() -> None:
-    """Create the database file and create all the tables.
+
+def init_db(path: Path = DB_PATH) -> int:
+    """Create the database file if needed and apply pending migrations.
+
+    :param path: data file, the one of the default workspace by default
+    :return: number of migrations applied
     """
-    Base.metadata.create_all(engine)
+    return migrate(get_engine(path))
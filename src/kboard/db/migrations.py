@@ -0,0 +1,486 @@
+"""Versioned schema migrations for the data file.
+
+The schema version is stored inside the database itself using SQLite's
+``user_version`` pragma. Version ``N`` means that the first ``N`` entries of
+:data:`MIGRATIONS` have been applied, so existing files are upgraded in place
+by running the remaining ones in order.
+
+Migrations are never edited once released: schema changes must be added as a
+new function at the end of the list, and the models updated accordingly.
+"""
+
+from collections.abc import Callable
+
+from sqlalchemy import Connection, Engine, text
+
+
+def _create_base_tables(conn: Connection) -> None:
+    """Create the tables of the original schema.
+
+    Data files created before migrations existed already contain them, so
+    this step is a no-op for those.
+    """
+    conn.execute(text(
+        'CREATE TABLE IF NOT EXISTS app_config ('
+        ' "key" VARCHAR NOT NULL,'
+        ' value VARCHAR,'
+        ' PRIMARY KEY ("key"))'
+    ))
+    conn.execute(text(
+        'CREATE TABLE IF NOT EXISTS boards ('
+        ' id INTEGER NOT NULL,'
+        ' name VARCHAR NOT NULL,'
+        ' PRIMARY KEY (id))'
+    ))
+    conn.execute(text(
+        'CREATE TABLE IF NOT EXISTS tasks ('
+        ' id INTEGER NOT NULL,'
+        ' title VARCHAR NOT NULL,'
+        ' priority VARCHAR(6) NOT NULL,'
+        ' tag VARCHAR NOT NULL,'
+        ' status VARCHAR(11) NOT NULL,'
+        ' due_date DATE,'
+        ' board_id INTEGER,'
+        ' PRIMARY KEY (id),'
+        ' FOREIGN KEY(board_id) REFERENCES boards (id) ON DELETE CASCADE)'
+    ))
+
+
+def _add_tasks_board_status_index(conn: Connection) -> None:
+    """Index tasks by board and status.
+
+    Covers loading the tasks of one or more boards, the backlog
+    (``board_id IS NULL``) and the removal of completed tasks of a board.
+    """
+    conn.execute(text(
+        'CREATE INDEX IF NOT EXISTS ix_tasks_board_id_status '
+        'ON tasks (board_id, status)'
+    ))
+
+
+def _add_tasks_full_text_index(conn: Connection) -> None:
+    """Index task titles and tags for full-text search.
+
+    ``tasks_fts`` is an external content FTS5 table: it only stores the index
+    and reads the text from ``tasks``. Triggers keep it in sync with every
+    insert, update and delete, and existing tasks are indexed by a rebuild.
+    """
+    conn.execute(text(
+        'CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5('
+        " title, tag, content='tasks', content_rowid='id',"
+        " tokenize='unicode61 remove_diacritics 2', prefix='2 3')"
+    ))
+    conn.execute(text(
+        'CREATE TRIGGER IF NOT EXISTS tasks_fts_insert AFTER INSERT ON tasks '
+        'BEGIN'
+        ' INSERT INTO tasks_fts (rowid, title, tag)'
+        ' VALUES (new.id, new.title, new.tag);'
+        ' END'
+    ))
+    conn.execute(text(
+        'CREATE TRIGGER IF NOT EXISTS tasks_fts_delete AFTER DELETE ON tasks '
+        'BEGIN'
+        ' INSERT INTO tasks_fts (tasks_fts, rowid, title, tag)'
+        " VALUES ('delete', old.id, old.title, old.tag);"
+        ' END'
+    ))
+    conn.execute(text(
+        'CREATE TRIGGER IF NOT EXISTS tasks_fts_update '
+        'AFTER UPDATE OF title, tag ON tasks '
+        'BEGIN'
+        ' INSERT INTO tasks_fts (tasks_fts, rowid, title, tag)'
+        " VALUES ('delete', old.id, old.title, old.tag);"
+        ' INSERT INTO tasks_fts (rowid, title, tag)'
+        ' VALUES (new.id, new.title, new.tag);'
+        ' END'
+    ))
+    conn.execute(text("INSERT INTO tasks_fts (tasks_fts) VALUES ('rebuild')"))
+
+
+def _add_board_summary_tables(conn: Connection) -> None:
+    """Keep per-board task counts in summary tables.
+
+    ``board_task_counts`` holds the number of tasks of every board and status,
+    and ``board_due_counts`` the number of open tasks of every board due on a
+    given date, so overdue tasks can be counted for any day. Triggers on
+    ``tasks`` and ``boards`` keep both in sync, and they are filled from the
+    existing tasks.
+    """
+    conn.execute(text(
+        'CREATE TABLE IF NOT EXISTS board_task_counts ('
+        ' board_id INTEGER NOT NULL,'
+        ' status VARCHAR(11) NOT NULL,'
+        ' count INTEGER NOT NULL,'
+        ' PRIMARY KEY (board_id, status)) WITHOUT ROWID'
+    ))
+    conn.execute(text(
+        'CREATE TABLE IF NOT EXISTS board_due_counts ('
+        ' board_id INTEGER NOT NULL,'
+        ' due_date DATE NOT NULL,'
+        ' count INTEGER NOT NULL,'
+        ' PRIMARY KEY (board_id, due_date)) WITHOUT ROWID'
+    ))
+
+    add_new = (
+        ' INSERT INTO board_task_counts (board_id, status, count)'
+        ' SELECT new.board_id, new.status, 1 WHERE new.board_id IS NOT NULL'
+        ' ON CONFLICT (board_id, status) DO UPDATE SET count = count + 1;'
+        ' INSERT INTO board_due_counts (board_id, due_date, count)'
+        ' SELECT new.board_id, new.due_date, 1'
+        ' WHERE new.board_id IS NOT NULL AND new.due_date IS NOT NULL'
+        " AND new.status != 'COMPLETED'"
+        ' ON CONFLICT (board_id, due_date) DO UPDATE SET count = count + 1;'
+    )
+    remove_old = (
+        ' UPDATE board_task_counts SET count = count - 1'
+        ' WHERE board_id = old.board_id AND status = old.status;'
+        ' UPDATE board_due_counts SET count = count - 1'
+        ' WHERE board_id = old.board_id AND due_date = old.due_date'
+        " AND old.status != 'COMPLETED';"
+        ' DELETE FROM board_due_counts'
+        ' WHERE board_id = old.board_id AND due_date = old.due_date'
+        ' AND count = 0;'
+    )
+
+    conn.execute(text(
+        'CREATE TRIGGER IF NOT EXISTS board_counts_insert '
+        f'AFTER INSERT ON tasks BEGIN{add_new} END'
+    ))
+    conn.execute(text(
+        'CREATE TRIGGER IF NOT EXISTS board_counts_delete '
+        f'AFTER DELETE ON tasks BEGIN{remove_old} END'
+    ))
+    conn.execute(text(
+        'CREATE TRIGGER IF NOT EXISTS board_counts_update '
+        'AFTER UPDATE OF board_id, status, due_date ON tasks '
+        'WHEN old.board_id IS NOT new.board_id'
+        ' OR old.status IS NOT new.status'
+        ' OR old.due_date IS NOT new.due_date '
+        f'BEGIN{remove_old}{add_new} END'
+    ))
+    conn.execute(text(
+        'CREATE TRIGGER IF NOT EXISTS board_counts_board_delete '
+        'AFTER DELETE ON boards BEGIN'
+        ' DELETE FROM board_task_counts WHERE board_id = old.id;'
+        ' DELETE FROM board_due_counts WHERE board_id = old.id;'
+        ' END'
+    ))
+
+    conn.execute(text(
+        'INSERT OR REPLACE INTO board_task_counts (board_id, status, count) '
+        'SELECT board_id, status, count(*) FROM tasks '
+        'WHERE board_id IN (SELECT id FROM boards) '
+        'GROUP BY board_id, status'
+    ))
+    conn.execute(text(
+        'INSERT OR REPLACE INTO board_due_counts (board_id, due_date, count) '
+        'SELECT board_id, due_date, count(*) FROM tasks '
+        'WHERE board_id IN (SELECT id FROM boards)'
+        " AND due_date IS NOT NULL AND status != 'COMPLETED' "
+        'GROUP BY board_id, due_date'
+    ))
+
+
+def _add_task_archive(conn: Connection) -> None:
+    """Record when tasks are completed and add the table they are archived
+    to.
+
+    ``tasks.completed_at`` is set by triggers whenever a task enters the
+    completed status and cleared when it leaves it. Tasks already completed
+    are considered completed on the day of the upgrade.
+    """
+    conn.execute(text('ALTER TABLE tasks ADD COLUMN completed_at DATE'))
+    conn.execute(text(
+        "UPDATE tasks SET completed_at = date('now', 'localtime') "
+        "WHERE status = 'COMPLETED'"
+    ))
+
+    conn.execute(text(
+        'CREATE TRIGGER IF NOT EXISTS tasks_completed_at_insert '
+        "AFTER INSERT ON tasks WHEN new.status = 'COMPLETED'"
+        ' AND new.completed_at IS NULL BEGIN'
+        " UPDATE tasks SET completed_at = date('now', 'localtime')"
+        ' WHERE id = new.id;'
+        ' END'
+    ))
+    conn.execute(text(
+        'CREATE TRIGGER IF NOT EXISTS tasks_completed_at_update '
+        'AFTER UPDATE OF status ON tasks '
+        'WHEN old.status IS NOT new.status BEGIN'
+        ' UPDATE tasks SET completed_at = CASE'
+        " WHEN new.status = 'COMPLETED' THEN date('now', 'localtime') END"
+        ' WHERE id = new.id;'
+        ' END'
+    ))
+
+    conn.execute(text(
+        'CREATE TABLE IF NOT EXISTS archived_tasks ('
+        ' id INTEGER NOT NULL,'
+        ' task_id INTEGER NOT NULL,'
+        ' title VARCHAR NOT NULL,'
+        ' priority VARCHAR(6) NOT NULL,'
+        ' tag VARCHAR NOT NULL,'
+        ' status VARCHAR(11) NOT NULL,'
+        ' due_date DATE,'
+        ' board_id INTEGER,'
+        ' board_name VARCHAR,'
+        ' completed_at DATE,'
+        ' archived_at DATE NOT NULL,'
+        ' PRIMARY KEY (id))'
+    ))
+    conn.execute(text(
+        'CREATE INDEX IF NOT EXISTS ix_archived_tasks_board_id '
+        'ON archived_tasks (board_id)'
+    ))
+
+
+def _create_board_rollups_trigger(conn: Connection, when: str) -> None:
+    """Create the trigger adding logged completions to the daily rollups of
+    their board.
+
+    :param conn: database connection
+    :param when: condition of the transitions to roll up
+    """
+    since_created = (
+        ' FROM task_transitions WHERE task_id = new.task_id AND id >= ('
+        '  SELECT max(id) FROM task_transitions'
+        '  WHERE task_id = new.task_id AND from_status IS NULL)'
+    )
+    add_duration = (
+        ' INSERT INTO board_daily_durations'
+        ' (board_id, day, metric, days, count)'
+        " SELECT new.board_id, date(new.changed_at), '{metric}',"
+        ' CAST(julianday(new.changed_at) - julianday(start) AS INTEGER), 1'
+        ' FROM (SELECT min(changed_at) AS start'
+        f'{since_created}{{condition}})'
+        ' WHERE start IS NOT NULL'
+        ' ON CONFLICT (board_id, day, metric, days)'
+        ' DO UPDATE SET count = count + 1;'
+    )
+
+    conn.execute(text(
+        'CREATE TRIGGER IF NOT EXISTS board_rollups_insert '
+        f'AFTER INSERT ON task_transitions WHEN {when} BEGIN'
+        ' INSERT INTO board_daily_throughput (board_id, day, count)'
+        ' VALUES (new.board_id, date(new.changed_at), 1)'
+        ' ON CONFLICT (board_id, day) DO UPDATE SET count = count + 1;'
+        + add_duration.format(metric='LEAD_TIME', condition='')
+        + add_duration.format(metric='CYCLE_TIME',
+                              condition=" AND to_status != 'TO_DO'")
+        + ' END'
+    ))
+
+
+def _add_task_transitions(conn: Connection) -> None:
+    """Log every task status change and roll completions up per day.
+
+    ``task_transitions`` is an append-only log written by triggers on
+    ``tasks``, kept when tasks are deleted or archived. Every completion
+    logged adds to two daily rollups of its board: ``board_daily_throughput``
+    counts completed tasks, and ``board_daily_durations`` counts them by lead
+    time (days since the task was created) and cycle time (days since it
+    first left the to do status).
+
+    Task IDs can be reused once deleted, so durations only look at the
+    transitions logged since the task was last created. Tasks created before
+    this migration have no known creation time, so they only count towards
+    the throughput.
+    """
+    conn.execute(text(
+        'CREATE TABLE IF NOT EXISTS task_transitions ('
+        ' id INTEGER NOT NULL,'
+        ' task_id INTEGER NOT NULL,'
+        ' board_id INTEGER,'
+        ' from_status VARCHAR(11),'
+        ' to_status VARCHAR(11) NOT NULL,'
+        ' changed_at DATETIME NOT NULL,'
+        ' PRIMARY KEY (id))'
+    ))
+    conn.execute(text(
+        'CREATE INDEX IF NOT EXISTS ix_task_transitions_task_id '
+        'ON task_transitions (task_id)'
+    ))
+    conn.execute(text(
+        'CREATE TABLE IF NOT EXISTS board_daily_throughput ('
+        ' board_id INTEGER NOT NULL,'
+        ' day DATE NOT NULL,'
+        ' count INTEGER NOT NULL,'
+        ' PRIMARY KEY (board_id, day)) WITHOUT ROWID'
+    ))
+    conn.execute(text(
+        'CREATE TABLE IF NOT EXISTS board_daily_durations ('
+        ' board_id INTEGER NOT NULL,'
+        ' day DATE NOT NULL,'
+        ' metric VARCHAR(10) NOT NULL,'
+        ' days INTEGER NOT NULL,'
+        ' count INTEGER NOT NULL,'
+        ' PRIMARY KEY (board_id, day, metric, days)) WITHOUT ROWID'
+    ))
+
+    conn.execute(text(
+        'CREATE TRIGGER IF NOT EXISTS task_transitions_insert '
+        'AFTER INSERT ON tasks BEGIN'
+        ' INSERT INTO task_transitions'
+        ' (task_id, board_id, from_status, to_status, changed_at)'
+        " VALUES (new.id, new.board_id, NULL, new.status,"
+        " datetime('now', 'localtime'));"
+        ' END'
+    ))
+    conn.execute(text(
+        'CREATE TRIGGER IF NOT EXISTS task_transitions_update '
+        'AFTER UPDATE OF status ON tasks '
+        'WHEN old.status IS NOT new.status BEGIN'
+        ' INSERT INTO task_transitions'
+        ' (task_id, board_id, from_status, to_status, changed_at)'
+        ' VALUES (new.id, new.board_id, old.status, new.status,'
+        " datetime('now', 'localtime'));"
+        ' END'
+    ))
+
+    _create_board_rollups_trigger(
+        conn, "new.to_status = 'COMPLETED' AND new.board_id IS NOT NULL"
+    )
+    conn.execute(text(
+        'CREATE TRIGGER IF NOT EXISTS board_rollups_board_delete '
+        'AFTER DELETE ON boards BEGIN'
+        ' DELETE FROM board_daily_throughput WHERE board_id = old.id;'
+        ' DELETE FROM board_daily_durations WHERE board_id = old.id;'
+        ' END'
+    ))
+
+
+def _add_row_versions(conn: Connection) -> None:
+    """Add a version counter to boards and tasks.
+
+    Every update of a row increments its version, and updates made through
+    loaded objects only apply if the version did not change since they were
+    loaded, so concurrent writers cannot silently overwrite each other.
+    """
+    for table in ('boards', 'tasks'):
+        conn.execute(text(
+            f'ALTER TABLE {table} '
+            'ADD COLUMN version INTEGER NOT NULL DEFAULT 1'
+        ))
+
+
+def _add_tasks_due_date_index(conn: Connection) -> None:
+    """Index the open tasks with a due date by due date and status.
+
+    Covers the agenda, which reads ranges of due dates. Completed and undated
+    tasks are left out of the index, so they are never scanned.
+    """
+    conn.execute(text(
+        'CREATE INDEX IF NOT EXISTS ix_tasks_due_date_status '
+        'ON tasks (due_date, status) '
+        "WHERE due_date IS NOT NULL AND status != 'COMPLETED'"
+    ))
+
+
+def _skip_created_tasks_in_rollups(conn: Connection) -> None:
+    """Only roll up the tasks completed through a status change.
+
+    Tasks created or imported as completed were counted as completions of
+    the day they were added, with a lead time of zero days.
+    """
+    conn.execute(text('DROP TRIGGER IF EXISTS board_rollups_insert'))
+    _create_board_rollups_trigger(
+        conn, "new.to_status = 'COMPLETED' AND new.board_id IS NOT NULL"
+        ' AND new.from_status IS NOT NULL'
+    )
+
+
+def _never_reuse_task_ids(conn: Connection) -> None:
+    """Rebuild ``tasks`` with an ``AUTOINCREMENT`` key.
+
+    Without it SQLite gives new tasks the highest ID in the table plus one,
+    so the ID of the last task archived or deleted went to the next task
+    added, while archived tasks and transitions still referred to the old
+    one. The table is rebuilt following SQLite's procedure for schema
+    changes, recreating its indexes and triggers, and the sequence starts
+    after the highest task ID ever recorded.
+    """
+    columns = ('id, title, priority, tag, status, due_date, board_id, '
+               'completed_at, version')
+    schema = conn.execute(text(
+        "SELECT sql FROM sqlite_master WHERE tbl_name = 'tasks'"
+        " AND type IN ('index', 'trigger') AND sql IS NOT NULL"
+    )).scalars().all()
+
+    conn.execute(text(
+        'CREATE TABLE tasks_new ('
+        ' id INTEGER PRIMARY KEY AUTOINCREMENT,'
+        ' title VARCHAR NOT NULL,'
+        ' priority VARCHAR(6) NOT NULL,'
+        ' tag VARCHAR NOT NULL,'
+        ' status VARCHAR(11) NOT NULL,'
+        ' due_date DATE,'
+        ' board_id INTEGER,'
+        ' completed_at DATE,'
+        ' version INTEGER NOT NULL DEFAULT 1,'
+        ' FOREIGN KEY(board_id) REFERENCES boards (id) ON DELETE CASCADE)'
+    ))
+    conn.execute(text(
+        f'INSERT INTO tasks_new ({columns}) SELECT {columns} FROM tasks'
+    ))
+    conn.execute(text('DROP TABLE tasks'))
+    conn.execute(text('ALTER TABLE tasks_new RENAME TO tasks'))
+
+    for sql in schema:
+        conn.exec_driver_sql(sql)
+
+    conn.execute(text("DELETE FROM sqlite_sequence WHERE name = 'tasks'"))
+    conn.execute(text(
+        "INSERT INTO sqlite_sequence (name, seq) SELECT 'tasks', max("
+        ' (SELECT coalesce(max(id), 0) FROM tasks),'
+        ' (SELECT coalesce(max(task_id), 0) FROM archived_tasks),'
+        ' (SELECT coalesce(max(task_id), 0) FROM task_transitions))'
+    ))
+
+
+MIGRATIONS: list[Callable[[Connection], None]] = [
+    _create_base_tables,
+    _add_tasks_board_status_index,
+    _add_tasks_full_text_index,
+    _add_board_summary_tables,
+    _add_task_archive,
+    _add_task_transitions,
+    _add_row_versions,
+    _add_tasks_due_date_index,
+    _skip_created_tasks_in_rollups,
+    _never_reuse_task_ids,
+]
+"""Ordered list of schema migrations."""
+
+LATEST_VERSION = len(MIGRATIONS)
+"""Schema version expected by the models."""
+
+
+def get_version(conn: Connection) -> int:
+    """Return the schema version of a database.
+
+    :param conn: database connection
+    :return: number of migrations applied
+    """
+    return conn.execute(text('PRAGMA user_version')).scalar_one()
+
+
+def migrate(engine: Engine) -> int:
+    """Apply all pending migrations to a database.
+
+    Each migration runs in its own transaction along with the version bump,
+    so an interrupted upgrade can be resumed by running it again.
+
+    :param engine: database engine
+    :return: number of migrations applied
+    """
+    with engine.connect() as conn:
+        version = get_version(conn)
+
+    for index in range(version, LATEST_VERSION):
+        with engine.begin() as conn:
+            # pysqlite does not open transactions for DDL on its own.
+            conn.exec_driver_sql('BEGIN')
+            MIGRATIONS[index](conn)
+            conn.execute(text(f'PRAGMA user_version = {index + 1}'))
+
+    return max(LATEST_VERSION - version, 0)
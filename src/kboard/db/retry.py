@@ -0,0 +1,106 @@
+"""Retry of write transactions that failed because of concurrent writers.
+
+Two kinds of failures are transient: the data file staying locked by another
+writer for longer than the busy timeout, and version conflicts raised when a
+loaded board or task was updated by another process before being flushed.
+Both are solved by rolling back and running the whole transaction again,
+after a random delay so that the competing writers do not collide again.
+"""
+
+import random
+import sqlite3
+import time
+from collections.abc import Callable
+from functools import wraps
+from typing import ParamSpec, TypeVar
+
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.exc import StaleDataError
+
+from ..settings import WRITE_ATTEMPTS
+
+P = ParamSpec('P')
+T = TypeVar('T')
+
+BASE_DELAY = 0.01
+"""Upper bound of the delay before the first retry, in seconds."""
+
+MAX_DELAY = 0.5
+"""Upper bound of the delay before any retry, in seconds."""
+
+
+def is_transient(error: BaseException) -> bool:
+    """Check whether an error is caused by a concurrent writer.
+
+    :param error: raised error
+    :return: whether running the transaction again may succeed
+    """
+    if isinstance(error, StaleDataError):
+        return True
+
+    if isinstance(error, OperationalError):
+        code = getattr(error.orig, 'sqlite_errorcode', None)
+        return code is not None and code & 0xFF in (sqlite3.SQLITE_BUSY,
+                                                     sqlite3.SQLITE_LOCKED)
+
+    return False
+
+
+def backoff(attempt: int) -> float:
+    """Return a random delay before a retry, whose upper bound doubles with
+    every attempt.
+
+    :param attempt: number of failed attempts so far, from 1
+    :return: delay in seconds
+    """
+    return random.uniform(0, min(MAX_DELAY, BASE_DELAY * 2 ** attempt))
+
+
+def retrying(func: Callable[P, T]) -> Callable[P, T]:
+    """Decorate a function running a whole transaction so that it runs again
+    after transient failures, up to :data:`~kboard.settings.WRITE_ATTEMPTS`
+    times.
+
+    The function is expected to roll its transaction back before raising.
+
+    :param func: function to decorate
+    :return: decorated function
+    """
+    @wraps(func)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+        for attempt in range(1, WRITE_ATTEMPTS + 1):
+            try:
+                return func(*args, **kwargs)
+            except (OperationalError, StaleDataError) as e:
+                if attempt == WRITE_ATTEMPTS or not is_transient(e):
+                    raise
+
+            time.sleep(backoff(attempt))
+
+    return wrapper
+
+
+def run_transaction(session: Session, operation: Callable[[], T]) -> T:
+    """Run an operation and commit it, running both again after transient
+    failures.
+
+    The session is rolled back before every retry, which expires its loaded
+    objects, so the operation must load again everything it changes.
+
+    :param session: database session
+    :param operation: function making the changes
+    :return: operation result
+    """
+    @retrying
+    def attempt() -> T:
+        try:
+            result = operation()
+            session.commit()
+        except (OperationalError, StaleDataError):
+            session.rollback()
+            raise
+
+        return result
+
+    return attempt()
@@ -22,3 +22,37 @@ class Status(int, Enum):
     IN_PROGRESS = 2
     REVIEW = 3
     COMPLETED = 4
+
+
+class FlowMetric(int, Enum):
+    """Duration measured between task status changes.
+    """
+
+    LEAD_TIME = 1
+    CYCLE_TIME = 2
+
+
+class DueBucket(int, Enum):
+    """Group of open tasks by due date, relative to the current day.
+    """
+
+    OVERDUE = 1
+    TODAY = 2
+    THIS_WEEK = 3
+
+
+class OutputFormat(str, Enum):
+    """Format of the command output.
+    """
+
+    TABLE = 'table'
+    JSON = 'json'
+    NDJSON = 'ndjson'
+
+
+class FileFormat(str, Enum):
+    """Format of the files used to import and export tasks.
+    """
+
+    CSV = 'csv'
+    JSONL = 'jsonl'
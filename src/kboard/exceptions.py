@@ -7,3 +7,11 @@ class BoardNotFoundError(Exception):
 
 class TaskNotFoundError(Exception):
     ...
+
+
+class WorkspaceNotFoundError(Exception):
+    ...
+
+
+class WorkspaceOutdatedError(Exception):
+    ...
@@ -1,12 +1,12 @@
 """This module declares all the database models and their relationships.
 """
 
-from datetime import date
+from datetime import date, datetime
 from typing import overload
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index, text
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
-from .enums import Priority, Status
+from .enums import FlowMetric, Priority, Status
 
 
 class Base(DeclarativeBase):
@@ -31,6 +31,9 @@ class Board(Base):
 
     id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str]
+    version: Mapped[int] = mapped_column(default=1)
+
+    __mapper_args__ = {'version_id_col': version}
 
     tasks: Mapped[list['Task']] = relationship(back_populates='board',
                                                cascade='all, delete',
@@ -39,9 +42,22 @@ class Board(Base):
 
 class Task(Base):
     """Unit of work that can be moved across a board.
+
+    Like boards, tasks carry a version incremented by every update. Flushing
+    a loaded task whose row was updated by someone else since it was loaded
+    raises :class:`~sqlalchemy.orm.exc.StaleDataError` instead of overwriting
+    the other change. Task IDs are never reused, so archived tasks and logged
+    transitions keep referring to a single task.
     """
 
     __tablename__ = 'tasks'
+    __table_args__ = (
+        Index('ix_tasks_board_id_status', 'board_id', 'status'),
+        Index('ix_tasks_due_date_status', 'due_date', 'status',
+              sqlite_where=text("due_date IS NOT NULL AND "
+                                "status != 'COMPLETED'")),
+        {'sqlite_autoincrement': True},
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     title: Mapped[str]
@@ -51,6 +67,10 @@ class Task(Base):
     due_date: Mapped[date | None]
     board_id: Mapped[int | None] = mapped_column(
         ForeignKey('boards.id', ondelete='CASCADE'))
+    completed_at: Mapped[date | None]
+    version: Mapped[int] = mapped_column(default=1)
+
+    __mapper_args__ = {'version_id_col': version}
 
     board: Mapped[Board | None] = relationship(back_populates='tasks')
 
@@ -77,3 +97,108 @@ class Task(Base):
         for attr, value in kwargs.items():
             if value is not None:
                 setattr(self, attr, value)
+
+
+class ArchivedTask(Base):
+    """Copy of a task moved out of the tasks table by archiving its board.
+
+    The board name is kept along with its ID, so archived tasks still make
+    sense after their board is deleted.
+    """
+
+    __tablename__ = 'archived_tasks'
+    __table_args__ = (
+        Index('ix_archived_tasks_board_id', 'board_id'),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    task_id: Mapped[int]
+    title: Mapped[str]
+    priority: Mapped[Priority]
+    tag: Mapped[str]
+    status: Mapped[Status]
+    due_date: Mapped[date | None]
+    board_id: Mapped[int | None]
+    board_name: Mapped[str | None]
+    completed_at: Mapped[date | None]
+    archived_at: Mapped[date]
+
+
+class TaskTransition(Base):
+    """Status change of a task, from an append-only log written by database
+    triggers.
+
+    The creation of a task is logged as a transition without a previous
+    status.
+    """
+
+    __tablename__ = 'task_transitions'
+    __table_args__ = (
+        Index('ix_task_transitions_task_id', 'task_id'),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    task_id: Mapped[int]
+    board_id: Mapped[int | None]
+    from_status: Mapped[Status | None]
+    to_status: Mapped[Status]
+    changed_at: Mapped[datetime]
+
+
+class BoardDailyThroughput(Base):
+    """Number of tasks of a board completed on a given day.
+
+    Rows are maintained by database triggers on the transition log.
+    """
+
+    __tablename__ = 'board_daily_throughput'
+    __table_args__ = {'sqlite_with_rowid': False}
+
+    board_id: Mapped[int] = mapped_column(primary_key=True)
+    day: Mapped[date] = mapped_column(primary_key=True)
+    count: Mapped[int]
+
+
+class BoardDailyDuration(Base):
+    """Number of tasks of a board completed on a given day that took a given
+    number of days, by flow metric.
+
+    Rows are maintained by database triggers on the transition log.
+    """
+
+    __tablename__ = 'board_daily_durations'
+    __table_args__ = {'sqlite_with_rowid': False}
+
+    board_id: Mapped[int] = mapped_column(primary_key=True)
+    day: Mapped[date] = mapped_column(primary_key=True)
+    metric: Mapped[FlowMetric] = mapped_column(primary_key=True)
+    days: Mapped[int] = mapped_column(primary_key=True)
+    count: Mapped[int]
+
+
+class BoardTaskCount(Base):
+    """Number of tasks of a board in a given status.
+
+    Rows are maintained by database triggers on the tasks table.
+    """
+
+    __tablename__ = 'board_task_counts'
+    __table_args__ = {'sqlite_with_rowid': False}
+
+    board_id: Mapped[int] = mapped_column(primary_key=True)
+    status: Mapped[Status] = mapped_column(primary_key=True)
+    count: Mapped[int]
+
+
+class BoardDueCount(Base):
+    """Number of open tasks of a board due on a given date.
+
+    Rows are maintained by database triggers on the tasks table.
+    """
+
+    __tablename__ = 'board_due_counts'
+    __table_args__ = {'sqlite_with_rowid': False}
+
+    board_id: Mapped[int] = mapped_column(primary_key=True)
+    due_date: Mapped[date] = mapped_column(primary_key=True)
+    count: Mapped[int]
@@ -0,0 +1,308 @@
+"""Opt-in profiler to find where the time of a command goes.
+
+Profiling is enabled with the global ``--profile`` option, which prints a
+summary to stderr, or the ``KBOARD_TRACE`` environment variable, which writes
+a JSON trace to the file it names. While disabled, every hook in this module
+is a no-op, and the module only imports the standard library so it can be
+loaded by the CLI entry point without slowing it down.
+
+Phases overlap: SQL statements run inside the command, and rich lays out the
+tables built by the renderers while printing them, so the time spent writing
+to the terminal is reported apart from the layout. The build phase only
+covers creating the tables, not printing them.
+"""
+
+import json
+import sys
+from collections import defaultdict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, TextIO
+
+if TYPE_CHECKING:
+    from rich.console import Console
+    from sqlalchemy import Engine
+
+
+LOADED_AT = perf_counter()
+"""Time at which kboard started loading."""
+
+
+class _TimedFile:
+    """File proxy that measures the time spent writing to the terminal.
+    """
+
+    def __init__(self, file: TextIO, profiler: 'Profiler'):
+        self._file = file
+        self._profiler = profiler
+
+    def write(self, text: str) -> int:
+        start = perf_counter()
+
+        try:
+            return self._file.write(text)
+        finally:
+            self._profiler.add('terminal', perf_counter() - start)
+
+    def flush(self) -> None:
+        start = perf_counter()
+
+        try:
+            self._file.flush()
+        finally:
+            self._profiler.add('terminal', perf_counter() - start)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._file, name)
+
+
+class Profiler:
+    """Collector of phase durations, SQL statements and build spans.
+    """
+
+    TOP_STATEMENTS = 5
+    """Number of slowest statements listed in the summary."""
+
+    def __init__(self, start: float):
+        """Initialise an empty profile.
+
+        :param start: time the profile starts at
+        """
+        self.start = start
+        self.phases: dict[str, float] = defaultdict(float)
+        self.statements: list[tuple[str, float]] = []
+        self.builds: list[tuple[str, float]] = []
+        self._engines: list['Engine'] = []
+        self._restore: list[Callable[[], None]] = []
+
+    def add(self, name: str, seconds: float) -> None:
+        """Add time to a phase.
+
+        :param name: phase name
+        :param seconds: elapsed time
+        """
+        self.phases[name] += seconds
+
+    @contextmanager
+    def phase(self, name: str, label: str | None = None) -> Iterator[None]:
+        """Measure a block of code as part of a phase.
+
+        :param name: phase name
+        :param label: build span label, e.g. the built board
+        """
+        start = perf_counter()
+
+        try:
+            yield
+        finally:
+            elapsed = perf_counter() - start
+            self.add(name, elapsed)
+
+            if label is not None:
+                self.builds.append((label, elapsed))
+
+    def watch_engine(self, engine: 'Engine') -> None:
+        """Record every SQL statement executed by an engine.
+
+        :param engine: database engine
+        """
+        if engine in self._engines:
+            return
+
+        from sqlalchemy import event
+
+        def before(conn, cursor, statement, parameters, context, many):
+            conn.info.setdefault('profile_start', []).append(perf_counter())
+
+        def after(conn, cursor, statement, parameters, context, many):
+            elapsed = perf_counter() - conn.info['profile_start'].pop()
+            self.add('sql', elapsed)
+            self.statements.append((statement, elapsed))
+
+        event.listen(engine, 'before_cursor_execute', before)
+        event.listen(engine, 'after_cursor_execute', after)
+        self._engines.append(engine)
+
+        def remove():
+            event.remove(engine, 'before_cursor_execute', before)
+            event.remove(engine, 'after_cursor_execute', after)
+
+        self._restore.append(remove)
+
+    def watch_console(self, console: 'Console') -> None:
+        """Measure the time spent printing to a console, splitting the layout
+        done by rich from the writes to the terminal.
+
+        :param console: rich console
+        """
+        file = console.file
+        print_ = console.print
+
+        def timed_print(*args, **kwargs):
+            start = perf_counter()
+
+            try:
+                return print_(*args, **kwargs)
+            finally:
+                self.add('output', perf_counter() - start)
+
+        console.file = _TimedFile(file, self)
+        console.print = timed_print
+
+        def restore():
+            console.file = file
+            del console.print
+
+        self._restore.append(restore)
+
+    def stop(self) -> None:
+        """Stop recording and remove every hook.
+        """
+        self.add('total', perf_counter() - self.start)
+
+        for restore in reversed(self._restore):
+            restore()
+
+        self._restore.clear()
+        self._engines.clear()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the profile as a JSON-compatible mapping.
+
+        :return: phase, statement and build durations in milliseconds
+        """
+        phases = {name: seconds * 1000
+                  for name, seconds in self.phases.items()}
+        phases['layout'] = phases.get('output', 0) - phases.get('terminal', 0)
+
+        return {
+            'argv': sys.argv,
+            'phases_ms': {k: round(v, 3) for k, v in phases.items()},
+            'statements': [{'sql': sql, 'ms': round(s * 1000, 3)}
+                           for sql, s in self.statements],
+            'builds': [{'label': label, 'ms': round(s * 1000, 3)}
+                        for label, s in self.builds],
+        }
+
+    def print_summary(self, file: TextIO) -> None:
+        """Print a human readable summary of the profile.
+
+        :param file: file to print to
+        """
+        phases = self.to_dict()['phases_ms']
+        details = {
+            'sql': f'{len(self.statements)} statement(s)',
+            'build': f'{len(self.builds)} table(s) or board(s) built',
+            'terminal': 'writing to the terminal',
+            'layout': 'rich layout while printing',
+        }
+
+        print('Profile (ms)', file=file)
+
+        for name in ('startup', 'imports', 'sql', 'build', 'layout',
+                     'terminal', 'total'):
+            if name in phases:
+                print(f'  {name:<10}{phases[name]:>10.1f}  '
+                      f'{details.get(name, "")}'.rstrip(), file=file)
+
+        slowest = sorted(self.statements, key=lambda s: s[1], reverse=True)
+
+        for sql, seconds in slowest[:self.TOP_STATEMENTS]:
+            sql = ' '.join(sql.split())
+            print(f'  {seconds * 1000:>10.1f}ms  {sql[:100]}', file=file)
+
+        for label, seconds in sorted(self.builds, key=lambda r: r[1],
+                                     reverse=True)[:self.TOP_STATEMENTS]:
+            print(f'  {seconds * 1000:>10.1f}ms  build {label}', file=file)
+
+    def write_trace(self, path: Path) -> None:
+        """Write the profile as a JSON trace file.
+
+        :param path: file to write
+        """
+        path.write_text(json.dumps(self.to_dict(), indent=2) + '\n')
+
+
+profiler: Profiler | None = None
+"""Profiler of the running command, None when profiling is disabled."""
+
+_startup_pending = True
+"""Whether the next profile includes the start-up of the process."""
+
+
+def skip_startup() -> None:
+    """Start the following profiles when their command starts, for processes
+    that run several commands such as the shell and the daemon.
+    """
+    global _startup_pending
+
+    _startup_pending = False
+
+
+def start() -> Profiler:
+    """Start profiling the running command.
+
+    The first profile of a process starts when kboard started loading, so it
+    includes the CLI start-up.
+
+    :return: active profiler
+    """
+    global profiler
+
+    now = perf_counter()
+
+    if _startup_pending:
+        profiler = Profiler(LOADED_AT)
+        profiler.add('startup', now - LOADED_AT)
+        skip_startup()
+    else:
+        profiler = Profiler(now)
+
+    return profiler
+
+
+def finish(summary: bool, trace_path: Path | None) -> None:
+    """Stop profiling and report the results.
+
+    :param summary: whether to print a summary to stderr
+    :param trace_path: file to write the JSON trace to, None to skip it
+    """
+    global profiler
+
+    if profiler is None:
+        return
+
+    profiler.stop()
+
+    if summary:
+        profiler.print_summary(sys.stderr)
+    if trace_path is not None:
+        profiler.write_trace(trace_path)
+
+    profiler = None
+
+
+@contextmanager
+def phase(name: str, label: str | None = None) -> Iterator[None]:
+    """Measure a block of code as part of a phase, if profiling.
+
+    :param name: phase name
+    :param label: build span label, e.g. the built board
+    """
+    if profiler is None:
+        yield
+        return
+
+    with profiler.phase(name, label):
+        yield
+
+
+def watch_engine(engine: 'Engine') -> None:
+    """Record the SQL statements executed by an engine, if profiling.
+
+    :param engine: database engine
+    """
+    if profiler is not None:
+        profiler.watch_engine(engine)
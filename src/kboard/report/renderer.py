@@ -0,0 +1,71 @@
+"""This module exports the renderer class for flow reports.
+"""
+
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from rich import box
+from rich.table import Table
+from rich.text import Text
+
+
+class ReportRenderer:
+    """Class responsible for defining how flow reports should be displayed.
+    """
+
+    BARS = '▁▂▃▄▅▆▇█'
+    """Characters of the weekly throughput sparkline, from lowest."""
+
+    @classmethod
+    def _sparkline(cls, counts: Sequence[int]) -> str:
+        """Draw a sequence of counts as a line of bars.
+
+        :param counts: counts to draw
+        :return: sparkline
+        """
+        top = max(counts, default=0) or 1
+
+        return ''.join(cls.BARS[round(c / top * (len(cls.BARS) - 1))]
+                       for c in counts)
+
+    @staticmethod
+    def _format_percentiles(values: Mapping[str, int | None]) -> str:
+        """Join percentile durations in a single cell.
+
+        :param values: mapping of percentile names and durations
+        :return: durations separated by slashes, dashes for missing ones
+        """
+        return ' / '.join('-' if v is None else str(v)
+                          for v in values.values())
+
+    @classmethod
+    def to_table(cls, reports: Sequence[Mapping[str, Any]],
+                 days: int) -> Table:
+        """Return a rich table with the flow metrics of every board.
+
+        :param reports: board reports
+        :param days: number of days reported on
+        :return: rich table
+        """
+        table = Table(title=f'Flow over the last {days} day(s)',
+                      box=box.DOUBLE, expand=True,
+                      caption='Times in days, as 50th / 85th / 95th '
+                      'percentiles.')
+        table.add_column('ID', justify='right')
+        table.add_column('Name', style='cyan')
+        table.add_column('Completed', justify='right')
+        table.add_column('Per week', justify='right')
+        table.add_column('Weekly', style='green')
+        table.add_column('Cycle time', justify='right')
+        table.add_column('Lead time', justify='right')
+
+        for report in reports:
+            table.add_row(
+                str(report['board_id']), Text(report['board_name']),
+                str(report['completed']), f'{report["per_week"]:.1f}',
+                cls._sparkline(list(report['weekly'].values())),
+                cls._format_percentiles(report['cycle_time']),
+                cls._format_percentiles(report['lead_time'])
+            )
+
+        return table
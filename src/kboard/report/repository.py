@@ -0,0 +1,71 @@
+"""This module defines the repository class for the flow report rollups.
+"""
+
+from collections.abc import Collection, Sequence
+from datetime import date
+
+from sqlalchemy import Row, func, select
+from sqlalchemy.orm import Session
+
+from ..models import BoardDailyDuration, BoardDailyThroughput
+
+
+class ReportRepository:
+    """Repository responsible for reading the daily rollups of completed
+    tasks, maintained by database triggers on the transition log.
+    """
+
+    def __init__(self, session: Session):
+        """Initialise the repository with a database session.
+
+        :param session: SQLAlchemy session
+        """
+        self.session = session
+
+    def weekly_throughput(self, since: date,
+                          board_ids: Collection[int] | None = None
+                          ) -> Sequence[Row]:
+        """Return the number of tasks completed per board and week.
+
+        :param since: first day counted
+        :param board_ids: only count these boards, None for all
+        :return: rows of board ID, Monday of the week and completed tasks
+        """
+        week = func.date(BoardDailyThroughput.day, 'weekday 0', '-6 days')
+        query = (
+            select(BoardDailyThroughput.board_id, week,
+                   func.sum(BoardDailyThroughput.count))
+            .where(BoardDailyThroughput.day >= since)
+            .group_by(BoardDailyThroughput.board_id, week)
+        )
+
+        if board_ids is not None:
+            query = query.where(BoardDailyThroughput.board_id.in_(board_ids))
+
+        return self.session.execute(query).all()
+
+    def duration_histogram(self, since: date,
+                           board_ids: Collection[int] | None = None
+                           ) -> Sequence[Row]:
+        """Return the number of tasks completed per board, metric and
+        duration.
+
+        :param since: first day counted
+        :param board_ids: only count these boards, None for all
+        :return: rows of board ID, flow metric, duration in days and
+            completed tasks, ordered by duration
+        """
+        query = (
+            select(BoardDailyDuration.board_id, BoardDailyDuration.metric,
+                   BoardDailyDuration.days,
+                   func.sum(BoardDailyDuration.count))
+            .where(BoardDailyDuration.day >= since)
+            .group_by(BoardDailyDuration.board_id, BoardDailyDuration.metric,
+                      BoardDailyDuration.days)
+            .order_by(BoardDailyDuration.days)
+        )
+
+        if board_ids is not None:
+            query = query.where(BoardDailyDuration.board_id.in_(board_ids))
+
+        return self.session.execute(query).all()
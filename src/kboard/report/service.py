@@ -0,0 +1,110 @@
+"""This module exports the service class for flow reports.
+"""
+
+import math
+from collections import defaultdict
+from collections.abc import Collection, Sequence
+from datetime import date, timedelta
+from typing import Any
+
+from .repository import ReportRepository
+from ..board.repository import BoardRepository
+from ..enums import FlowMetric
+
+
+class ReportService:
+    """Application service responsible for flow metrics of boards.
+
+    Reports are computed from daily rollups of completed tasks, so their cost
+    depends on the number of days reported on, not on the length of the task
+    history.
+    """
+
+    PERCENTILES = (50, 85, 95)
+    """Percentiles of the lead and cycle times reported."""
+
+    def __init__(self, report_repo: ReportRepository,
+                 board_repo: BoardRepository):
+        """Initialise the service with repositories.
+
+        :param report_repo: report repository
+        :param board_repo: board repository
+        """
+        self.report_repo = report_repo
+        self.board_repo = board_repo
+
+    @classmethod
+    def _percentiles(cls, histogram: Sequence[tuple[int, int]]
+                     ) -> dict[str, int | None]:
+        """Compute nearest-rank percentiles from a histogram.
+
+        :param histogram: durations in days and their number of tasks,
+            ordered by duration
+        :return: mapping of percentile names and durations, None without
+            data
+        """
+        total = sum(count for _, count in histogram)
+        result = {}
+
+        for p in cls.PERCENTILES:
+            rank = math.ceil(p / 100 * total)
+            seen = 0
+            result[f'p{p}'] = None
+
+            for days, count in histogram:
+                seen += count
+
+                if total and seen >= rank:
+                    result[f'p{p}'] = days
+                    break
+
+        return result
+
+    def flow_report(self, days: int = 90,
+                    board_ids: Collection[int] | None = None
+                    ) -> list[dict[str, Any]]:
+        """Compute the throughput, lead time and cycle time of boards over
+        the last days.
+
+        :param days: number of days reported on, including today
+        :param board_ids: only report on these boards, None for all
+        :return: one JSON-compatible report per board, ordered by board ID
+        """
+        today = date.today()
+        since = today - timedelta(days=days - 1)
+        boards = self.board_repo.list_rows(board_ids)
+        ids = [board_id for board_id, _ in boards]
+
+        first_week = since - timedelta(days=since.weekday())
+        weeks = [first_week + timedelta(weeks=i)
+                 for i in range((today - first_week).days // 7 + 1)]
+
+        weekly = defaultdict(dict)
+        for board_id, week, count in self.report_repo.weekly_throughput(
+                since, ids):
+            weekly[board_id][week] = count
+
+        histograms = defaultdict(list)
+        for board_id, metric, duration, count in \
+                self.report_repo.duration_histogram(since, ids):
+            histograms[board_id, metric].append((duration, count))
+
+        reports = []
+
+        for board_id, name in boards:
+            counts = [weekly[board_id].get(w.isoformat(), 0) for w in weeks]
+            completed = sum(counts)
+
+            reports.append({
+                'board_id': board_id,
+                'board_name': name,
+                'completed': completed,
+                'per_week': round(completed * 7 / days, 1),
+                'weekly': {w.isoformat(): c for w, c in zip(weeks, counts)},
+                'lead_time': self._percentiles(
+                    histograms[board_id, FlowMetric.LEAD_TIME]),
+                'cycle_time': self._percentiles(
+                    histograms[board_id, FlowMetric.CYCLE_TIME]),
+            })
+
+        return reports
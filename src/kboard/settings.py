@@ -2,13 +2,60 @@
 """
 
 import os
+import re
 from pathlib import Path
 
 from .enums import Status
 
 
 DB_PATH = Path(os.environ.get('KBOARD_HOME', Path.home())) / '.kboard.db'
-"""Location to the SQLite file.
+"""Location to the SQLite file of the default workspace.
+"""
+
+DEFAULT_WORKSPACE = 'default'
+"""Name of the workspace stored in :data:`DB_PATH`.
+"""
+
+WORKSPACE = os.environ.get('KBOARD_WORKSPACE') or DEFAULT_WORKSPACE
+"""Workspace used when a command does not select one.
+"""
+
+HISTORY_PATH = DB_PATH.parent / '.kboard_history'
+"""Location to the interactive shell history file.
+"""
+
+SOCKET_PATH = DB_PATH.parent / '.kboard.sock'
+"""Location to the Unix socket the daemon listens on.
+"""
+
+DAEMON_ENABLED = os.environ.get('KBOARD_NO_DAEMON') is None
+"""Whether commands are forwarded to the daemon when it is running.
+"""
+
+TRACE_PATH = (Path(os.environ['KBOARD_TRACE'])
+              if os.environ.get('KBOARD_TRACE') else None)
+"""File to write a JSON profile of every command to, if set.
+"""
+
+DB_PRAGMAS: dict[str, str] = {
+    'journal_mode': os.environ.get('KBOARD_JOURNAL_MODE', 'WAL'),
+    'synchronous': os.environ.get('KBOARD_SYNCHRONOUS', 'NORMAL'),
+    'busy_timeout': os.environ.get('KBOARD_BUSY_TIMEOUT', '5000'),
+    'mmap_size': os.environ.get('KBOARD_MMAP_SIZE', '268435456'),
+    'cache_size': os.environ.get('KBOARD_CACHE_SIZE', '-32000'),
+    'temp_store': os.environ.get('KBOARD_TEMP_STORE', 'MEMORY'),
+}
+"""SQLite pragmas applied to every new connection.
+
+Defaults favour concurrent throughput: WAL lets readers run alongside a
+writer, ``synchronous=NORMAL`` skips the fsync on every commit (safe in WAL
+mode), writers wait up to 5 seconds for a lock instead of failing, and reads
+go through a 256 MiB memory map and a 32 MiB page cache.
+"""
+
+WRITE_ATTEMPTS = int(os.environ.get('KBOARD_WRITE_ATTEMPTS', '10'))
+"""Number of times a write is attempted when the data file stays locked or
+another process changed the same rows concurrently.
 """
 
 STATUS_NAMES: dict[Status, str] = {
@@ -26,3 +73,23 @@ STATUS_COLOURS: dict[Status, str] = {
     Status.COMPLETED: 'green',
 }
 """Display colour for each status."""
+
+
+def workspace_path(name: str) -> Path:
+    """Return the location of the SQLite file of a workspace.
+
+    Every workspace has its own file, next to the default one, so writes to
+    different workspaces never wait for each other.
+
+    :param name: workspace name
+    :raises ValueError: if the name is not made of letters, digits, dashes
+        and underscores
+    :return: data file path
+    """
+    if name == DEFAULT_WORKSPACE:
+        return DB_PATH
+
+    if not re.fullmatch(r'[\w-]+', name):
+        raise ValueError(f'Invalid workspace name "{name}".')
+
+    return DB_PATH.parent / f'.kboard-{name}.db'
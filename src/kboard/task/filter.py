@@ -0,0 +1,73 @@
+"""This module exports the criteria class used to select which tasks are
+displayed.
+"""
+
+from collections.abc import Iterable, Sequence
+from datetime import date, datetime
+
+from ..enums import Priority, Status
+
+
+IdRanges = Sequence[tuple[int, int]]
+"""Inclusive ranges of task IDs, sorted and without overlaps."""
+
+
+def merge_ranges(ranges: Iterable[tuple[int, int]]) -> list[tuple[int, int]]:
+    """Sort inclusive ID ranges and merge the ones that overlap.
+
+    Ranges that only touch are kept apart, so that each of them must still
+    match a task on its own.
+
+    :param ranges: first and last ID of every range
+    :return: sorted ranges without overlaps
+    """
+    merged = []
+
+    for first, last in sorted(ranges):
+        if merged and first <= merged[-1][1]:
+            merged[-1] = merged[-1][0], max(merged[-1][1], last)
+        else:
+            merged.append((first, last))
+
+    return merged
+
+
+class TaskFilter:
+    """Criteria a task must match to be displayed.
+
+    Every criterion is optional, and a task must match all the given ones.
+    The filter is compiled into the WHERE clause of the task queries by the
+    task repository, so tasks that do not match are never loaded.
+    """
+
+    def __init__(self, tag: str | None = None,
+                 priorities: Iterable[Priority] = (),
+                 statuses: Iterable[Status] = (),
+                 due_before: date | None = None,
+                 due_after: date | None = None):
+        """Initialise the filter with its criteria.
+
+        :param tag: exact task tag
+        :param priorities: accepted priorities, empty for any
+        :param statuses: accepted statuses, empty for any
+        :param due_before: latest due date, inclusive
+        :param due_after: earliest due date, inclusive
+        """
+        self.tag = tag
+        self.priorities = frozenset(priorities)
+        self.statuses = frozenset(statuses)
+        self.due_before = self._to_date(due_before)
+        self.due_after = self._to_date(due_after)
+
+    @staticmethod
+    def _to_date(value: date | None) -> date | None:
+        """Drop the time part of the dates parsed by the CLI.
+
+        :param value: date or datetime
+        :return: date
+        """
+        return value.date() if isinstance(value, datetime) else value
+
+    def __bool__(self) -> bool:
+        return bool(self.tag is not None or self.priorities or self.statuses
+                    or self.due_before or self.due_after)
@@ -2,58 +2,122 @@
 """
 
 from datetime import date
+from functools import lru_cache
 
+from rich.console import Console, ConsoleOptions, RenderResult
+from rich.measure import Measurement
 from rich.panel import Panel
+from rich.segment import Segment
 
 from ..settings import STATUS_COLOURS
 from ..enums import Priority, Status
 from ..models import Task
 
 
+class _MemoisedPanel(Panel):
+    """Panel that remembers its rendered lines and measurement for each
+    width it was laid out at.
+
+    Rich lays out every panel again each time a view is printed, which costs
+    far more than building the panels. Since unchanged tasks get the same
+    panel from the LRU cache, the layout is only done once per task, width
+    and console encoding in processes that print several views, such as the
+    shell and the daemon. The encoding is part of the key because consoles
+    that cannot encode box characters draw the borders in ASCII.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._lines: dict[tuple, list[Segment]] = {}
+        self._measurements: dict[int, Measurement] = {}
+
+    def __rich_console__(self, console: Console,
+                         options: ConsoleOptions) -> RenderResult:
+        key = (options.max_width, options.height, options.justify,
+               options.overflow, options.no_wrap, options.encoding,
+               options.ascii_only, options.legacy_windows)
+
+        if key not in self._lines:
+            self._lines[key] = list(super().__rich_console__(console,
+                                                             options))
+
+        yield from self._lines[key]
+
+    def __rich_measure__(self, console: Console,
+                         options: ConsoleOptions) -> Measurement:
+        if options.max_width not in self._measurements:
+            self._measurements[options.max_width] = super().__rich_measure__(
+                console, options)
+
+        return self._measurements[options.max_width]
+
+
 class TaskRenderer:
     """Class responsible for defining how a task should be displayed.
+
+    Rendered panels are memoised in a bounded LRU cache keyed by every task
+    field shown in the panel and the current date, so an edited task (or a
+    new day) never reuses a stale panel.
     """
 
+    CACHE_SIZE = 16384
+    """Maximum number of rendered panels kept in memory."""
+
     @staticmethod
-    def _build_subtitle(task: Task) -> str | None:
+    def _build_subtitle(due_date: date | None, status: Status,
+                        today: date) -> str | None:
         """Helper function to generate the subtitle of a task panel.
 
-        :param task: task object
+        :param due_date: task due date
+        :param status: task status
+        :param today: current date
         :return: subtitle as string
         """
-        if not task.due_date:
+        if not due_date:
             return None
 
-        today = date.today()
-
-        if task.status == Status.COMPLETED or task.due_date > today:
+        if status == Status.COMPLETED or due_date > today:
             colour = 'default'
-        elif task.due_date == today:
+        elif due_date == today:
             colour = 'yellow'
         else:
             colour = 'red'
 
-        return f'[{colour}]{task.due_date}[/]'
+        return f'[{colour}]{due_date}[/]'
 
-    @classmethod
-    def to_panel(cls, task: Task) -> Panel:
-        """Generate a rich displayable panel representing a Kanban task.
+    @staticmethod
+    @lru_cache(maxsize=CACHE_SIZE)
+    def _build_panel(task_id: int, title: str, priority: Priority, tag: str,
+                     status: Status, due_date: date | None,
+                     today: date) -> Panel:
+        """Generate the panel for the given task fields.
 
-        :param task: task object
         :return: rich panel
         """
-        content = task.title
+        content = title
 
-        if task.priority == Priority.LOW:
+        if priority == Priority.LOW:
             content = f'[bright_black]{content}[/]'
-        elif task.priority == Priority.HIGH:
+        elif priority == Priority.HIGH:
             content = f'[yellow]\\[!][/] {content}'
 
-        if task.tag:
-            content += f' ([cyan]{task.tag}[/])'
+        if tag:
+            content += f' ([cyan]{tag}[/])'
+
+        subtitle = TaskRenderer._build_subtitle(due_date, status, today)
 
-        subtitle = cls._build_subtitle(task)
+        return _MemoisedPanel(content, title=str(task_id), title_align='left',
+                              border_style=STATUS_COLOURS[status],
+                              subtitle=subtitle, subtitle_align='right')
 
-        return Panel(content, title=str(task.id), title_align='left',
-                     border_style=STATUS_COLOURS[task.status],
-                     subtitle=subtitle, subtitle_align='right')
+    @classmethod
+    def to_panel(cls, task: Task, today: date | None = None) -> Panel:
+        """Generate a rich displayable panel representing a Kanban task.
+
+        :param task: task object
+        :param today: current date, pass it when rendering many tasks at once
+        :return: rich panel
+        """
+        return cls._build_panel(task.id, task.title, task.priority, task.tag,
+                                task.status, task.due_date,
+                                today or date.today())
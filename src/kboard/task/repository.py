@@ -1,15 +1,22 @@
 """This module defines the repository class for the Task model.
 """
 
-from collections.abc import Sequence
+from collections.abc import Collection, Iterator, Mapping, Sequence
+from typing import Any
 
-from sqlalchemy import delete, select
-from sqlalchemy.orm import Session
+from sqlalchemy import (ColumnElement, Row, Select, case, column, delete,
+                        func, insert, literal, or_, select, table, update)
+from sqlalchemy.orm import Session, aliased
 
+from .filter import IdRanges, TaskFilter
 from ..enums import Status
 from ..models import Task
 
 
+tasks_fts = table('tasks_fts', column('rowid'), column('rank'))
+"""Full-text index of task titles and tags, maintained by triggers."""
+
+
 class TaskRepository:
     """Repository responsible for persistence operations related to Task
     entities.
@@ -37,6 +44,62 @@ class TaskRepository:
         """
         self.session.add(task)
 
+    def add_many(self, values: Sequence[Mapping[str, Any]]) -> None:
+        """Insert multiple tasks in a single bulk statement.
+
+        :param values: mappings of task attributes and values
+        """
+        if values:
+            self.session.execute(insert(Task), values)
+
+    @staticmethod
+    def _columns(task: Any = Task) -> tuple[Any, ...]:
+        """Return the columns selected to read tasks as plain rows.
+
+        :param task: task entity or alias to select from
+        :return: task columns
+        """
+        return (task.id, task.title, task.priority, task.tag, task.status,
+                task.due_date, task.board_id)
+
+    def iter_rows(self, batch_size: int = 1000) -> Iterator[Row]:
+        """Stream the columns of all tasks, fetching them in batches.
+
+        :param batch_size: number of rows fetched at a time
+        :return: iterator of task rows
+        """
+        return iter(self.session.execute(
+            select(*self._columns())
+            .order_by(Task.id)
+            .execution_options(yield_per=batch_size)
+        ))
+
+    @staticmethod
+    def _in_ranges(ranges: IdRanges) -> ColumnElement[bool]:
+        """Build the condition to select the tasks of some ID ranges.
+
+        Every range is a primary key range scan, whatever its length, so the
+        number of bound parameters only depends on the number of ranges.
+
+        :param ranges: inclusive ID ranges
+        :return: SQL condition
+        """
+        return or_(*(Task.id == first if first == last
+                     else Task.id.between(first, last)
+                     for first, last in ranges))
+
+    def list_rows(self, ranges: IdRanges) -> Sequence[Row]:
+        """Return the columns of the tasks of some ID ranges.
+
+        :param ranges: inclusive ID ranges
+        :return: list of task rows ordered by ID
+        """
+        return self.session.execute(
+            select(*self._columns())
+            .where(self._in_ranges(ranges))
+            .order_by(Task.id)
+        ).all()
+
     def delete(self, task: Task) -> None:
         """Delete a task from the session.
 
@@ -44,6 +107,254 @@ class TaskRepository:
         """
         self.session.delete(task)
 
+    def count_per_range(self, ranges: IdRanges) -> list[int]:
+        """Count the existing tasks of every ID range in a single query.
+
+        :param ranges: inclusive ID ranges
+        :return: number of tasks of every range, in order
+        """
+        conditions = [self._in_ranges([r]) for r in ranges]
+
+        return list(self.session.execute(
+            select(*(func.count().filter(c) for c in conditions))
+            .where(or_(*conditions))
+        ).one())
+
+    def first_board_id(self, ranges: IdRanges) -> int | None:
+        """Return the board ID of the first task of some ID ranges.
+
+        :param ranges: inclusive ID ranges
+        :return: board ID, None if the task is in the backlog
+        """
+        return self.session.execute(
+            select(Task.board_id).where(self._in_ranges(ranges))
+            .order_by(Task.id).limit(1)
+        ).scalar()
+
+    def update_many(self, ranges: IdRanges,
+                    values: Mapping[str, Any]) -> Sequence[int | None]:
+        """Update the same attributes of multiple tasks in a single statement.
+
+        The version of every updated task is incremented as well, so that
+        concurrent writers holding a loaded copy of a task notice the change.
+        The update itself is a deliberate blind write: it sets absolute
+        values without reading the tasks first, so no version is compared
+        and the last of two concurrent edits of the same attribute wins, as
+        if they had run one after the other.
+
+        :param ranges: inclusive ID ranges of the tasks to update
+        :param values: mapping of task attributes and new values
+        :return: board IDs of the updated tasks
+        """
+        return self.session.execute(
+            update(Task).where(self._in_ranges(ranges))
+            .values({**values, 'version': Task.version + 1})
+            .returning(Task.board_id)
+        ).scalars().all()
+
+    def move_many(self, ranges: IdRanges,
+                  steps: int) -> Sequence[int | None]:
+        """Shift the status of multiple tasks in a single statement.
+
+        Tasks whose new status would be out of bounds are left untouched. The
+        version of every moved task is incremented.
+
+        :param ranges: inclusive ID ranges of the tasks to move
+        :param steps: number of steps, negative to move backwards
+        :return: board IDs of the moved tasks
+        """
+        moves = {s: Status(s + steps) for s in Status
+                 if Status.TO_DO <= s + steps <= Status.COMPLETED}
+
+        if not moves:
+            return []
+
+        return self.session.execute(
+            update(Task)
+            .where(self._in_ranges(ranges), Task.status.in_(moves))
+            .values(status=case(*(
+                (Task.status == source, literal(target, Task.status.type))
+                for source, target in moves.items()
+            )), version=Task.version + 1)
+            .returning(Task.board_id)
+        ).scalars().all()
+
+    def delete_many(self, ranges: IdRanges) -> Sequence[int | None]:
+        """Delete multiple tasks in a single statement.
+
+        :param ranges: inclusive ID ranges of the tasks to delete
+        :return: board IDs of the deleted tasks
+        """
+        return self.session.execute(
+            delete(Task).where(self._in_ranges(ranges))
+            .returning(Task.board_id)
+        ).scalars().all()
+
+    @staticmethod
+    def _in_boards(board_ids: Collection[int | None]) -> ColumnElement[bool]:
+        """Build the condition to select the tasks of multiple boards.
+
+        :param board_ids: board IDs, None to include the backlog
+        :return: SQL condition
+        """
+        condition = Task.board_id.in_([i for i in board_ids if i is not None])
+
+        if None in board_ids:
+            condition = or_(condition, Task.board_id.is_(None))
+
+        return condition
+
+    @staticmethod
+    def _matching(criteria: TaskFilter | None,
+                  task: Any = Task) -> list[ColumnElement[bool]]:
+        """Build the conditions to select the tasks matching a filter.
+
+        :param criteria: task filter, None to match every task
+        :param task: task entity, alias or table columns to filter
+        :return: list of SQL conditions
+        """
+        if not criteria:
+            return []
+
+        conditions = []
+
+        if criteria.tag is not None:
+            conditions.append(task.tag == criteria.tag)
+        if criteria.priorities:
+            conditions.append(task.priority.in_(criteria.priorities))
+        if criteria.statuses:
+            conditions.append(task.status.in_(criteria.statuses))
+        if criteria.due_before:
+            conditions.append(task.due_date <= criteria.due_before)
+        if criteria.due_after:
+            conditions.append(task.due_date >= criteria.due_after)
+
+        return conditions
+
+    def _page_query(self, board_ids: Collection[int | None],
+                    limit: int | None, offset: int,
+                    criteria: TaskFilter | None) -> tuple[Select, Any]:
+        """Build the query selecting a page of tasks from every status column
+        of the given boards.
+
+        Tasks are numbered per board and status with a window function, so
+        only the tasks inside the page are loaded.
+
+        :param board_ids: board IDs, None to include the backlog
+        :param limit: maximum number of tasks per column, None for no limit
+        :param offset: number of tasks to skip per column
+        :param criteria: filter the tasks must match, None for all tasks
+        :return: unordered query and the selected task entity to order by
+        """
+        conditions = (self._in_boards(board_ids), *self._matching(criteria))
+
+        if limit is None and not offset:
+            return select(Task).where(*conditions), Task
+
+        position = func.row_number().over(
+            partition_by=(Task.board_id, Task.status), order_by=Task.id
+        ).label('position')
+        ranked = select(Task, position).where(*conditions).subquery()
+        task = aliased(Task, ranked)
+
+        query = select(task).where(ranked.c.position > offset)
+
+        if limit is not None:
+            query = query.where(ranked.c.position <= offset + limit)
+
+        return query, task
+
+    def list_page(self, board_ids: Collection[int | None],
+                  limit: int | None = None, offset: int = 0,
+                  criteria: TaskFilter | None = None) -> Sequence[Task]:
+        """Return a page of tasks from every status column of the given boards.
+
+        :param board_ids: board IDs, None to include the backlog
+        :param limit: maximum number of tasks per column, None for no limit
+        :param offset: number of tasks to skip per column
+        :param criteria: filter the tasks must match, None for all tasks
+        :return: list of tasks
+        """
+        query, task = self._page_query(board_ids, limit, offset, criteria)
+
+        return self.session.execute(query.order_by(task.id)).scalars().all()
+
+    def iter_page(self, board_ids: Collection[int | None],
+                  limit: int | None = None, offset: int = 0,
+                  criteria: TaskFilter | None = None,
+                  batch_size: int = 1000) -> Iterator[Task]:
+        """Stream a page of tasks from every status column of the given
+        boards, one board after the other, fetching them in batches.
+
+        :param board_ids: board IDs, None to include the backlog
+        :param limit: maximum number of tasks per column, None for no limit
+        :param offset: number of tasks to skip per column
+        :param criteria: filter the tasks must match, None for all tasks
+        :param batch_size: number of tasks fetched at a time
+        :return: iterator of tasks ordered by board and ID
+        """
+        query, task = self._page_query(board_ids, limit, offset, criteria)
+
+        return iter(self.session.execute(
+            query.order_by(task.board_id, task.id)
+            .execution_options(yield_per=batch_size)
+        ).scalars())
+
+    def iter_page_rows(self, board_ids: Collection[int | None],
+                       limit: int | None = None, offset: int = 0,
+                       criteria: TaskFilter | None = None,
+                       batch_size: int = 1000) -> Iterator[Row]:
+        """Stream the columns of a page of tasks from every status column of
+        the given boards, one board after the other, without loading task
+        objects.
+
+        :param board_ids: board IDs, None to include the backlog
+        :param limit: maximum number of tasks per column, None for no limit
+        :param offset: number of tasks to skip per column
+        :param criteria: filter the tasks must match, None for all tasks
+        :param batch_size: number of rows fetched at a time
+        :return: iterator of task rows ordered by board and ID
+        """
+        query, task = self._page_query(board_ids, limit, offset, criteria)
+
+        return iter(self.session.execute(
+            query.with_only_columns(*self._columns(task))
+            .order_by(task.board_id, task.id)
+            .execution_options(yield_per=batch_size)
+        ))
+
+    def count_by_status(self, board_ids: Collection[int | None],
+                        criteria: TaskFilter | None = None
+                        ) -> dict[tuple[int | None, Status], int]:
+        """Count the tasks of every status column of the given boards.
+
+        :param board_ids: board IDs, None to include the backlog
+        :param criteria: filter the tasks must match, None for all tasks
+        :return: mapping of (board ID, status) and number of tasks
+        """
+        rows = self.session.execute(
+            select(Task.board_id, Task.status, func.count())
+            .where(self._in_boards(board_ids), *self._matching(criteria))
+            .group_by(Task.board_id, Task.status)
+        )
+
+        return {(board_id, status): count for board_id, status, count in rows}
+
+    def search(self, query: str, limit: int) -> Sequence[Task]:
+        """Return the tasks matching a full-text query, best matches first.
+
+        :param query: FTS5 query over task titles and tags
+        :param limit: maximum number of tasks
+        :return: list of tasks
+        """
+        return self.session.execute(
+            select(Task)
+            .join(tasks_fts, tasks_fts.c.rowid == Task.id)
+            .where(column('tasks_fts').op('MATCH')(query))
+            .order_by(tasks_fts.c.rank)
+            .limit(limit)
+        ).scalars().all()
+
     def list_backlog(self) -> Sequence[Task]:
         """Return a list of unassigned tasks.
 
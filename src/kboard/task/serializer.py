@@ -0,0 +1,138 @@
+"""This module exports the serializer class to convert tasks from and to plain
+records.
+"""
+
+import csv
+import json
+from collections.abc import Iterable, Iterator, Mapping
+from datetime import date
+from enum import Enum
+from typing import Any, TextIO
+
+from ..enums import FileFormat, Priority, Status
+
+
+class TaskSerializer:
+    """Class responsible for converting tasks from and to plain records used
+    by import and export files.
+    """
+
+    FIELDS = ('id', 'title', 'priority', 'tag', 'status', 'due_date',
+              'board_id')
+    """Record fields, in output order."""
+
+    @staticmethod
+    def to_record(row: Any) -> dict[str, Any]:
+        """Convert a task object or row into a JSON-compatible record.
+
+        :param row: task object or row with the task columns
+        :return: mapping of field names and values
+        """
+        return {
+            'id': row.id,
+            'title': row.title,
+            'priority': row.priority.name,
+            'tag': row.tag,
+            'status': row.status.name,
+            'due_date': row.due_date.isoformat() if row.due_date else None,
+            'board_id': row.board_id,
+        }
+
+    @staticmethod
+    def _parse_enum(enum: type[Enum], value: Any, default: Enum) -> Any:
+        """Parse an enum member from its name or value.
+
+        :param enum: enum class
+        :param value: raw value
+        :param default: member to return when the value is empty
+        :raises ValueError: if the value is not a valid member
+        :return: enum member
+        """
+        if value is None or value == '':
+            return default
+
+        if isinstance(value, str) and not value.isdigit():
+            try:
+                return enum[value.strip().upper().replace(' ', '_')]
+            except KeyError:
+                raise ValueError(f'Invalid {enum.__name__.lower()} "{value}"')
+
+        return enum(int(value))
+
+    @classmethod
+    def from_record(cls, record: Mapping[str, Any]) -> dict[str, Any]:
+        """Convert a record read from a file into task column values.
+
+        The record ``id`` is ignored, imported tasks always get a new ID.
+
+        :param record: mapping of field names and raw values
+        :raises ValueError: if a field has an invalid value
+        :return: mapping of task attributes and values
+        """
+        title = record.get('title')
+
+        if not title:
+            raise ValueError('Missing title')
+
+        due_date = record.get('due_date') or None
+        board_id = record.get('board_id')
+
+        return {
+            'title': title,
+            'priority': cls._parse_enum(Priority, record.get('priority'),
+                                        Priority.NORMAL),
+            'tag': record.get('tag') or '',
+            'status': cls._parse_enum(Status, record.get('status'),
+                                      Status.TO_DO),
+            'due_date': date.fromisoformat(due_date) if due_date else None,
+            'board_id': int(board_id) if board_id not in (None, '') else None,
+        }
+
+    @classmethod
+    def read(cls, file: TextIO, fmt: FileFormat) -> Iterator[dict[str, Any]]:
+        """Lazily read task values from a file, one record at a time.
+
+        :param file: file opened in text mode
+        :param fmt: file format
+        :raises ValueError: if a record is invalid, with its line number
+        :return: iterator of task attribute mappings
+        """
+        if fmt == FileFormat.CSV:
+            reader = csv.DictReader(file)
+            records = ((reader.line_num, r) for r in reader)
+        else:
+            records = ((n, line) for n, line in enumerate(file, start=1)
+                       if line.strip())
+
+        for line, record in records:
+            try:
+                if isinstance(record, str):
+                    record = json.loads(record)
+                yield cls.from_record(record)
+            except (AttributeError, TypeError, ValueError) as e:
+                raise ValueError(f'Line {line}: {e}') from e
+
+    @classmethod
+    def write(cls, file: TextIO, fmt: FileFormat, rows: Iterable[Any]) -> int:
+        """Write tasks to a file, one record at a time.
+
+        :param file: file opened in text mode
+        :param fmt: file format
+        :param rows: task objects or rows with the task columns
+        :return: number of records written
+        """
+        count = 0
+
+        if fmt == FileFormat.CSV:
+            writer = csv.DictWriter(file, cls.FIELDS, lineterminator='\n')
+            writer.writeheader()
+            write = writer.writerow
+        else:
+            def write(record):
+                file.write(json.dumps(record) + '\n')
+
+        for row in rows:
+            write(cls.to_record(row))
+            count += 1
+
+        return count
@@ -1,12 +1,18 @@
 """This module exports the service class for the Task model.
 """
 
-from datetime import datetime
+from collections import Counter
+from collections.abc import Collection, Iterator, Mapping, Sequence
+from datetime import date, datetime
+from typing import Any
 
+from sqlalchemy import Row
+
+from .filter import IdRanges, TaskFilter
 from .repository import TaskRepository
 from ..exceptions import BoardNotFoundError, TaskNotFoundError
 from ..enums import Priority, Status
-from ..models import Task
+from ..models import Board, Task
 from ..board.repository import BoardRepository
 
 
@@ -39,8 +45,18 @@ class TaskService:
 
         return task
 
+    @staticmethod
+    def _to_date(due_date: date | None) -> date | None:
+        """Drop the time of a due date parsed as a datetime, as the column
+        and the renderers only deal with dates.
+
+        :param due_date: due date or datetime
+        :return: due date
+        """
+        return due_date.date() if isinstance(due_date, datetime) else due_date
+
     def add_task(self, title: str, priority: Priority, tag: str | None,
-                 due_date: datetime | None, board_id: int | None) -> Task:
+                 due_date: date | None, board_id: int | None) -> Task:
         """Create a new task in the database.
 
         :param title: task title
@@ -58,73 +74,185 @@ class TaskService:
             if not board:
                 raise BoardNotFoundError
 
-        task = Task(title=title, priority=priority, tag=tag, due_date=due_date,
-                    board=board)
+        task = Task(title=title, priority=priority, tag=tag,
+                    due_date=self._to_date(due_date), board=board)
 
         self.task_repo.add(task)
 
         return task
 
-    def edit_task(self, task_id: int, title: str | None,
-                  priority: Priority | None, tag: str | None,
-                  due_date: datetime | None, board_id: int | None) -> Task:
-        """Edit task attributes in the database.
+    def _count_found(self, ranges: IdRanges) -> int:
+        """Count the tasks of some ID ranges, which may contain gaps.
 
-        :param task_id: task ID to search
+        :param ranges: inclusive ID ranges
+        :raises TaskNotFoundError: if any of the ranges has no task
+        :return: number of tasks
+        """
+        counts = self.task_repo.count_per_range(ranges)
+
+        if not all(counts):
+            raise TaskNotFoundError
+
+        return sum(counts)
+
+    def _after_change(self, ranges: IdRanges,
+                      board_ids: Sequence[int | None]) -> Board | None:
+        """Refresh the boards affected by a set-based operation.
+
+        :param ranges: inclusive ID ranges of the changed tasks
+        :param board_ids: board IDs returned by the operation
+        :return: board of the first affected task
+        """
+        self.board_repo.expire_tasks(set(board_ids), ranges)
+
+        return self.board_repo.get(board_ids[0]) if board_ids[0] else None
+
+    def edit_tasks(self, ranges: IdRanges, title: str | None,
+                   priority: Priority | None, tag: str | None,
+                   due_date: date | None,
+                   board_id: int | None) -> Board | None:
+        """Edit the attributes of one or more tasks in a single statement.
+
+        Edits are blind writes of the given values, which never depend on the
+        previous ones, so concurrent edits are applied in commit order.
+
+        :param ranges: inclusive ID ranges of the tasks
         :param title: new title
         :param priority: new priority
         :param tag: new tag
         :param due_date: new due date
         :param board_id: new board ID, None to omit, -1 to unassign
-        :raises TaskNotFoundError: if the task ID does not exist
+        :raises TaskNotFoundError: if any of the ranges has no task
         :raises BoardNotFoundError: if the board ID does not exist
-        :return: task object
+        :return: board of the first edited task
         """
-        task = self.get_task(task_id)
-
-        task.update(title=title, priority=priority, tag=tag, due_date=due_date)
+        values = {k: v for k, v in (('title', title), ('priority', priority),
+                                    ('tag', tag),
+                                    ('due_date', self._to_date(due_date)))
+                  if v is not None}
 
         if board_id is not None:
             if board_id == -1:
-                task.board = None
+                values['board_id'] = None
+            elif not self.board_repo.get(board_id):
+                raise BoardNotFoundError
             else:
-                board = self.board_repo.get(board_id)
-                if not board:
-                    raise BoardNotFoundError
-                task.board = board
+                values['board_id'] = board_id
 
-        return task
+        self._count_found(ranges)
 
-    def move_task(self, task_id: int, steps: int):
-        """Update a task status by a number of steps.
+        if not values:
+            board_id = self.task_repo.first_board_id(ranges)
+            return self.board_repo.get(board_id) if board_id else None
 
-        :param task_id: task ID to search
+        board_ids = self.task_repo.update_many(ranges, values)
+
+        return self._after_change(ranges, board_ids)
+
+    def move_tasks(self, ranges: IdRanges, steps: int) -> Board | None:
+        """Update the status of one or more tasks by a number of steps.
+
+        The status bounds are checked by the update statement itself, if any
+        task cannot be moved none of them should be committed.
+
+        :param ranges: inclusive ID ranges of the tasks
         :param steps: number of steps
-        :raises TaskNotFoundError: if the task ID does not exist
+        :raises TaskNotFoundError: if any of the ranges has no task
         :raises ValueError: if the amount of steps result in an invalid status
-        :return: task object
+        :return: board of the first moved task
         """
-        task = self.get_task(task_id)
+        found = self._count_found(ranges)
+        board_ids = self.task_repo.move_many(ranges, steps)
 
-        try:
-            task.status = Status(task.status + steps)
-        except ValueError:
+        if len(board_ids) < found:
             raise ValueError('Invalid status movement')
 
-        return task
+        return self._after_change(ranges, board_ids)
 
-    def delete_task(self, task_id: int):
-        """Remove a task from the database.
+    def delete_tasks(self, ranges: IdRanges) -> Board | None:
+        """Remove one or more tasks from the database in a single statement.
 
-        :param task_id: task ID to search
-        :raises TaskNotFoundError: if the task ID does not exist
-        :return: task object
+        :param ranges: inclusive ID ranges of the tasks
+        :raises TaskNotFoundError: if any of the ranges has no task
+        :return: board of the first deleted task
+        """
+        self._count_found(ranges)
+        board_ids = self.task_repo.delete_many(ranges)
+
+        return self._after_change(ranges, board_ids)
+
+    def get_page(
+        self, board_ids: Collection[int | None], limit: int | None,
+        offset: int = 0, criteria: TaskFilter | None = None
+    ) -> tuple[Sequence[Task], dict[tuple[int | None, Status], int]]:
+        """Return a page of tasks per board and status column, along with the
+        number of tasks left after the page in each column.
+
+        :param board_ids: board IDs, None to include the backlog
+        :param limit: maximum number of tasks per column, None for no limit
+        :param offset: number of tasks to skip per column
+        :param criteria: filter the tasks must match, None for all tasks
+        :return: list of tasks and mapping of (board ID, status) and hidden
+            task count
         """
-        task = self.get_task(task_id)
+        tasks = self.task_repo.list_page(board_ids, limit, offset, criteria)
+        counts = self.task_repo.count_by_status(board_ids, criteria)
+        shown = Counter((t.board_id, t.status) for t in tasks)
+
+        remaining = {key: max(count - offset - shown[key], 0)
+                     for key, count in counts.items()}
+
+        return tasks, remaining
+
+    def stream_page(
+        self, board_ids: Collection[int | None], limit: int | None,
+        offset: int = 0, criteria: TaskFilter | None = None
+    ) -> tuple[Iterator[Task], dict[tuple[int | None, Status], int]]:
+        """Stream a page of tasks per board and status column, one board
+        after the other, along with the number of tasks left after the page
+        in each column.
+
+        :param board_ids: board IDs, None to include the backlog
+        :param limit: maximum number of tasks per column, None for no limit
+        :param offset: number of tasks to skip per column
+        :param criteria: filter the tasks must match, None for all tasks
+        :return: iterator of tasks ordered by board and mapping of
+            (board ID, status) and hidden task count
+        """
+        remaining = {}
 
-        self.task_repo.delete(task)
+        if limit is not None:
+            counts = self.task_repo.count_by_status(board_ids, criteria)
+            remaining = {key: max(count - offset - limit, 0)
+                         for key, count in counts.items()}
 
-        return task
+        tasks = self.task_repo.iter_page(board_ids, limit, offset, criteria)
+
+        return tasks, remaining
+
+    def stream_page_rows(
+        self, board_ids: Collection[int | None], limit: int | None,
+        offset: int = 0, criteria: TaskFilter | None = None
+    ) -> Iterator[Row]:
+        """Stream the columns of a page of tasks per board and status column,
+        one board after the other.
+
+        :param board_ids: board IDs, None to include the backlog
+        :param limit: maximum number of tasks per column, None for no limit
+        :param offset: number of tasks to skip per column
+        :param criteria: filter the tasks must match, None for all tasks
+        :return: iterator of task rows ordered by board and ID
+        """
+        return self.task_repo.iter_page_rows(board_ids, limit, offset,
+                                             criteria)
+
+    def get_rows(self, ranges: IdRanges) -> Sequence[Row]:
+        """Return the columns of the tasks of some ID ranges.
+
+        :param ranges: inclusive ID ranges
+        :return: list of task rows ordered by ID
+        """
+        return self.task_repo.list_rows(ranges)
 
     def get_backlog(self):
         """Return a list of unassigned tasks.
@@ -132,3 +260,55 @@ class TaskService:
         :return: list of tasks.
         """
         return self.task_repo.list_backlog()
+
+    def search_tasks(self, query: str, limit: int) -> Sequence[Task]:
+        """Return the tasks whose title or tag contain all the given words,
+        best matches first.
+
+        Words are matched as prefixes and quoted, so characters with a special
+        meaning in the FTS5 query syntax are searched literally.
+
+        :param query: words to search
+        :param limit: maximum number of tasks
+        :return: list of tasks
+        """
+        words = query.split()
+
+        if not words:
+            return []
+
+        match = ' '.join('"{}"*'.format(w.replace('"', '""')) for w in words)
+
+        return self.task_repo.search(match, limit)
+
+    def import_batch(self, batch: Sequence[Mapping[str, Any]]
+                     ) -> tuple[int, int]:
+        """Insert a batch of tasks, skipping those assigned to missing
+        boards.
+
+        Board references are validated with a single lookup. Large imports
+        are split in batches by the caller, which commits after each one so
+        that every batch runs in its own transaction and can be retried on
+        its own.
+
+        :param batch: mappings of task attributes and values
+        :return: number of inserted and skipped tasks
+        """
+        board_ids = {v['board_id'] for v in batch
+                     if v['board_id'] is not None}
+        existing = self.board_repo.existing_ids(board_ids)
+
+        valid = [v for v in batch
+                 if v['board_id'] is None or v['board_id'] in existing]
+        self.task_repo.add_many(valid)
+        self.board_repo.expire_tasks(existing)
+
+        return len(valid), len(batch) - len(valid)
+
+    def export_tasks(self, batch_size: int = 1000) -> Iterator[Row]:
+        """Stream all tasks as plain rows.
+
+        :param batch_size: number of rows fetched at a time
+        :return: iterator of task rows
+        """
+        return self.task_repo.iter_rows(batch_size)
@@ -0,0 +1,177 @@
+"""This module defines the repository class to query several workspaces at
+once.
+"""
+
+from collections.abc import Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from pathlib import Path
+
+from sqlalchemy import (MetaData, Row, Select, Table, func, literal, select,
+                        union_all)
+from sqlalchemy.orm import Session
+
+from ..db.migrations import LATEST_VERSION
+from ..enums import Status
+from ..exceptions import WorkspaceOutdatedError
+from ..models import Board, Task
+from ..task.filter import TaskFilter
+from ..task.repository import TaskRepository
+
+
+class WorkspaceRepository:
+    """Repository responsible for reading the boards and tasks of several
+    workspaces in single statements.
+
+    The data files of the workspaces are attached to the connection of the
+    session, so every query reads all of them at once.
+    """
+
+    MAX_ATTACHED = 10
+    """Maximum number of data files SQLite can attach to a connection."""
+
+    def __init__(self, session: Session):
+        """Initialise the repository with a database session.
+
+        :param session: SQLAlchemy session
+        """
+        self.session = session
+
+    @contextmanager
+    def attach(self, paths: Mapping[str, Path]) -> Iterator[dict[str, str]]:
+        """Attach the data files of some workspaces to the session connection
+        for the duration of the context.
+
+        Data files are attached in read-write mode, which never creates
+        them, and must be at the latest schema version.
+
+        :param paths: mapping of workspace names and data files
+        :raises WorkspaceOutdatedError: if a data file is not at the latest
+            schema version
+        :return: mapping of workspace names and schema names
+        """
+        conn = self.session.connection()
+        schemas = {}
+
+        try:
+            for index, (name, path) in enumerate(paths.items()):
+                schema = f'workspace_{index}'
+                conn.exec_driver_sql(f'ATTACH DATABASE ? AS {schema}',
+                                     (f'{path.absolute().as_uri()}?mode=rw',))
+                schemas[name] = schema
+
+                version = conn.exec_driver_sql(
+                    f'PRAGMA {schema}.user_version').scalar_one()
+                if version < LATEST_VERSION:
+                    raise WorkspaceOutdatedError(name)
+
+            yield schemas
+        finally:
+            for schema in schemas.values():
+                conn.exec_driver_sql(f'DETACH DATABASE {schema}')
+
+    @staticmethod
+    def _tables(schemas: Mapping[str, str]
+                ) -> Iterator[tuple[int, str, Table, Table]]:
+        """Return the board and task tables of every attached schema.
+
+        :param schemas: mapping of workspace names and schema names
+        :return: iterator of workspace position, workspace name, boards table
+            and tasks table
+        """
+        for position, (name, schema) in enumerate(schemas.items()):
+            metadata = MetaData()
+
+            yield (position, name,
+                   Board.__table__.to_metadata(metadata, schema=schema),
+                   Task.__table__.to_metadata(metadata, schema=schema))
+
+    def list_boards(self, schemas: Mapping[str, str]) -> Sequence[Row]:
+        """Return the boards of every attached workspace.
+
+        :param schemas: mapping of workspace names and schema names
+        :return: rows of workspace name, board ID and board name, in
+            workspace order and by ID
+        """
+        query = union_all(*(
+            select(literal(position).label('position'),
+                   literal(name).label('workspace'), boards.c.id,
+                   boards.c.name)
+            for position, name, boards, _ in self._tables(schemas)
+        )).subquery()
+
+        return self.session.execute(
+            select(query.c.workspace, query.c.id, query.c.name)
+            .order_by(query.c.position, query.c.id)
+        ).all()
+
+    def _union_tasks(self, schemas: Mapping[str, str],
+                     criteria: TaskFilter | None) -> Select:
+        """Build the query selecting the board tasks of every attached
+        workspace that match a filter.
+
+        :param schemas: mapping of workspace names and schema names
+        :param criteria: filter the tasks must match, None for all tasks
+        :return: union of the task rows with their workspace and position
+        """
+        return union_all(*(
+            select(literal(position).label('position'),
+                   literal(name).label('workspace'), tasks.c.id,
+                   tasks.c.title, tasks.c.priority, tasks.c.tag,
+                   tasks.c.status, tasks.c.due_date, tasks.c.board_id)
+            .where(tasks.c.board_id.in_(select(boards.c.id)),
+                   *TaskRepository._matching(criteria, tasks.c))
+            for position, name, boards, tasks in self._tables(schemas)
+        ))
+
+    def list_page(self, schemas: Mapping[str, str], limit: int | None,
+                  offset: int = 0,
+                  criteria: TaskFilter | None = None) -> Sequence[Row]:
+        """Return a page of tasks from every status column of the boards of
+        every attached workspace.
+
+        :param schemas: mapping of workspace names and schema names
+        :param limit: maximum number of tasks per column, None for no limit
+        :param offset: number of tasks to skip per column
+        :param criteria: filter the tasks must match, None for all tasks
+        :return: task rows with their workspace, in workspace order and by
+            board and ID
+        """
+        tasks = self._union_tasks(schemas, criteria).subquery()
+        position = func.row_number().over(
+            partition_by=(tasks.c.position, tasks.c.board_id, tasks.c.status),
+            order_by=tasks.c.id
+        ).label('rank')
+        ranked = select(tasks, position).subquery()
+
+        query = select(ranked.c.workspace, ranked.c.id, ranked.c.title,
+                       ranked.c.priority, ranked.c.tag, ranked.c.status,
+                       ranked.c.due_date, ranked.c.board_id)
+
+        if offset:
+            query = query.where(ranked.c.rank > offset)
+        if limit is not None:
+            query = query.where(ranked.c.rank <= offset + limit)
+
+        return self.session.execute(
+            query.order_by(ranked.c.position, ranked.c.board_id, ranked.c.id)
+        ).all()
+
+    def count_by_status(self, schemas: Mapping[str, str],
+                        criteria: TaskFilter | None = None
+                        ) -> dict[tuple[str, int, Status], int]:
+        """Count the tasks of every status column of the boards of every
+        attached workspace.
+
+        :param schemas: mapping of workspace names and schema names
+        :param criteria: filter the tasks must match, None for all tasks
+        :return: mapping of (workspace, board ID, status) and number of tasks
+        """
+        tasks = self._union_tasks(schemas, criteria).subquery()
+        rows = self.session.execute(
+            select(tasks.c.workspace, tasks.c.board_id, tasks.c.status,
+                   func.count())
+            .group_by(tasks.c.workspace, tasks.c.board_id, tasks.c.status)
+        )
+
+        return {(workspace, board_id, status): count
+                for workspace, board_id, status, count in rows}
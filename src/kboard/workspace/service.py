@@ -0,0 +1,86 @@
+"""This module exports the service class for cross-workspace use cases.
+"""
+
+from collections import Counter
+from collections.abc import Sequence
+from pathlib import Path
+
+from sqlalchemy import Row
+
+from .repository import WorkspaceRepository
+from ..enums import Status
+from ..exceptions import WorkspaceNotFoundError
+from ..settings import workspace_path
+from ..task.filter import TaskFilter
+
+
+WorkspaceRemaining = dict[tuple[str, int, Status], int]
+"""Number of hidden tasks by workspace, board ID and status."""
+
+
+class WorkspaceService:
+    """Application service responsible for use cases spanning several
+    workspaces.
+    """
+
+    def __init__(self, workspace_repo: WorkspaceRepository):
+        """Initialise the service with repositories.
+
+        :param workspace_repo: workspace repository
+        """
+        self.workspace_repo = workspace_repo
+
+    def _resolve(self, names: Sequence[str]) -> dict[str, Path]:
+        """Find the data files of some workspaces.
+
+        :param names: workspace names
+        :raises ValueError: if a name is invalid or there are too many
+        :raises WorkspaceNotFoundError: if a workspace has no data file
+        :return: mapping of workspace names and data files
+        """
+        paths = {name: workspace_path(name) for name in names}
+
+        if len(paths) > self.workspace_repo.MAX_ATTACHED:
+            raise ValueError(f'At most {self.workspace_repo.MAX_ATTACHED} '
+                             'workspaces can be displayed at once.')
+
+        for name, path in paths.items():
+            if not path.exists():
+                raise WorkspaceNotFoundError(name)
+
+        return paths
+
+    def get_page(
+        self, names: Sequence[str], limit: int | None, offset: int = 0,
+        criteria: TaskFilter | None = None
+    ) -> tuple[Sequence[Row], Sequence[Row], WorkspaceRemaining]:
+        """Return the boards of several workspaces and a page of their tasks
+        per status column, along with the number of tasks left after the
+        page in each column.
+
+        :param names: workspace names, in display order
+        :param limit: maximum number of tasks per column, None for no limit
+        :param offset: number of tasks to skip per column
+        :param criteria: filter the tasks must match, None for all tasks
+        :raises ValueError: if a name is invalid or there are too many
+        :raises WorkspaceNotFoundError: if a workspace has no data file
+        :raises WorkspaceOutdatedError: if a data file is not at the latest
+            schema version
+        :return: board rows, task rows and mapping of (workspace, board ID,
+            status) and hidden task count
+        """
+        with self.workspace_repo.attach(self._resolve(names)) as schemas:
+            boards = self.workspace_repo.list_boards(schemas)
+            tasks = self.workspace_repo.list_page(schemas, limit, offset,
+                                                  criteria)
+            remaining = {}
+
+            if limit is not None or offset:
+                counts = self.workspace_repo.count_by_status(schemas,
+                                                             criteria)
+                shown = Counter((t.workspace, t.board_id, t.status)
+                                for t in tasks)
+                remaining = {key: max(count - offset - shown[key], 0)
+                             for key, count in counts.items()}
+
+        return boards, tasks, remaining
@@ -0,0 +1,74 @@
+"""Shared fixtures of the test suite.
+"""
+
+from collections.abc import Callable, Iterator
+
+import pytest
+from click.testing import Result
+from sqlalchemy import Engine, create_engine, event
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+from typer.testing import CliRunner
+
+from kboard import settings
+from kboard.app import app
+from kboard.container import Container
+from kboard.db.migrations import migrate
+
+
+@pytest.fixture
+def engine() -> Iterator[Engine]:
+    """In-memory database engine with the latest schema.
+    """
+    engine = create_engine('sqlite://', poolclass=StaticPool)
+    migrate(engine)
+
+    yield engine
+
+    engine.dispose()
+
+
+@pytest.fixture
+def session(engine: Engine) -> Iterator[Session]:
+    """Session configured like the ones of the commands.
+    """
+    with Session(engine, expire_on_commit=False) as session:
+        yield session
+
+
+@pytest.fixture
+def container(session: Session) -> Container:
+    """DI container bound to the test session.
+    """
+    return Container(session)
+
+
+@pytest.fixture
+def statements(engine: Engine) -> Iterator[list[str]]:
+    """SQL statements sent to the database while the test runs.
+    """
+    recorded = []
+
+    def record(conn, cursor, statement, *args):
+        recorded.append(statement)
+
+    event.listen(engine, 'before_cursor_execute', record)
+    yield recorded
+    event.remove(engine, 'before_cursor_execute', record)
+
+
+@pytest.fixture
+def cli(tmp_path, monkeypatch) -> Callable[..., Result]:
+    """Run kb commands against a configured data file in a temporary
+    directory.
+    """
+    monkeypatch.setattr(settings, 'DB_PATH', tmp_path / '.kboard.db')
+    runner = CliRunner()
+
+    def invoke(*args: str, input: str | None = None) -> Result:
+        return runner.invoke(app, list(args), input=input,
+                             catch_exceptions=False)
+
+    invoke('configure')
+
+    return invoke
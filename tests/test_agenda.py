@@ -0,0 +1,89 @@
+"""Tests of the agenda of overdue and upcoming tasks.
+"""
+
+import json
+from datetime import date, timedelta
+
+from kboard.agenda.service import AgendaService
+from kboard.enums import DueBucket, Priority
+
+WEDNESDAY = date(2026, 10, 14)
+SUNDAY = date(2026, 10, 18)
+
+
+def _add(container, title: str, due_date: date | None,
+         board_id: int | None = None) -> int:
+    task = container.task_service.add_task(title, Priority.NORMAL, None,
+                                           due_date, board_id)
+    container.session.commit()
+
+    return task.id
+
+
+def _titles(agenda) -> dict[DueBucket, tuple[list[str], int]]:
+    return {bucket: ([task.title for task in tasks], total)
+            for bucket, (tasks, total) in agenda.items()}
+
+
+def test_ranges_end_on_sunday():
+    assert AgendaService._ranges(WEDNESDAY) == {
+        DueBucket.OVERDUE: (None, date(2026, 10, 13)),
+        DueBucket.TODAY: (WEDNESDAY, WEDNESDAY),
+        DueBucket.THIS_WEEK: (date(2026, 10, 15), SUNDAY),
+    }
+
+
+def test_week_has_no_day_left_on_sunday(container):
+    _add(container, 'Today', SUNDAY)
+    _add(container, 'Monday', SUNDAY + timedelta(days=1))
+
+    first, last = AgendaService._ranges(SUNDAY)[DueBucket.THIS_WEEK]
+
+    assert first > last
+    assert _titles(container.agenda_service.get_agenda(today=SUNDAY)) == {
+        DueBucket.OVERDUE: ([], 0),
+        DueBucket.TODAY: (['Today'], 1),
+        DueBucket.THIS_WEEK: ([], 0),
+    }
+
+
+def test_open_tasks_are_grouped_by_due_date(container):
+    board = container.board_service.create_board('Board')
+    container.session.flush()
+    _add(container, 'Late', WEDNESDAY - timedelta(days=30), board.id)
+    _add(container, 'Today', WEDNESDAY)
+    _add(container, 'Friday', WEDNESDAY + timedelta(days=2), board.id)
+    _add(container, 'Next week', WEDNESDAY + timedelta(days=5))
+    _add(container, 'Undated', None)
+    done = _add(container, 'Done', WEDNESDAY - timedelta(days=1), board.id)
+    container.task_service.move_tasks([(done, done)], 3)
+    container.session.commit()
+
+    assert _titles(container.agenda_service.get_agenda(today=WEDNESDAY)) == {
+        DueBucket.OVERDUE: (['Late'], 1),
+        DueBucket.TODAY: (['Today'], 1),
+        DueBucket.THIS_WEEK: (['Friday'], 1),
+    }
+
+
+def test_limit_keeps_the_total_of_every_bucket(container):
+    for days in (3, 2, 1):
+        _add(container, f'{days} days late', WEDNESDAY - timedelta(days=days))
+
+    _add(container, 'Today', WEDNESDAY)
+
+    agenda = _titles(container.agenda_service.get_agenda(2, WEDNESDAY))
+
+    assert agenda[DueBucket.OVERDUE] == (['3 days late', '2 days late'], 3)
+    assert agenda[DueBucket.TODAY] == (['Today'], 1)
+    assert _titles(container.agenda_service.get_agenda(
+        3, WEDNESDAY))[DueBucket.OVERDUE][1] == 3
+
+
+def test_cli_lists_the_buckets(cli):
+    cli('task', 'add', 'Late', '-d', '2020-01-01')
+
+    result = cli('agenda', '--format', 'json')
+
+    task, = json.loads(result.output)
+    assert (task['bucket'], task['title']) == ('OVERDUE', 'Late')
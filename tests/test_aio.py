@@ -0,0 +1,91 @@
+"""Tests of the asynchronous facade over the board and task services.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from kboard.aio import AsyncKboard
+from kboard.db.engine import get_engine
+from kboard.db.migrations import migrate
+from kboard.enums import Priority, Status
+from kboard.exceptions import BoardNotFoundError, TaskNotFoundError
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """Engine of a migrated data file, shared by the worker threads.
+    """
+    engine = get_engine(tmp_path / 'kboard.db')
+    migrate(engine)
+
+    yield engine
+
+    engine.dispose()
+
+
+def test_use_cases_run_in_their_own_transaction(engine):
+    async def main():
+        async with AsyncKboard(engine=engine) as kb:
+            board = await kb.create_board('Board')
+            task = await kb.add_task('Task', board_id=board.id)
+            await kb.move_tasks([task.id], 2)
+            await kb.edit_tasks([task.id], title='Renamed')
+
+            return board, await kb.get_task(task.id), await kb.list_boards()
+
+    board, task, boards = asyncio.run(main())
+
+    assert (task.title, task.status, task.board_id) == ('Renamed',
+                                                        Status.REVIEW,
+                                                        board.id)
+    assert [b.name for b in boards] == ['Board']
+    assert [t.title for t in boards[0].tasks] == ['Renamed']
+
+
+def test_errors_are_raised_and_roll_back(engine):
+    async def main():
+        async with AsyncKboard(engine=engine) as kb:
+            task = await kb.add_task('Task')
+
+            with pytest.raises(BoardNotFoundError):
+                await kb.edit_tasks([task.id], title='Renamed', board_id=9)
+            with pytest.raises(TaskNotFoundError):
+                await kb.delete_tasks([task.id, task.id + 1])
+
+            return await kb.get_task(task.id)
+
+    assert asyncio.run(main()).title == 'Task'
+
+
+def test_concurrent_callers_share_a_bounded_pool(engine):
+    running = peak = 0
+    lock = threading.Lock()
+
+    def operation(container):
+        nonlocal running, peak
+
+        with lock:
+            running += 1
+            peak = max(peak, running)
+
+        time.sleep(0.01)
+        container.task_service.add_task('Task', Priority.NORMAL, None, None,
+                                        None)
+
+        with lock:
+            running -= 1
+
+    async def main():
+        async with AsyncKboard(max_concurrency=3, engine=engine) as kb:
+            await asyncio.gather(*(kb.run(operation, commit=True)
+                                   for _ in range(30)))
+
+            return await kb.run(lambda c: c.task_service.get_backlog())
+
+    tasks = asyncio.run(main())
+
+    assert peak <= 3
+    assert sorted(t.id for t in tasks) == list(range(1, 31))
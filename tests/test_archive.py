@@ -0,0 +1,64 @@
+"""Tests of the task archive and of the task IDs it keeps.
+"""
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from kboard.container import Container
+from kboard.db.migrations import MIGRATIONS, migrate
+from kboard.enums import Priority
+
+
+def test_archived_task_ids_are_never_reused(container):
+    board = container.board_service.create_board('Board')
+    container.session.flush()
+    for title in ('t1', 't2', 't3'):
+        container.task_service.add_task(title, Priority.NORMAL, None, None,
+                                        board.id)
+    container.task_service.move_tasks([(3, 3)], 3)
+    container.session.commit()
+
+    assert container.archive_service.archive_batch(board.id) == 1
+    container.session.commit()
+
+    task = container.task_service.add_task('new', Priority.NORMAL, None,
+                                           None, board.id)
+    container.session.commit()
+    archived, _ = container.archive_service.list_archived()
+
+    assert task.id == 4
+    assert [(t.task_id, t.title) for t in archived] == [(3, 't3')]
+
+
+def test_migration_keeps_tasks_indexes_and_triggers():
+    engine = create_engine('sqlite://', poolclass=StaticPool)
+
+    with engine.begin() as conn:
+        conn.exec_driver_sql('BEGIN')
+        for migration in MIGRATIONS[:9]:
+            migration(conn)
+        conn.execute(text('PRAGMA user_version = 9'))
+        conn.execute(text("INSERT INTO boards (name) VALUES ('Board')"))
+        conn.execute(text(
+            'INSERT INTO tasks (title, priority, tag, status, board_id)'
+            " VALUES ('alpha', 'NORMAL', '', 'TO_DO', 1),"
+            " ('beta', 'NORMAL', '', 'TO_DO', 1)"
+        ))
+        conn.execute(text('DELETE FROM tasks WHERE id = 2'))
+
+    migrate(engine)
+
+    with Session(engine) as session:
+        container = Container(session)
+        task = container.task_service.add_task('gamma', Priority.NORMAL,
+                                               None, None, 1)
+        session.commit()
+
+        assert task.id == 3
+        assert [t.title for t in container.task_repo.search('alpha', 5)] == [
+            'alpha']
+        assert session.execute(text(
+            'SELECT sum(count) FROM board_task_counts')).scalar() == 2
+
+    engine.dispose()
@@ -0,0 +1,120 @@
+"""Tests of the board task counts kept by triggers for kb board ls.
+"""
+
+from datetime import date, timedelta
+
+from sqlalchemy import text
+
+from kboard.enums import Priority
+
+
+def _counts(container) -> tuple[set, set]:
+    session = container.session
+
+    return (
+        set(session.execute(text(
+            'SELECT board_id, status, count FROM board_task_counts'
+            ' WHERE count != 0'
+        )).all()),
+        set(session.execute(text(
+            'SELECT board_id, due_date, count FROM board_due_counts'
+        )).all()),
+    )
+
+
+def _assert_in_sync(container) -> None:
+    container.session.commit()
+    counts = _counts(container)
+
+    container.board_service.rebuild_summaries()
+
+    assert _counts(container) == counts
+
+
+def _summaries(container) -> dict[int, tuple]:
+    return {row.id: tuple(row)[2:]
+            for row in container.board_service.list_summaries()}
+
+
+def _add(container, board_id: int | None, due_date: date | None = None):
+    task = container.task_service.add_task('Task', Priority.NORMAL, None,
+                                           due_date, board_id)
+    container.session.commit()
+
+    return task.id
+
+
+def test_counts_follow_added_and_moved_tasks(container):
+    board = container.board_service.create_board('Board')
+    container.session.flush()
+    yesterday = date.today() - timedelta(days=1)
+
+    _add(container, board.id, yesterday)
+    _add(container, board.id)
+    _add(container, board.id)
+    container.task_service.move_tasks([(2, 2)], 1)
+    container.task_service.move_tasks([(3, 3)], 3)
+
+    _assert_in_sync(container)
+    assert _summaries(container) == {board.id: (1, 1, 0, 1, 1)}
+
+    container.task_service.move_tasks([(1, 1)], 3)
+
+    _assert_in_sync(container)
+    assert _summaries(container) == {board.id: (0, 1, 0, 2, 0)}
+
+
+def test_counts_follow_reassigned_and_redated_tasks(container):
+    first = container.board_service.create_board('First')
+    second = container.board_service.create_board('Second')
+    container.session.flush()
+    yesterday = date.today() - timedelta(days=1)
+    task_id = _add(container, first.id, yesterday)
+    _add(container, None, yesterday)
+
+    container.task_service.edit_tasks([(task_id, task_id)], None, None, None,
+                                      None, second.id)
+
+    _assert_in_sync(container)
+    assert _summaries(container) == {first.id: (0, 0, 0, 0, 0),
+                                     second.id: (1, 0, 0, 0, 1)}
+
+    container.task_service.edit_tasks([(task_id, task_id)], None, None, None,
+                                      date.today(), None)
+
+    _assert_in_sync(container)
+    assert _summaries(container)[second.id] == (1, 0, 0, 0, 0)
+
+
+def test_counts_follow_deleted_tasks_and_boards(container):
+    first = container.board_service.create_board('First')
+    second = container.board_service.create_board('Second')
+    container.session.flush()
+    yesterday = date.today() - timedelta(days=1)
+    _add(container, first.id, yesterday)
+    _add(container, first.id, yesterday)
+    _add(container, second.id, yesterday)
+
+    container.task_service.delete_tasks([(1, 1)])
+
+    _assert_in_sync(container)
+    assert _summaries(container)[first.id] == (1, 0, 0, 0, 1)
+
+    container.board_service.delete_board(first.id)
+
+    _assert_in_sync(container)
+    assert _counts(container) == ({(second.id, 'TO_DO', 1)},
+                                  {(second.id, yesterday.isoformat(), 1)})
+
+
+def test_cli_lists_boards_with_their_counts(cli):
+    cli('board', 'add', 'Board')
+    cli('task', 'add', 'Task', '-b', '1')
+    cli('task', 'add', 'Other', '-b', '1')
+    cli('task', 'mv', '2')
+
+    result = cli('board', 'ls')
+
+    assert result.exit_code == 0
+    assert [cell.strip() for cell in result.output.splitlines()[4].split('║')
+            if cell.strip()] == ['1', 'Board', '1', '1', '0', '0', '0']
@@ -0,0 +1,76 @@
+"""Tests of the number of queries issued by the Kanban views.
+"""
+
+from io import StringIO
+
+import pytest
+from rich.console import Console
+
+from kboard.enums import Priority
+
+
+def _fill(container, boards: int, tasks_per_board: int = 3) -> None:
+    """Create boards with tasks, and a few backlog tasks.
+    """
+    for index in range(boards):
+        board = container.board_service.create_board(f'Board {index}')
+        container.session.flush()
+
+        for number in range(tasks_per_board):
+            container.task_service.add_task(f'Task {number}',
+                                            Priority.NORMAL, None, None,
+                                            board.id)
+
+    for number in range(tasks_per_board):
+        container.task_service.add_task(f'Backlog {number}', Priority.LOW,
+                                        None, None, None)
+
+    container.session.commit()
+    container.session.expunge_all()
+
+
+def _render(renderable) -> str:
+    """Print a renderable to a string, loading everything it displays.
+    """
+    console = Console(file=StringIO(), width=160)
+    console.print(renderable)
+
+    return console.file.getvalue()
+
+
+def _count(container, statements, view) -> int:
+    """Count the statements issued to build and render a view.
+    """
+    container.session.expunge_all()
+    statements.clear()
+    _render(view(container.display_service))
+
+    return len(statements)
+
+
+@pytest.mark.parametrize('view', [
+    lambda display: display.all_boards_view(),
+    lambda display: display.board_view(1),
+    lambda display: display.backlog_view(),
+    lambda display: display.all_boards_view(limit=2),
+])
+def test_statement_count_does_not_grow_with_boards(container, statements,
+                                                   view):
+    _fill(container, 2)
+    few = _count(container, statements, view)
+
+    _fill(container, 50)
+    many = _count(container, statements, view)
+
+    assert few == many
+    assert many <= 4
+
+
+def test_all_boards_view_shows_every_task(container):
+    _fill(container, 3)
+
+    output = _render(container.display_service.all_boards_view())
+
+    for index in range(3):
+        assert f'Board {index}' in output
+    assert output.count('Task 2') == 3
@@ -0,0 +1,45 @@
+"""Tests of the config values cached by the config repository.
+"""
+
+from sqlalchemy.orm import Session
+
+from kboard.container import Container
+
+
+def _selects(statements: list[str]) -> int:
+    return sum('FROM app_config' in s for s in statements)
+
+
+def test_values_are_read_once_per_transaction(container, statements):
+    container.config_service.set_last_view_all()
+    container.session.commit()
+
+    statements.clear()
+    container.config_service.get_last_view()
+    container.config_service.set_last_view_all()
+    container.config_service.get_last_view()
+
+    assert _selects(statements) == 1
+    assert not any(s.startswith('INSERT') for s in statements)
+
+
+def test_rolled_back_value_is_forgotten(container):
+    container.config_service.set_last_view_board()
+    container.session.commit()
+
+    container.config_service.set_last_view_all()
+    assert container.config_service.get_last_view() == 'all'
+    container.session.rollback()
+
+    assert container.config_service.get_last_view() == 'board'
+
+
+def test_values_written_by_other_sessions_are_seen(engine, container):
+    container.config_service.set_last_view_all()
+    container.session.commit()
+
+    with Session(engine) as session:
+        Container(session).config_service.set_last_view_board()
+        session.commit()
+
+    assert container.config_service.get_last_view() == 'board'
@@ -0,0 +1,52 @@
+"""Tests of the commands run by the daemon on behalf of the client.
+"""
+
+import json
+
+import typer
+
+from kboard import client
+from kboard.app import app
+from kboard.daemon import DaemonServer
+
+
+def _execute(tmp_path, *args: str) -> dict:
+    command = typer.main.get_command(app)
+
+    with DaemonServer(command, bind_and_activate=False) as server:
+        return server.execute({'args': list(args), 'cwd': str(tmp_path),
+                               'width': 80, 'colour': False})
+
+
+def test_prompt_falls_back_to_the_client(tmp_path, cli):
+    cli('board', 'add', 'Board')
+
+    assert _execute(tmp_path, 'board', 'rm', '1') == {'fallback': True}
+    assert 'Board' in cli('board', 'ls').output
+
+
+def test_command_output_is_returned(tmp_path, cli):
+    cli('board', 'add', 'Board')
+
+    response = _execute(tmp_path, 'board', 'ls')
+
+    assert response['code'] == 0 and 'Board' in response['output']
+
+
+def test_client_trace_file_is_written_by_the_daemon(tmp_path, cli,
+                                                    monkeypatch):
+    trace_path = tmp_path / 'trace.json'
+    payloads = []
+
+    def request(payload):
+        payloads.append(payload)
+        return _execute(tmp_path, *payload['args'])
+
+    monkeypatch.setattr(client, 'DAEMON_ENABLED', True)
+    monkeypatch.setattr(client, 'TRACE_PATH', trace_path)
+    monkeypatch.setattr(client, 'request', request)
+    cli('board', 'add', 'Board')
+
+    assert client.forward(['board', 'ls']) == 0
+    assert payloads[0]['args'][2:4] == ['--trace', str(trace_path)]
+    assert json.loads(trace_path.read_text())['statements']
@@ -0,0 +1,79 @@
+"""Tests of the flow reports computed from the daily rollups.
+"""
+
+import json
+from datetime import date, timedelta
+
+from kboard.enums import FlowMetric
+from kboard.models import BoardDailyDuration, BoardDailyThroughput
+from kboard.report.service import ReportService
+
+
+def test_percentiles_use_the_nearest_rank():
+    histogram = [(1, 10), (2, 5), (4, 3), (10, 2)]
+
+    assert ReportService._percentiles(histogram) == {'p50': 1, 'p85': 4,
+                                                     'p95': 10}
+    assert ReportService._percentiles([(3, 1)]) == {'p50': 3, 'p85': 3,
+                                                    'p95': 3}
+
+
+def test_percentiles_without_data_are_none():
+    assert ReportService._percentiles([]) == {'p50': None, 'p85': None,
+                                              'p95': None}
+
+
+def test_completed_tasks_are_bucketed_by_monday(container):
+    board = container.board_service.create_board('Board')
+    container.session.flush()
+    today = date.today()
+    sunday = today - timedelta(days=(today.weekday() + 1) % 7)
+    monday = sunday - timedelta(days=6)
+
+    for day, count in ((sunday, 1), (monday, 2), (monday - timedelta(1), 4),
+                       (monday - timedelta(30), 8)):
+        container.session.add(BoardDailyThroughput(board_id=board.id,
+                                                   day=day, count=count))
+
+    container.session.commit()
+
+    report, = container.report_service.flow_report(14, [board.id])
+
+    assert report['completed'] == 7
+    assert report['per_week'] == 3.5
+    assert report['weekly'][monday.isoformat()] == 3
+    assert report['weekly'][(monday - timedelta(7)).isoformat()] == 4
+    assert sum(report['weekly'].values()) == 7
+    assert min(report['weekly']) <= (today - timedelta(13)).isoformat()
+
+
+def test_durations_are_reported_per_metric(container):
+    board = container.board_service.create_board('Board')
+    container.session.flush()
+    today = date.today()
+
+    for metric, days, count in ((FlowMetric.LEAD_TIME, 5, 1),
+                                (FlowMetric.LEAD_TIME, 9, 1),
+                                (FlowMetric.CYCLE_TIME, 2, 2)):
+        container.session.add(BoardDailyDuration(
+            board_id=board.id, day=today, metric=metric, days=days,
+            count=count))
+
+    container.session.commit()
+
+    report, = container.report_service.flow_report(7)
+
+    assert report['lead_time'] == {'p50': 5, 'p85': 9, 'p95': 9}
+    assert report['cycle_time'] == {'p50': 2, 'p85': 2, 'p95': 2}
+
+
+def test_cli_reports_a_completed_task(cli):
+    cli('board', 'add', 'Board')
+    cli('task', 'add', 'Task', '-b', '1')
+    cli('task', 'mv', '1', '--steps', '3')
+
+    result = cli('report', '--format', 'json')
+
+    report, = json.loads(result.output)
+    assert report['completed'] == 1
+    assert report['lead_time']['p50'] == 0
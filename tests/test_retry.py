@@ -0,0 +1,155 @@
+"""Tests of the retry of transactions that failed because of concurrent
+writers.
+"""
+
+import sqlite3
+
+import pytest
+import typer
+from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.exc import StaleDataError
+
+from kboard.commands import commit_with_retry
+from kboard.container import Container
+from kboard.db import retry
+from kboard.db.migrations import migrate
+from kboard.db.retry import is_transient
+from kboard.enums import Priority
+
+
+def _sqlite_error(code: int) -> OperationalError:
+    orig = sqlite3.OperationalError('error')
+    orig.sqlite_errorcode = code
+
+    return OperationalError('UPDATE tasks', {}, orig)
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(retry, 'backoff', lambda attempt: 0)
+
+
+@pytest.mark.parametrize('code', [
+    sqlite3.SQLITE_BUSY,
+    sqlite3.SQLITE_BUSY | 2 << 8,
+    sqlite3.SQLITE_LOCKED,
+    sqlite3.SQLITE_LOCKED | 1 << 8,
+])
+def test_busy_and_locked_errors_are_transient(code):
+    assert is_transient(_sqlite_error(code))
+
+
+def test_other_errors_are_not_transient():
+    assert is_transient(StaleDataError())
+    assert not is_transient(_sqlite_error(sqlite3.SQLITE_ERROR))
+    assert not is_transient(OperationalError('SELECT', {}, Exception()))
+    assert not is_transient(ValueError())
+
+
+def test_locked_data_file_is_transient(tmp_path):
+    path = tmp_path / 'kboard.db'
+    holder = sqlite3.connect(path, isolation_level=None)
+    holder.execute('CREATE TABLE t (x)')
+    holder.execute('BEGIN IMMEDIATE')
+    engine = create_engine(f'sqlite:///{path}',
+                           connect_args={'timeout': 0})
+
+    with pytest.raises(OperationalError) as info, engine.begin() as conn:
+        conn.exec_driver_sql('INSERT INTO t VALUES (1)')
+
+    assert is_transient(info.value)
+    holder.close()
+    engine.dispose()
+
+
+def test_conflicting_write_runs_again(tmp_path):
+    engine = create_engine(f'sqlite:///{tmp_path / "kboard.db"}')
+    migrate(engine)
+    first = Container(Session(engine, expire_on_commit=False))
+    second = Container(Session(engine, expire_on_commit=False))
+
+    task = first.task_service.add_task('Task', Priority.NORMAL, None, None,
+                                       None)
+    first.session.commit()
+    second.task_service.get_task(task.id).update(title='Other')
+    second.session.commit()
+    calls = []
+
+    def append(c: Container) -> None:
+        calls.append(1)
+        loaded = c.task_service.get_task(task.id)
+        loaded.update(title=loaded.title + '+')
+
+    commit_with_retry(first, append)
+
+    assert len(calls) == 2
+    assert first.task_service.get_task(task.id).title == 'Other+'
+    first.session.close()
+    second.session.close()
+    engine.dispose()
+
+
+def test_persistent_conflict_gives_up(container, monkeypatch):
+    monkeypatch.setattr(retry, 'WRITE_ATTEMPTS', 3)
+    calls = []
+
+    def fail(c: Container) -> None:
+        calls.append(1)
+        raise _sqlite_error(sqlite3.SQLITE_BUSY)
+
+    with pytest.raises(typer.Exit):
+        commit_with_retry(container, fail)
+
+    assert len(calls) == 3
+
+
+def test_import_retries_a_locked_batch(tmp_path, cli, monkeypatch):
+    from kboard.task.service import TaskService
+
+    import_batch = TaskService.import_batch
+    calls = []
+
+    def flaky(self, batch):
+        calls.append(len(batch))
+        if len(calls) == 2:
+            raise _sqlite_error(sqlite3.SQLITE_BUSY)
+        return import_batch(self, batch)
+
+    monkeypatch.setattr(TaskService, 'import_batch', flaky)
+    cli('board', 'add', 'Board')
+    path = tmp_path / 'tasks.jsonl'
+    path.write_text(''.join(
+        f'{{"title": "t{i}", "board_id": {1 if i != 3 else 9}}}\n'
+        for i in range(5)))
+
+    result = cli('task', 'import', str(path), '--batch-size', '2')
+
+    assert calls == [2, 2, 2, 1]
+    assert 'Imported 4 task(s)' in result.output
+    assert 'Skipped 1 task(s)' in result.output
+
+
+def test_archive_retries_a_locked_batch(cli, monkeypatch):
+    from kboard.archive.service import ArchiveService
+
+    archive_batch = ArchiveService.archive_batch
+    calls = []
+
+    def flaky(self, *args):
+        calls.append(1)
+        if len(calls) == 1:
+            raise _sqlite_error(sqlite3.SQLITE_BUSY)
+        return archive_batch(self, *args)
+
+    monkeypatch.setattr(ArchiveService, 'archive_batch', flaky)
+    cli('board', 'add', 'Board')
+    for title in ('a', 'b', 'c'):
+        cli('task', 'add', title, '-b', '1')
+    cli('task', 'mv', '1-3', '--steps', '3')
+
+    result = cli('board', 'archive', '1', '--batch-size', '2')
+
+    assert len(calls) == 4
+    assert 'Archived 3 task(s)' in result.output
@@ -0,0 +1,32 @@
+"""Tests of the daily rollups of completed tasks kept by triggers.
+"""
+
+from sqlalchemy import text
+
+from kboard.enums import Priority, Status
+from kboard.models import Task
+
+
+def _rollups(container) -> tuple[int, int]:
+    return container.session.execute(text(
+        'SELECT (SELECT coalesce(sum(count), 0) FROM board_daily_throughput),'
+        " (SELECT coalesce(sum(count), 0) FROM board_daily_durations"
+        " WHERE metric = 'LEAD_TIME')"
+    )).one()
+
+
+def test_only_status_changes_are_rolled_up(container):
+    board = container.board_service.create_board('Board')
+    container.session.flush()
+    container.session.add(Task(title='Imported', priority=Priority.NORMAL,
+                               tag='', status=Status.COMPLETED, board=board))
+    task = container.task_service.add_task('Task', Priority.NORMAL, None,
+                                           None, board.id)
+    container.session.commit()
+
+    assert _rollups(container) == (0, 0)
+
+    container.task_service.move_tasks([(task.id, task.id)], 3)
+    container.session.commit()
+
+    assert _rollups(container) == (1, 1)
@@ -0,0 +1,34 @@
+"""Tests of the schema version check run before the first command.
+"""
+
+from sqlalchemy import create_engine, text
+
+from kboard import settings
+from kboard.db.migrations import MIGRATIONS
+
+
+def _create_old_data_file(version: int) -> None:
+    engine = create_engine(f'sqlite:///{settings.DB_PATH}')
+
+    with engine.begin() as conn:
+        conn.exec_driver_sql('BEGIN')
+        for migration in MIGRATIONS[:version]:
+            migration(conn)
+        conn.execute(text(f'PRAGMA user_version = {version}'))
+
+    engine.dispose()
+
+
+def test_outdated_data_file_asks_to_configure(tmp_path, monkeypatch, cli):
+    monkeypatch.setattr(settings, 'DB_PATH', tmp_path / 'old.db')
+    _create_old_data_file(3)
+
+    result = cli('board', 'ls')
+
+    assert result.exit_code == 1
+    assert 'kb configure' in result.output
+
+    cli('configure')
+    result = cli('board', 'ls')
+
+    assert result.exit_code == 0
@@ -0,0 +1,44 @@
+"""Tests of the due dates of tasks, which Typer parses as datetimes.
+"""
+
+from datetime import date, datetime
+
+from kboard.enums import Priority
+from kboard.task.renderer import TaskRenderer
+
+from .test_board_views import _render
+
+
+def test_added_task_renders_with_its_due_date(container):
+    board = container.board_service.create_board('Board')
+    container.session.flush()
+    task = container.task_service.add_task('Task', Priority.NORMAL, None,
+                                           datetime(2020, 1, 1), board.id)
+    container.session.commit()
+
+    assert task.due_date == date(2020, 1, 1)
+    assert '2020-01-01' in _render(TaskRenderer.to_panel(task))
+    assert '2020-01-01' in _render(
+        container.display_service.get_ui_renderable(board))
+
+
+def test_edited_due_date_is_a_date(container):
+    task = container.task_service.add_task('Task', Priority.NORMAL, None,
+                                           None, None)
+    container.session.commit()
+
+    container.task_service.edit_tasks([(task.id, task.id)], None, None, None,
+                                      datetime(2020, 1, 1), None)
+    container.session.commit()
+
+    assert container.task_service.get_task(task.id).due_date == date(2020, 1,
+                                                                    1)
+
+
+def test_cli_adds_a_task_with_a_due_date_to_a_board(cli):
+    cli('board', 'add', 'Board')
+
+    result = cli('task', 'add', 'Task', '-b', '1', '-d', '2020-01-01')
+
+    assert result.exit_code == 0
+    assert 'Task' in result.output
@@ -0,0 +1,85 @@
+"""Tests of the criteria filtering the displayed tasks.
+"""
+
+from datetime import date, datetime
+
+from kboard.enums import Priority, Status
+from kboard.task.filter import TaskFilter
+
+
+def _board_with_tasks(container) -> int:
+    board = container.board_service.create_board('Board')
+    container.session.flush()
+
+    for title, priority, tag, due_date in (
+        ('Low', Priority.LOW, 'ops', date(2020, 1, 1)),
+        ('Normal', Priority.NORMAL, 'ops', date(2020, 1, 15)),
+        ('High', Priority.HIGH, 'dev', date(2020, 2, 1)),
+        ('Undated', Priority.HIGH, None, None),
+    ):
+        container.task_service.add_task(title, priority, tag, due_date,
+                                        board.id)
+
+    container.session.commit()
+
+    return board.id
+
+
+def _titles(container, board_id: int, criteria: TaskFilter) -> list[str]:
+    tasks, _ = container.task_service.get_page([board_id], None, 0, criteria)
+
+    return [task.title for task in tasks]
+
+
+def test_empty_filter_matches_every_task(container):
+    board_id = _board_with_tasks(container)
+
+    assert not TaskFilter()
+    assert len(_titles(container, board_id, TaskFilter())) == 4
+
+
+def test_every_criterion_must_match(container):
+    board_id = _board_with_tasks(container)
+
+    assert _titles(container, board_id, TaskFilter(tag='ops')) == [
+        'Low', 'Normal']
+    assert _titles(container, board_id, TaskFilter(
+        priorities=[Priority.LOW, Priority.HIGH])) == ['Low', 'High',
+                                                       'Undated']
+    assert _titles(container, board_id, TaskFilter(
+        tag='ops', priorities=[Priority.HIGH])) == []
+
+
+def test_due_dates_are_inclusive_and_skip_undated_tasks(container):
+    board_id = _board_with_tasks(container)
+
+    assert _titles(container, board_id, TaskFilter(
+        due_after=date(2020, 1, 15))) == ['Normal', 'High']
+    assert _titles(container, board_id, TaskFilter(
+        due_after=datetime(2020, 1, 1), due_before=datetime(2020, 1, 15))
+    ) == ['Low', 'Normal']
+
+
+def test_status_filter_and_remaining_counts(container):
+    board_id = _board_with_tasks(container)
+    container.task_service.move_tasks([(1, 2)], 1)
+    container.session.commit()
+
+    criteria = TaskFilter(statuses=[Status.IN_PROGRESS])
+    tasks, remaining = container.task_service.get_page([board_id], 1, 0,
+                                                       criteria)
+
+    assert [task.title for task in tasks] == ['Low']
+    assert remaining == {(board_id, Status.IN_PROGRESS): 1}
+
+
+def test_cli_filters_the_board_by_tag(cli):
+    cli('board', 'add', 'Board')
+    cli('task', 'add', 'Deploy', '-b', '1', '-t', 'ops')
+    cli('task', 'add', 'Test', '-b', '1', '-t', 'dev')
+
+    result = cli('board', 'show', '1', '--tag', 'ops')
+
+    assert result.exit_code == 0
+    assert 'Deploy' in result.output
+    assert 'Test' not in result.output
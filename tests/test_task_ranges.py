@@ -0,0 +1,98 @@
+"""Tests of the set-based task operations on ID ranges.
+"""
+
+import pytest
+
+from kboard.enums import Priority, Status
+from kboard.exceptions import TaskNotFoundError
+from kboard.models import Task
+from kboard.task.filter import merge_ranges
+
+
+@pytest.fixture
+def tasks(container) -> list[Task]:
+    """Five tasks on one board, numbered 1 to 5."""
+    board = container.board_service.create_board('Board')
+    container.session.flush()
+    tasks = [container.task_service.add_task(f'Task {i}', Priority.NORMAL,
+                                             None, None, board.id)
+             for i in range(1, 6)]
+    container.session.commit()
+
+    return tasks
+
+
+def _statuses(container) -> dict[int, Status]:
+    return {row.id: row.status
+            for row in container.task_service.get_rows([(1, 10)])}
+
+
+def test_merge_ranges_merges_overlaps_only():
+    assert merge_ranges([(7, 9), (1, 3), (2, 5), (6, 6), (4, 4)]) == [
+        (1, 5), (6, 6), (7, 9)]
+
+
+def test_move_range_with_gaps(container, tasks):
+    container.task_service.delete_tasks([(3, 3)])
+    container.task_service.move_tasks([(1, 5)], 1)
+    container.session.commit()
+
+    assert _statuses(container) == {1: Status.IN_PROGRESS,
+                                    2: Status.IN_PROGRESS,
+                                    4: Status.IN_PROGRESS,
+                                    5: Status.IN_PROGRESS}
+
+
+def test_huge_range_uses_a_single_predicate(container, tasks, statements):
+    statements.clear()
+    container.task_service.edit_tasks([(1, 300_000)], 'Renamed', None, None,
+                                      None, None)
+    container.session.commit()
+
+    update = next(s for s in statements if s.startswith('UPDATE'))
+    assert 'BETWEEN' in update and update.count('?') < 10
+    assert {row.title for row in container.task_service.get_rows(
+        [(1, 5)])} == {'Renamed'}
+
+
+def test_missing_single_id_fails(container, tasks):
+    with pytest.raises(TaskNotFoundError):
+        container.task_service.edit_tasks([(1, 1), (9, 9)], 'Renamed', None,
+                                          None, None, None)
+
+
+def test_range_without_tasks_fails(container, tasks):
+    with pytest.raises(TaskNotFoundError):
+        container.task_service.delete_tasks([(1, 2), (20, 30)])
+
+    container.session.rollback()
+    assert len(_statuses(container)) == 5
+
+
+def test_move_out_of_bounds_fails(container, tasks):
+    container.task_service.move_tasks([(1, 1)], 3)
+    container.session.commit()
+
+    with pytest.raises(ValueError):
+        container.task_service.move_tasks([(1, 2)], 1)
+
+
+def test_cli_moves_a_range_larger_than_the_variable_limit(cli):
+    cli('board', 'add', 'Board')
+    for title in ('a', 'b', 'c'):
+        cli('task', 'add', title, '-b', '1')
+    cli('task', 'rm', '2', '--force')
+
+    result = cli('task', 'mv', '1-300000', '--format', 'ndjson')
+
+    assert result.exit_code == 0
+    assert result.output.count('"IN_PROGRESS"') == 2
+
+
+def test_cli_rejects_missing_single_id(cli):
+    cli('task', 'add', 'a')
+
+    result = cli('task', 'rm', '1', '2', '--force')
+
+    assert 'Task not found.' in result.output
+    assert cli('task', 'edit', '1', '--format', 'json').exit_code == 0
@@ -0,0 +1,30 @@
+"""Tests of the memoised task panels.
+"""
+
+from io import StringIO
+
+from rich.console import Console
+
+from kboard.enums import Priority, Status
+from kboard.models import Task
+from kboard.task.renderer import TaskRenderer
+
+
+class _AsciiFile(StringIO):
+    encoding = 'ascii'
+
+
+def _print(panel, file: StringIO) -> str:
+    Console(file=file, width=20).print(panel)
+
+    return file.getvalue()
+
+
+def test_panel_layout_depends_on_the_console_encoding():
+    task = Task(id=1, title='Task', priority=Priority.NORMAL, tag='',
+                status=Status.TO_DO)
+    panel = TaskRenderer.to_panel(task)
+
+    assert '╭' in _print(panel, StringIO())
+    assert _print(panel, _AsciiFile()).startswith('+')
+    assert '╭' in _print(panel, StringIO())
@@ -0,0 +1,80 @@
+"""Tests of the full-text search of tasks, backed by an FTS5 index.
+"""
+
+from kboard.enums import Priority
+
+
+def _add(container, title: str, tag: str | None = None) -> int:
+    task = container.task_service.add_task(title, Priority.NORMAL, tag, None,
+                                           None)
+    container.session.commit()
+
+    return task.id
+
+
+def _search(container, query: str, limit: int = 50) -> list[str]:
+    return [task.title
+            for task in container.task_service.search_tasks(query, limit)]
+
+
+def test_every_word_is_matched_as_a_prefix(container):
+    _add(container, 'Deployment script', 'ops')
+    _add(container, 'Deploy the docs', 'docs')
+    _add(container, 'Write tests')
+
+    assert sorted(_search(container, 'deploy')) == ['Deploy the docs',
+                                                    'Deployment script']
+    assert _search(container, 'deploy scr') == ['Deployment script']
+    assert _search(container, 'docs tests') == []
+
+
+def test_tags_are_searched(container):
+    _add(container, 'Task', 'backend')
+    _add(container, 'Other task', 'frontend')
+
+    assert _search(container, 'back') == ['Task']
+
+
+def test_query_syntax_is_searched_literally(container):
+    _add(container, 'Fix "quoted" NOT working (again)')
+
+    assert _search(container, '"quoted" NOT (again') == [
+        'Fix "quoted" NOT working (again)']
+    assert _search(container, 'title:fix') == []
+    assert _search(container, '   ') == []
+
+
+def test_index_follows_edits_and_deletions(container):
+    task_id = _add(container, 'Old title')
+
+    container.task_service.edit_tasks([(task_id, task_id)], 'New title',
+                                      None, None, None, None)
+    container.session.commit()
+
+    assert _search(container, 'old') == []
+    assert _search(container, 'new') == ['New title']
+
+    container.task_service.delete_tasks([(task_id, task_id)])
+    container.session.commit()
+
+    assert _search(container, 'new') == []
+
+
+def test_limit_keeps_the_best_matches(container):
+    _add(container, 'Release notes for the release of the release')
+    _add(container, 'Release')
+    _add(container, 'Prepare the release of the website and the docs')
+
+    assert len(_search(container, 'release', limit=2)) == 2
+    assert _search(container, 'release', limit=1) == ['Release']
+
+
+def test_cli_shows_the_matching_tasks(cli):
+    cli('task', 'add', 'Deploy')
+    cli('task', 'add', 'Test')
+
+    result = cli('task', 'search', 'deploy')
+
+    assert result.exit_code == 0
+    assert 'Deploy' in result.output
+    assert 'Test' not in result.output
@@ -0,0 +1,61 @@
+"""Tests of the board view spanning several workspaces.
+"""
+
+import json
+
+import pytest
+
+
+@pytest.mark.parametrize('value', [',', ' , ,', ''])
+def test_empty_workspace_list_is_rejected(cli, value):
+    result = cli('board', 'all', '--workspaces', value)
+
+    assert result.exit_code == 2
+    assert 'At least one workspace name is required.' in result.output
+
+
+def test_empty_names_are_ignored(cli):
+    cli('board', 'add', 'Board')
+
+    result = cli('board', 'all', '--workspaces', ',default,')
+
+    assert result.exit_code == 0
+    assert 'Board' in result.output
+
+
+def test_boards_of_two_workspaces_are_read_together(cli):
+    cli('board', 'add', 'Main')
+    cli('task', 'add', 'main task', '-b', '1')
+    cli('-w', 'team', 'configure')
+    cli('-w', 'team', 'board', 'add', 'Team')
+    cli('-w', 'team', 'task', 'add', 'team task', '-b', '1')
+
+    result = cli('board', 'all', '--workspaces', 'default,team',
+                 '--format', 'json')
+    boards = json.loads(result.output)
+
+    assert [(b['workspace'], b['name']) for b in boards] == [
+        ('default', 'Main'), ('team', 'Team')]
+    assert [t['title'] for b in boards for t in b['tasks']] == [
+        'main task', 'team task']
+
+
+def test_unconfigured_workspace_leaves_no_data_file(tmp_path, cli):
+    result = cli('-w', 'ghost', 'board', 'ls')
+
+    assert result.exit_code == 1
+    assert 'kb configure' in result.output
+    assert not (tmp_path / '.kboard-ghost.db').exists()
+
+    result = cli('board', 'all', '--workspaces', 'ghost')
+
+    assert 'Workspace "ghost" not found.' in result.output
+    assert not (tmp_path / '.kboard-ghost.db').exists()
+
+
+def test_outdated_workspace_asks_to_configure(tmp_path, cli):
+    (tmp_path / '.kboard-old.db').touch()
+
+    result = cli('board', 'all', '--workspaces', 'default,old')
+
+    assert 'run "kb -w old configure"' in result.output